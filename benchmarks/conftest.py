@@ -0,0 +1,113 @@
+import pytest
+
+from benchmarks.dataset import SIZES, seed_dataset
+from benchmarks.harness import (
+    DEFAULT_MIN_DELTA_MS,
+    DEFAULT_THRESHOLD,
+    baseline_path,
+    find_regressions,
+    load_baselines,
+    measure,
+    save_baselines,
+)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmarks")
+    group.addoption(
+        "--bench-size",
+        choices=list(SIZES),
+        default="1k",
+        help="Books (and borrowings) in the seeded dataset.",
+    )
+    group.addoption(
+        "--bench-seed", type=int, default=0, help="Seed of the dataset generator."
+    )
+    group.addoption(
+        "--bench-rounds", type=int, default=30, help="Timed calls per benchmark."
+    )
+    group.addoption(
+        "--bench-threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed slowdown against the baseline (0.25 is 25%%).",
+    )
+    group.addoption(
+        "--bench-min-delta-ms",
+        type=float,
+        default=DEFAULT_MIN_DELTA_MS,
+        help="Median slowdown in milliseconds that is always tolerated.",
+    )
+    group.addoption(
+        "--bench-save",
+        action="store_true",
+        help="Write the results as the new baseline instead of comparing.",
+    )
+
+
+@pytest.fixture(scope="session")
+def bench_dataset(request, django_db_blocker):
+    """Seed the dataset once per session; benchmarks roll their writes back."""
+    request.getfixturevalue("django_db_setup")
+    options = request.config.option
+    with django_db_blocker.unblock():
+        return seed_dataset(SIZES[options.bench_size], seed=options.bench_seed)
+
+
+@pytest.fixture
+def benchmark(request):
+    """
+    Measure a function and check it against the saved baseline.
+
+    Call as `benchmark(func, arguments=None)`; the benchmark is named after
+    the test. Fails the test when the result regresses past --bench-threshold.
+    """
+    config = request.config
+    options = config.option
+    baselines = load_baselines(baseline_path(options.bench_size))
+
+    def run(func, arguments=None):
+        result = measure(
+            request.node.name, func, options.bench_rounds, arguments=arguments
+        )
+        config._bench_results.append(result)
+        baseline = baselines.get(result.name)
+        if baseline is not None and not options.bench_save:
+            regressions = find_regressions(
+                result,
+                baseline,
+                options.bench_threshold,
+                options.bench_min_delta_ms,
+            )
+            if regressions:
+                pytest.fail("\n".join(regressions))
+        return result
+
+    return run
+
+
+def pytest_configure(config):
+    config._bench_results = []
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if config.option.bench_save and config._bench_results:
+        size_name = config.option.bench_size
+        save_baselines(baseline_path(size_name), size_name, config._bench_results)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    results = config._bench_results
+    if not results:
+        return
+    terminalreporter.section(f"benchmarks ({config.option.bench_size})")
+    terminalreporter.write_line(
+        f"{'name':<40} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+        f"{'queries':>8} {'peak KiB':>9}"
+    )
+    for result in results:
+        terminalreporter.write_line(
+            f"{result.name:<40} {result.p50_ms:>9.3f} {result.p95_ms:>9.3f} "
+            f"{result.p99_ms:>9.3f} {result.queries:>8} {result.peak_memory_kb:>9.1f}"
+        )
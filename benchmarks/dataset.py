@@ -0,0 +1,198 @@
+import random
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Iterator, List, Tuple
+
+from django.db import transaction
+
+from book.models.author import Author
+from book.models.book import Book
+from book.models.book_inventory import BookInventory
+from book.models.genre import Genre
+from book.models.publisher import Publisher
+from member.models.borrowing_history import BorrowingHistory
+from member.models.member import Member
+
+# Dataset sizes selectable with --bench-size: number of books, and of borrowings
+SIZES = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+
+# Rows per INSERT while seeding
+SEED_BATCH_SIZE = 5_000
+
+# Copies of every seeded book; active borrowings never exceed this per book
+COPIES_PER_BOOK = 3
+
+# Ids kept for the benchmarks to pick from, instead of every seeded id
+SAMPLE_SIZE = 500
+
+
+@dataclass
+class BenchmarkDataset:
+    """Ids of seeded rows that benchmarks use as inputs."""
+
+    size: int
+    author_ids: List[uuid.UUID] = field(default_factory=list)
+    publisher_ids: List[uuid.UUID] = field(default_factory=list)
+    genre_ids: List[uuid.UUID] = field(default_factory=list)
+    book_ids: List[uuid.UUID] = field(default_factory=list)
+    # Members with active borrowings, for the member views
+    borrower_ids: List[uuid.UUID] = field(default_factory=list)
+    # Members without active borrowings and books with a copy left, so every
+    # (idle_member_ids[i], available_book_ids[i]) pair can be borrowed
+    idle_member_ids: List[uuid.UUID] = field(default_factory=list)
+    available_book_ids: List[uuid.UUID] = field(default_factory=list)
+
+
+def seed_dataset(size: int, seed: int = 0) -> BenchmarkDataset:
+    """
+    Insert a reproducible library of `size` books and `size` borrowings.
+
+    Every value comes from a random.Random(seed), ids included, so the same
+    size and seed always produce the same rows. Authors, publishers and
+    members scale with the book count; one borrowing in ten is still active,
+    at most one per member and COPIES_PER_BOOK per book.
+
+    Args:
+        size: Number of books, and of borrowings
+        seed: Seed of the random generator
+
+    Returns:
+        Samples of the seeded ids
+    """
+    rng = random.Random(seed)
+    dataset = BenchmarkDataset(size=size)
+
+    def new_id() -> uuid.UUID:
+        return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+    with transaction.atomic():
+        author_ids = [new_id() for _ in range(max(size // 20, 10))]
+        Author.objects.bulk_create(
+            (
+                Author(
+                    id=author_id,
+                    name=f"Author {index}",
+                    birth_date=date(1900, 1, 1) + timedelta(days=rng.randrange(36500)),
+                )
+                for index, author_id in enumerate(author_ids)
+            ),
+            batch_size=SEED_BATCH_SIZE,
+        )
+        publisher_ids = [new_id() for _ in range(max(size // 1000, 5))]
+        Publisher.objects.bulk_create(
+            Publisher(
+                id=publisher_id,
+                name=f"Publisher {index}",
+                website=f"https://publisher{index}.example.com",
+            )
+            for index, publisher_id in enumerate(publisher_ids)
+        )
+        genre_ids = [new_id() for _ in range(20)]
+        Genre.objects.bulk_create(
+            Genre(id=genre_id, name=f"Genre {index}")
+            for index, genre_id in enumerate(genre_ids)
+        )
+
+        book_ids = [new_id() for _ in range(size)]
+        for batch in _batches(list(enumerate(book_ids))):
+            Book.objects.bulk_create(
+                Book(
+                    id=book_id,
+                    title=f"Book {index}",
+                    description=f"Seeded benchmark book number {index}",
+                    published_date=date(1900, 1, 1)
+                    + timedelta(days=rng.randrange(45000)),
+                    isbn=f"{9780000000000 + index}",
+                    author_id=rng.choice(author_ids),
+                    publisher_id=rng.choice(publisher_ids),
+                )
+                for index, book_id in batch
+            )
+            Genre.books.through.objects.bulk_create(
+                Genre.books.through(book_id=book_id, genre_id=rng.choice(genre_ids))
+                for _, book_id in batch
+            )
+
+        member_ids = [new_id() for _ in range(max(size // 5, 50))]
+        for batch in _batches(list(enumerate(member_ids))):
+            Member.objects.bulk_create(
+                Member(
+                    id=member_id,
+                    first_name=f"Member{index}",
+                    last_name="Bench",
+                    birth_date=date(1950, 1, 1) + timedelta(days=rng.randrange(20000)),
+                )
+                for index, member_id in batch
+            )
+
+        active_per_book = [0] * size
+        active_members = set()
+        today = date.today()
+        borrowings: List[BorrowingHistory] = []
+        for index in range(size):
+            book_index = rng.randrange(size)
+            member_id = rng.choice(member_ids)
+            borrowing_date = today - timedelta(days=rng.randrange(1, 730))
+            active = (
+                index % 10 == 0
+                and member_id not in active_members
+                and active_per_book[book_index] < COPIES_PER_BOOK
+            )
+            if active:
+                active_members.add(member_id)
+                active_per_book[book_index] += 1
+            borrowings.append(
+                BorrowingHistory(
+                    id=new_id(),
+                    book_id=book_ids[book_index],
+                    member_id=member_id,
+                    borrowing_date=borrowing_date,
+                    due_date=borrowing_date + timedelta(days=14),
+                    returning_date=None
+                    if active
+                    else borrowing_date + timedelta(days=rng.randrange(1, 30)),
+                )
+            )
+            if len(borrowings) == SEED_BATCH_SIZE:
+                BorrowingHistory.objects.bulk_create(borrowings)
+                borrowings = []
+        BorrowingHistory.objects.bulk_create(borrowings)
+
+        for batch in _batches(list(zip(book_ids, active_per_book))):
+            BookInventory.objects.bulk_create(
+                BookInventory(
+                    book_id=book_id,
+                    total_copies=COPIES_PER_BOOK,
+                    available_copies=COPIES_PER_BOOK - active,
+                )
+                for book_id, active in batch
+            )
+
+    dataset.author_ids = rng.sample(author_ids, min(SAMPLE_SIZE, len(author_ids)))
+    dataset.publisher_ids = publisher_ids[:SAMPLE_SIZE]
+    dataset.genre_ids = genre_ids
+    dataset.book_ids = rng.sample(book_ids, min(SAMPLE_SIZE, size))
+    dataset.borrower_ids = rng.sample(
+        sorted(active_members), min(SAMPLE_SIZE, len(active_members))
+    )
+    idle_members = [
+        member_id for member_id in member_ids if member_id not in active_members
+    ]
+    dataset.idle_member_ids = rng.sample(
+        idle_members, min(SAMPLE_SIZE, len(idle_members))
+    )
+    dataset.available_book_ids = rng.sample(
+        [
+            book_id
+            for book_id, active in zip(book_ids, active_per_book)
+            if active < COPIES_PER_BOOK
+        ],
+        len(dataset.idle_member_ids),
+    )
+    return dataset
+
+
+def _batches(items: list) -> Iterator[List[Tuple]]:
+    for start in range(0, len(items), SEED_BATCH_SIZE):
+        yield items[start : start + SEED_BATCH_SIZE]
@@ -0,0 +1,172 @@
+import json
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from django.db import connection
+
+# Default allowed slowdown (and memory growth) against the baseline, as a ratio
+DEFAULT_THRESHOLD = 0.25
+
+# Slowdowns smaller than this never fail, whatever the ratio: a millisecond
+# benchmark jitters by more than the threshold on a busy machine
+DEFAULT_MIN_DELTA_MS = 1.0
+
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+
+
+@dataclass
+class BenchmarkResult:
+    """Latency percentiles, query count and peak memory of one benchmark."""
+
+    name: str
+    rounds: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    queries: int
+    peak_memory_kb: float
+
+
+def measure(
+    name: str,
+    func: Callable[..., Any],
+    rounds: int,
+    arguments: Optional[Callable[[int], tuple]] = None,
+    warmup: int = 2,
+) -> BenchmarkResult:
+    """
+    Time `rounds` calls of a function, after `warmup` untimed ones.
+
+    Arguments for each call are built before its clock starts. Latency and
+    query counts come from the timed calls; peak memory from one more call
+    run under tracemalloc, so tracing does not slow the timed ones.
+
+    Args:
+        name: Name of the benchmark
+        func: The code under test
+        rounds: Number of timed calls
+        arguments: Builds the positional arguments of call number i
+        warmup: Number of calls made before timing starts
+
+    Returns:
+        The measurements
+    """
+    if arguments is None:
+
+        def arguments(_index):
+            return ()
+
+    call = 0
+    for _ in range(warmup):
+        func(*arguments(call))
+        call += 1
+
+    queries = 0
+
+    def count_query(execute, sql, params, many, context):
+        nonlocal queries
+        queries += 1
+        return execute(sql, params, many, context)
+
+    durations: List[float] = []
+    max_queries = 0
+    with connection.execute_wrapper(count_query):
+        for _ in range(rounds):
+            args = arguments(call)
+            queries = 0
+            started = time.perf_counter()
+            func(*args)
+            durations.append(time.perf_counter() - started)
+            max_queries = max(max_queries, queries)
+            call += 1
+
+    args = arguments(call)
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    durations.sort()
+    return BenchmarkResult(
+        name=name,
+        rounds=rounds,
+        p50_ms=round(_percentile(durations, 50) * 1000, 3),
+        p95_ms=round(_percentile(durations, 95) * 1000, 3),
+        p99_ms=round(_percentile(durations, 99) * 1000, 3),
+        mean_ms=round(sum(durations) / len(durations) * 1000, 3),
+        queries=max_queries,
+        peak_memory_kb=round(peak / 1024, 1),
+    )
+
+
+def find_regressions(
+    result: BenchmarkResult,
+    baseline: Dict[str, Any],
+    threshold: float,
+    min_delta_ms: float = DEFAULT_MIN_DELTA_MS,
+) -> List[str]:
+    """
+    Compare a result with its baseline.
+
+    The median and peak memory may grow by `threshold` (0.25 is 25%), and
+    the median always by `min_delta_ms`; the query count may not grow at
+    all, as it does not depend on the machine.
+    p95 and p99 are reported but not compared: with a few dozen rounds they
+    are too noisy to fail a build on.
+
+    Returns:
+        One message per regressed measurement, empty when there is none
+    """
+    regressions = []
+    for metric in ("p50_ms", "peak_memory_kb"):
+        limit = baseline[metric] * (1 + threshold)
+        if metric == "p50_ms":
+            limit = max(limit, baseline[metric] + min_delta_ms)
+        if getattr(result, metric) > limit:
+            regressions.append(
+                f"{result.name}: {metric} {getattr(result, metric)} is over "
+                f"{limit:.3f} (baseline {baseline[metric]})"
+            )
+    if result.queries > baseline["queries"]:
+        regressions.append(
+            f"{result.name}: {result.queries} queries, baseline {baseline['queries']}"
+        )
+    return regressions
+
+
+def baseline_path(size_name: str, directory: Path = BASELINE_DIR) -> Path:
+    return directory / f"{size_name}.json"
+
+
+def load_baselines(path: Path) -> Dict[str, Dict[str, Any]]:
+    """Read saved results by benchmark name, or nothing if none were saved."""
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())["results"]
+
+
+def save_baselines(path: Path, size_name: str, results: List[BenchmarkResult]):
+    """Write results into a baseline file, keeping entries of other benchmarks."""
+    baselines = load_baselines(path)
+    for result in results:
+        baselines[result.name] = asdict(result)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(
+            {"size": size_name, "results": dict(sorted(baselines.items()))},
+            indent=2,
+        )
+        + "\n"
+    )
+
+
+def _percentile(sorted_values: List[float], percent: int) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    rank = max(1, -(-len(sorted_values) * percent // 100))
+    return sorted_values[rank - 1]
@@ -0,0 +1,67 @@
+from datetime import date
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from librarymanagementsystem.container import container
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("bench_dataset")
+def test_get_all_books(benchmark):
+    get_book_use_case = container.book_container.get_book_use_case()
+
+    benchmark(get_book_use_case.get_all_books)
+
+
+@pytest.mark.django_db
+def test_get_book_by_id(bench_dataset, benchmark):
+    get_book_use_case = container.book_container.get_book_use_case()
+    book_ids = [str(book_id) for book_id in bench_dataset.book_ids]
+
+    benchmark(
+        get_book_use_case.get_book_by_id,
+        lambda index: (book_ids[index % len(book_ids)],),
+    )
+
+
+@pytest.mark.django_db
+def test_create_book(bench_dataset, benchmark):
+    create_book_use_case = container.book_container.create_book_use_case()
+
+    def book_data(index):
+        return (
+            {
+                "title": f"Benchmark Book {index}",
+                "description": "Created by the create book benchmark",
+                "published_date": date(2020, 1, 1),
+                # Seeded ISBNs start with 978
+                "isbn": f"{9790000000000 + index}",
+                "author_id": bench_dataset.author_ids[0],
+                "publisher_id": bench_dataset.publisher_ids[0],
+                "genre_id": bench_dataset.genre_ids[0],
+            },
+        )
+
+    benchmark(create_book_use_case.execute, book_data)
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("bench_dataset")
+def test_book_list_view(benchmark):
+    client = APIClient()
+    url = reverse("book_create_and_get")
+
+    benchmark(client.get, lambda _index: (url,))
+
+
+@pytest.mark.django_db
+def test_book_detail_view(bench_dataset, benchmark):
+    client = APIClient()
+    urls = [
+        reverse("book_get_by_id", kwargs={"book_id": book_id})
+        for book_id in bench_dataset.book_ids
+    ]
+
+    benchmark(client.get, lambda index: (urls[index % len(urls)],))
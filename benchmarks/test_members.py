@@ -0,0 +1,40 @@
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from librarymanagementsystem.container import container
+
+
+@pytest.mark.django_db
+def test_borrow_book(bench_dataset, benchmark):
+    borrow_book_use_case = container.member_container.borrow_book_use_case()
+    # Each call borrows a different available book for a different idle member
+    pairs = list(zip(bench_dataset.idle_member_ids, bench_dataset.available_book_ids))
+
+    def borrowing_data(index):
+        member_id, book_id = pairs[index]
+        return ({"member_id": str(member_id), "book_id": str(book_id)},)
+
+    benchmark(borrow_book_use_case.execute, borrowing_data)
+
+
+@pytest.mark.django_db
+def test_member_borrowing_view(bench_dataset, benchmark):
+    client = APIClient()
+    urls = [
+        reverse("member_borrowing", kwargs={"member_id": member_id})
+        for member_id in bench_dataset.borrower_ids
+    ]
+
+    benchmark(client.get, lambda index: (urls[index % len(urls)],))
+
+
+@pytest.mark.django_db
+def test_member_active_books_view(bench_dataset, benchmark):
+    client = APIClient()
+    urls = [
+        reverse("member_active_books", kwargs={"member_id": member_id})
+        for member_id in bench_dataset.borrower_ids
+    ]
+
+    benchmark(client.get, lambda index: (urls[index % len(urls)],))
@@ -1,7 +1,15 @@
 from dependency_injector import containers, providers
+from django.db import connection
 
 from book.repositories.author_repository import AuthorRepository
+from book.repositories.book_autocomplete_repository import BookAutocompleteRepository
+from book.repositories.book_cache_repository import BookCacheRepository
+from book.repositories.book_inventory_repository import BookInventoryRepository
 from book.repositories.book_repository import BookRepository
+from book.repositories.book_search_repository import (
+    PostgresBookSearchRepository,
+    SqliteBookSearchRepository,
+)
 from book.repositories.genre_repository import GenreRepository
 from book.repositories.publisher_repository import PublisherRepository
 from book.services.author_crud_service import AuthorCRUDService
@@ -10,32 +18,85 @@ from book.services.genre_service import GenreService
 from book.services.publisher_crud_service import PublisherCRUDService
 from book.use_cases.create_book_use_case import CreateBookUseCase
 from book.use_cases.get_book_use_case import GetBookUseCase
+from librarymanagementsystem.metrics import instrumented
 
 
 class BookContainer(containers.DeclarativeContainer):
     """Book app container."""
 
     # Repositories
-    author_repository = providers.Singleton(AuthorRepository)
-    book_repository = providers.Singleton(BookRepository)
-    genre_repository = providers.Singleton(GenreRepository)
-    publisher_repository = providers.Singleton(PublisherRepository)
+    book_cache_repository = instrumented(
+        "repository", providers.Singleton(BookCacheRepository)
+    )
+    book_autocomplete_repository = instrumented(
+        "repository", providers.Singleton(BookAutocompleteRepository)
+    )
+    author_repository = instrumented(
+        "repository",
+        providers.Singleton(
+            AuthorRepository,
+            book_cache=book_cache_repository,
+            book_autocomplete=book_autocomplete_repository,
+        ),
+    )
+    book_repository = instrumented(
+        "repository",
+        providers.Singleton(BookRepository, book_cache=book_cache_repository),
+    )
+    genre_repository = instrumented(
+        "repository",
+        providers.Singleton(GenreRepository, book_cache=book_cache_repository),
+    )
+    publisher_repository = instrumented(
+        "repository",
+        providers.Singleton(PublisherRepository, book_cache=book_cache_repository),
+    )
+    book_inventory_repository = instrumented(
+        "repository",
+        providers.Singleton(BookInventoryRepository, book_cache=book_cache_repository),
+    )
+    # Search SQL is backend specific; pick the implementation for the database
+    book_search_repository = providers.Selector(
+        providers.Callable(lambda: connection.vendor),
+        postgresql=instrumented(
+            "repository",
+            providers.Singleton(
+                PostgresBookSearchRepository, book_repository=book_repository
+            ),
+        ),
+        sqlite=instrumented(
+            "repository",
+            providers.Singleton(
+                SqliteBookSearchRepository, book_repository=book_repository
+            ),
+        ),
+    )
 
     # Use Cases
-    create_book_use_case = providers.Singleton(
-        CreateBookUseCase,
-        book_repository=book_repository,
-        author_repository=author_repository,
-        publisher_repository=publisher_repository,
-        genre_repository=genre_repository,
+    create_book_use_case = instrumented(
+        "use_case",
+        providers.Singleton(
+            CreateBookUseCase,
+            book_repository=book_repository,
+            author_repository=author_repository,
+            publisher_repository=publisher_repository,
+            genre_repository=genre_repository,
+            book_autocomplete=book_autocomplete_repository,
+        ),
     )
 
-    get_book_use_case = providers.Singleton(
-        GetBookUseCase,
-        book_repository=book_repository,
-        author_repository=author_repository,
-        publisher_repository=publisher_repository,
-        genre_repository=genre_repository,
+    get_book_use_case = instrumented(
+        "use_case",
+        providers.Singleton(
+            GetBookUseCase,
+            book_repository=book_repository,
+            author_repository=author_repository,
+            publisher_repository=publisher_repository,
+            genre_repository=genre_repository,
+            book_search_repository=book_search_repository,
+            book_autocomplete=book_autocomplete_repository,
+            book_cache=book_cache_repository,
+        ),
     )
 
     # Services
@@ -22,6 +22,19 @@ class BookEntity:
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
     genre: Optional[GenreEntity] = None
+    genres: List[GenreEntity] = field(default_factory=list)
+    total_copies: int = 1
+    available_copies: int = 1
+
+    # Age in years from which a book counts as a classic
+    classic_age_years = 50
+
+    def __post_init__(self):
+        """Keep the primary genre and the full genre list consistent."""
+        if self.genre is not None and not self.genres:
+            self.genres = [self.genre]
+        elif self.genre is None and self.genres:
+            self.genre = self.genres[0]
 
     @classmethod
     def create(
@@ -33,6 +46,7 @@ class BookEntity:
         author: Optional[AuthorEntity] = None,
         publisher: Optional[PublisherEntity] = None,
         genre: Optional[GenreEntity] = None,
+        total_copies: int = 1,
     ) -> "BookEntity":
         """Create a book entity from a dictionary."""
         instance = cls(
@@ -43,13 +57,22 @@ class BookEntity:
             author=author,
             publisher=publisher,
             genre=genre,
+            total_copies=total_copies,
+            available_copies=total_copies,
         )
         instance._validate_title()
         instance._validate_isbn()
+        instance.isbn = cls.normalize_isbn(instance.isbn)
         instance._validate_published_date()
         instance._validate_description()
+        instance._validate_copies()
         return instance
 
+    @staticmethod
+    def normalize_isbn(isbn: str) -> str:
+        """Strip hyphens and spaces so equal ISBNs compare and index equal."""
+        return isbn.replace("-", "").replace(" ", "")
+
     def _validate_title(self):
         """Validate book title business rules."""
         if not self.title or not self.title.strip():
@@ -74,7 +97,7 @@ class BookEntity:
             raise ValueError("ISBN cannot be empty")
 
         # Remove hyphens and spaces for validation
-        clean_isbn = self.isbn.replace("-", "").replace(" ", "")
+        clean_isbn = self.normalize_isbn(self.isbn)
 
         if not clean_isbn.isdigit():
             raise ValueError("ISBN must contain only digits")
@@ -102,15 +125,21 @@ class BookEntity:
         if len(self.description.strip()) < 10:
             raise ValueError("Book description must be at least 10 characters long")
 
+    def _validate_copies(self):
+        """Validate copy count business rules."""
+        if self.total_copies < 1:
+            raise ValueError("A book must have at least one copy")
+
+        if not 0 <= self.available_copies <= self.total_copies:
+            raise ValueError("Available copies must be between 0 and total copies")
+
     def add_genre(self, genre_id: uuid.UUID):
         """Add a genre to the book."""
         self.genre_id = genre_id
 
     def is_available_for_borrowing(self) -> bool:
         """Check if the book is available for borrowing."""
-        # This is a business rule - in a real system, you'd check borrowing status
-        # For now, we'll assume all books are available
-        return True
+        return self.available_copies > 0
 
     def get_age_in_years(self) -> int:
         """Calculate the age of the book in years."""
@@ -119,7 +148,7 @@ class BookEntity:
 
     def is_classic(self) -> bool:
         """Determine if the book is considered a classic (older than 50 years)."""
-        return self.get_age_in_years() >= 50
+        return self.get_age_in_years() >= self.classic_age_years
 
     def update_title(self, new_title: str):
         """Update the book title with validation."""
@@ -156,4 +185,8 @@ class BookEntity:
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
             "genre_id": str(self.genre.id) if self.genre else None,
+            "genre_ids": [str(genre.id) for genre in self.genres],
+            "total_copies": self.total_copies,
+            "available_copies": self.available_copies,
+            "is_available": self.is_available_for_borrowing(),
         }
@@ -1,7 +1,7 @@
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List
+from typing import Callable, List, Optional
 
 
 @dataclass
@@ -12,7 +12,15 @@ class GenreEntity:
     id: uuid.UUID = field(default_factory=uuid.uuid4)
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
-    book_ids: List[uuid.UUID] = field(default_factory=list)
+    # Membership is read on demand: None until loaded or counted
+    book_ids: Optional[List[uuid.UUID]] = None
+    book_count: Optional[int] = None
+    book_ids_loader: Optional[Callable[[], List[uuid.UUID]]] = field(
+        default=None, repr=False, compare=False
+    )
+    book_count_loader: Optional[Callable[[], int]] = field(
+        default=None, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """Validate business rules after initialization."""
@@ -69,19 +77,36 @@ class GenreEntity:
             # This is just a warning, not an error - allowing custom genres
             pass
 
+    def get_book_ids(self) -> List[uuid.UUID]:
+        """Get the IDs of the books in this genre, loading them on first use."""
+        if self.book_ids is None:
+            self.book_ids = self.book_ids_loader() if self.book_ids_loader else []
+        return self.book_ids
+
     def add_book(self, book_id: uuid.UUID):
         """Add a book to this genre."""
-        if book_id not in self.book_ids:
-            self.book_ids.append(book_id)
+        book_ids = self.get_book_ids()
+        if book_id not in book_ids:
+            book_ids.append(book_id)
 
     def remove_book(self, book_id: uuid.UUID):
         """Remove a book from this genre."""
-        if book_id in self.book_ids:
-            self.book_ids.remove(book_id)
+        book_ids = self.get_book_ids()
+        if book_id in book_ids:
+            book_ids.remove(book_id)
 
     def get_book_count(self) -> int:
-        """Get the number of books in this genre."""
-        return len(self.book_ids)
+        """
+        Get the number of books in this genre.
+
+        Uses the loaded book IDs if there are any, otherwise the known or
+        lazily counted total, so the IDs themselves are never loaded for it.
+        """
+        if self.book_ids is not None:
+            return len(self.book_ids)
+        if self.book_count is None:
+            self.book_count = self.book_count_loader() if self.book_count_loader else 0
+        return self.book_count
 
     def is_popular(self) -> bool:
         """Check if this genre is popular (has more than 10 books)."""
@@ -164,7 +189,7 @@ class GenreEntity:
             "name": self.name,
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
-            "book_ids": [str(book_id) for book_id in self.book_ids],
+            "book_ids": [str(book_id) for book_id in self.get_book_ids()],
             "book_count": self.get_book_count(),
             "is_popular": self.is_popular(),
             "is_niche": self.is_niche(),
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.23 on 2026-10-17 00:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("book", "0003_auto_20250323_1859"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="book",
+            index=models.Index(
+                fields=["created_at", "id"], name="book_created_at_id_idx"
+            ),
+        ),
+    ]
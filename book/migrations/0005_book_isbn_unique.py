@@ -0,0 +1,45 @@
+# Generated by Django 3.2.23 on 2026-10-17 00:45
+
+from collections import defaultdict
+
+from django.db import migrations, models
+
+
+def normalize_isbns(apps, schema_editor):  # noqa: ARG001
+    """Strip hyphens and spaces from stored ISBNs before making them unique."""
+    Book = apps.get_model("book", "Book")
+
+    books_by_isbn = defaultdict(list)
+    for book_id, isbn in Book.objects.values_list("id", "isbn").iterator():
+        books_by_isbn[isbn.replace("-", "").replace(" ", "")].append((book_id, isbn))
+
+    duplicates = {
+        isbn: [str(book_id) for book_id, _ in books]
+        for isbn, books in books_by_isbn.items()
+        if len(books) > 1
+    }
+    if duplicates:
+        raise RuntimeError(
+            "Cannot add a unique constraint on Book.isbn; these ISBNs are shared "
+            f"by several books and must be resolved first: {duplicates}"
+        )
+
+    for isbn, books in books_by_isbn.items():
+        for book_id, stored_isbn in books:
+            if stored_isbn != isbn:
+                Book.objects.filter(id=book_id).update(isbn=isbn)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("book", "0004_book_created_at_id_idx"),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_isbns, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="book",
+            name="isbn",
+            field=models.CharField(max_length=13, unique=True),
+        ),
+    ]
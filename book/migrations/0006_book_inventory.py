@@ -0,0 +1,75 @@
+# Generated by Django 3.2.23 on 2026-10-17 00:52
+
+from itertools import islice
+
+import django.db.models.deletion
+import django.db.models.expressions
+from django.db import migrations, models
+
+
+def create_inventories(apps, schema_editor):  # noqa: ARG001
+    """Give every existing book one copy, minus the copy currently on loan."""
+    Book = apps.get_model("book", "Book")
+    BookInventory = apps.get_model("book", "BookInventory")
+    BorrowingHistory = apps.get_model("member", "BorrowingHistory")
+
+    on_loan = dict(
+        BorrowingHistory.objects.filter(returning_date__isnull=True)
+        .values("book_id")
+        .annotate(total=models.Count("id"))
+        .values_list("book_id", "total")
+    )
+    inventories = (
+        BookInventory(
+            book_id=book_id,
+            total_copies=max(1, on_loan.get(book_id, 0)),
+            available_copies=max(0, 1 - on_loan.get(book_id, 0)),
+        )
+        for book_id in Book.objects.values_list("id", flat=True).iterator()
+    )
+    while True:
+        batch = list(islice(inventories, 1000))
+        if not batch:
+            break
+        BookInventory.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("book", "0005_book_isbn_unique"),
+        ("member", "0003_borrowing_one_active_per_member_book"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BookInventory",
+            fields=[
+                (
+                    "book",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="inventory",
+                        serialize=False,
+                        to="book.book",
+                    ),
+                ),
+                ("total_copies", models.PositiveIntegerField(default=1)),
+                ("available_copies", models.PositiveIntegerField(default=1)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="bookinventory",
+            constraint=models.CheckConstraint(
+                check=models.Q(
+                    (
+                        "available_copies__lte",
+                        django.db.models.expressions.F("total_copies"),
+                    )
+                ),
+                name="book_inventory_available_lte_total",
+            ),
+        ),
+        migrations.RunPython(create_inventories, migrations.RunPython.noop),
+    ]
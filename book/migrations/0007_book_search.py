@@ -0,0 +1,152 @@
+from django.db import migrations
+
+# The search index lives outside the Book model: triggers keep it in step
+# with book_book and book_author, so every write path (ORM, bulk_create, raw
+# SQL) is covered without application code.
+
+POSTGRESQL_FORWARD = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "ALTER TABLE book_book ADD COLUMN search_vector tsvector",
+    """
+    CREATE FUNCTION book_search_vector(title text, description text, author_name text)
+    RETURNS tsvector AS $$
+        SELECT setweight(to_tsvector('english', coalesce(title, '')), 'A')
+            || setweight(to_tsvector('english', coalesce(author_name, '')), 'B')
+            || setweight(to_tsvector('english', coalesce(description, '')), 'C')
+    $$ LANGUAGE sql IMMUTABLE
+    """,
+    """
+    CREATE FUNCTION book_search_vector_book_trigger() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector := book_search_vector(
+            NEW.title,
+            NEW.description,
+            (SELECT name FROM book_author WHERE id = NEW.author_id)
+        );
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER book_search_vector_book
+    BEFORE INSERT OR UPDATE OF title, description, author_id ON book_book
+    FOR EACH ROW EXECUTE FUNCTION book_search_vector_book_trigger()
+    """,
+    """
+    CREATE FUNCTION book_search_vector_author_trigger() RETURNS trigger AS $$
+    BEGIN
+        UPDATE book_book
+        SET search_vector = book_search_vector(title, description, NEW.name)
+        WHERE author_id = NEW.id;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER book_search_vector_author
+    AFTER UPDATE OF name ON book_author
+    FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name)
+    EXECUTE FUNCTION book_search_vector_author_trigger()
+    """,
+    """
+    UPDATE book_book AS b
+    SET search_vector = book_search_vector(b.title, b.description, a.name)
+    FROM book_author AS a
+    WHERE a.id = b.author_id
+    """,
+    "CREATE INDEX book_search_vector_idx ON book_book USING gin (search_vector)",
+    "CREATE INDEX book_title_trgm_idx ON book_book USING gin (title gin_trgm_ops)",
+]
+
+POSTGRESQL_REVERSE = [
+    "DROP INDEX IF EXISTS book_title_trgm_idx",
+    "DROP INDEX IF EXISTS book_search_vector_idx",
+    "DROP TRIGGER IF EXISTS book_search_vector_author ON book_author",
+    "DROP FUNCTION IF EXISTS book_search_vector_author_trigger()",
+    "DROP TRIGGER IF EXISTS book_search_vector_book ON book_book",
+    "DROP FUNCTION IF EXISTS book_search_vector_book_trigger()",
+    "DROP FUNCTION IF EXISTS book_search_vector(text, text, text)",
+    "ALTER TABLE book_book DROP COLUMN IF EXISTS search_vector",
+]
+
+SQLITE_INSERT_BOOK = """
+    INSERT INTO book_search (book_id, title, author_name, description)
+    SELECT NEW.id, NEW.title, name, NEW.description
+    FROM book_author WHERE id = NEW.author_id;
+"""
+
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE book_search USING fts5(
+        book_id UNINDEXED, title, author_name, description,
+        tokenize = 'porter unicode61'
+    )
+    """,
+    f"""
+    CREATE TRIGGER book_search_book_insert AFTER INSERT ON book_book
+    BEGIN {SQLITE_INSERT_BOOK} END
+    """,
+    f"""
+    CREATE TRIGGER book_search_book_update
+    AFTER UPDATE OF title, description, author_id ON book_book
+    BEGIN
+        DELETE FROM book_search WHERE book_id = OLD.id;
+        {SQLITE_INSERT_BOOK}
+    END
+    """,
+    """
+    CREATE TRIGGER book_search_book_delete AFTER DELETE ON book_book
+    BEGIN
+        DELETE FROM book_search WHERE book_id = OLD.id;
+    END
+    """,
+    """
+    CREATE TRIGGER book_search_author_update AFTER UPDATE OF name ON book_author
+    BEGIN
+        UPDATE book_search SET author_name = NEW.name
+        WHERE book_id IN (SELECT id FROM book_book WHERE author_id = NEW.id);
+    END
+    """,
+    """
+    INSERT INTO book_search (book_id, title, author_name, description)
+    SELECT b.id, b.title, a.name, b.description
+    FROM book_book AS b JOIN book_author AS a ON a.id = b.author_id
+    """,
+]
+
+SQLITE_REVERSE = [
+    "DROP TRIGGER IF EXISTS book_search_author_update",
+    "DROP TRIGGER IF EXISTS book_search_book_delete",
+    "DROP TRIGGER IF EXISTS book_search_book_update",
+    "DROP TRIGGER IF EXISTS book_search_book_insert",
+    "DROP TABLE IF EXISTS book_search",
+]
+
+
+def _run(schema_editor, statements):
+    for statement in statements.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(statement, params=None)
+
+
+def create_search_index(apps, schema_editor):  # noqa: ARG001
+    _run(
+        schema_editor,
+        {"postgresql": POSTGRESQL_FORWARD, "sqlite": SQLITE_FORWARD},
+    )
+
+
+def drop_search_index(apps, schema_editor):  # noqa: ARG001
+    _run(
+        schema_editor,
+        {"postgresql": POSTGRESQL_REVERSE, "sqlite": SQLITE_REVERSE},
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("book", "0006_book_inventory"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
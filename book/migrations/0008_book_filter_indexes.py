@@ -0,0 +1,25 @@
+# Generated by Django 3.2.23 on 2026-10-17 01:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("book", "0007_book_search"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="book",
+            index=models.Index(
+                fields=["author", "created_at", "id"], name="book_author_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="book",
+            index=models.Index(
+                fields=["publisher", "created_at", "id"],
+                name="book_publisher_created_idx",
+            ),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from .author import Author
 from .book import Book
+from .book_inventory import BookInventory
 from .genre import Genre
 from .publisher import Publisher
@@ -8,8 +8,23 @@ class Book(models.Model):
     title = models.CharField(max_length=100)
     description = models.TextField()
     published_date = models.DateField()
-    isbn = models.CharField(max_length=13)
+    # Stored normalized (digits only, see BookEntity.normalize_isbn)
+    isbn = models.CharField(max_length=13, unique=True)
     author = models.ForeignKey("Author", on_delete=models.CASCADE)
     publisher = models.ForeignKey("Publisher", on_delete=models.CASCADE)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # Backs keyset pagination over (created_at, id)
+            models.Index(fields=["created_at", "id"], name="book_created_at_id_idx"),
+            # Back the same pagination filtered by author or publisher
+            models.Index(
+                fields=["author", "created_at", "id"], name="book_author_created_idx"
+            ),
+            models.Index(
+                fields=["publisher", "created_at", "id"],
+                name="book_publisher_created_idx",
+            ),
+        ]
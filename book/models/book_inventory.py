@@ -0,0 +1,29 @@
+from django.db import models
+
+
+class BookInventory(models.Model):
+    """
+    Copy counters of a book.
+
+    available_copies is denormalized from the active borrowings so that an
+    availability check is a single primary-key read; it is only ever changed
+    with conditional F() updates.
+    """
+
+    book = models.OneToOneField(
+        "Book",
+        primary_key=True,
+        on_delete=models.CASCADE,
+        related_name="inventory",
+    )
+    total_copies = models.PositiveIntegerField(default=1)
+    available_copies = models.PositiveIntegerField(default=1)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(available_copies__lte=models.F("total_copies")),
+                name="book_inventory_available_lte_total",
+            ),
+        ]
@@ -1,9 +1,13 @@
 import uuid
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
 from book.entities.author_entity import AuthorEntity
 from book.models.author import Author
+from book.repositories.book_autocomplete_repository import (
+    BookAutocompleteAbstractRepository,
+)
+from book.repositories.book_cache_repository import BookCacheAbstractRepository
 
 
 class AuthorAbstractRepository(ABC):
@@ -17,6 +21,13 @@ class AuthorAbstractRepository(ABC):
         """Get an author entity by ID."""
         raise NotImplementedError("This method should be overridden.")
 
+    @abstractmethod
+    def get_author_entities_by_ids(
+        self, author_ids: Iterable[uuid.UUID]
+    ) -> Dict[uuid.UUID, AuthorEntity]:
+        """Get author entities for many IDs with a single query."""
+        raise NotImplementedError("This method should be overridden.")
+
     @abstractmethod
     def save_author(self, author_entity: AuthorEntity) -> AuthorEntity:
         """Save an author entity to the repository."""
@@ -24,8 +35,14 @@ class AuthorAbstractRepository(ABC):
 
 
 class AuthorRepository(AuthorAbstractRepository):
-    def __init__(self):
+    def __init__(
+        self,
+        book_cache: Optional[BookCacheAbstractRepository] = None,
+        book_autocomplete: Optional[BookAutocompleteAbstractRepository] = None,
+    ):
         self.author_model = Author
+        self.book_cache = book_cache
+        self.book_autocomplete = book_autocomplete
 
     def get_author_by_id(self, author_id):
         """Legacy method for Django model data."""
@@ -39,6 +56,15 @@ class AuthorRepository(AuthorAbstractRepository):
         except self.author_model.DoesNotExist:
             return None
 
+    def get_author_entities_by_ids(
+        self, author_ids: Iterable[uuid.UUID]
+    ) -> Dict[uuid.UUID, AuthorEntity]:
+        """Get author entities for many IDs with a single query."""
+        return {
+            author_model.id: self._model_to_entity(author_model)
+            for author_model in self.author_model.objects.filter(id__in=set(author_ids))
+        }
+
     def save_author(self, author_entity: AuthorEntity) -> AuthorEntity:
         """Save an author entity to the repository."""
         # Convert entity to Django model
@@ -51,9 +77,17 @@ class AuthorRepository(AuthorAbstractRepository):
             updated_at=author_entity.updated_at,
         )
         author_model.save()
+        if self.book_cache is not None:
+            # Cached books embed this author, so drop them
+            self.book_cache.invalidate_books(
+                author_model.book_set.values_list("id", flat=True)
+            )
 
         # Convert back to entity
-        return self._model_to_entity(author_model)
+        author_entity = self._model_to_entity(author_model)
+        if self.book_autocomplete is not None:
+            self.book_autocomplete.save_author(author_entity)
+        return author_entity
 
     def _model_to_entity(self, author_model: Author) -> AuthorEntity:
         """Convert Django model to entity."""
@@ -0,0 +1,282 @@
+import heapq
+import sys
+import threading
+import time
+import unicodedata
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import AbstractSet, Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import connection, transaction
+
+from book.entities.author_entity import AuthorEntity
+from book.entities.book_entity import BookEntity
+from book.models.author import Author
+from book.models.book import Book
+
+# (kind, id, text) as shown to the user
+Suggestion = Tuple[str, str, str]
+# (normalized text, suggestion), the sort order of the index
+Entry = Tuple[str, Suggestion]
+
+TITLE = "title"
+AUTHOR = "author"
+
+
+def normalize_suggestion_text(text: str) -> str:
+    """Fold case, strip accents and collapse whitespace for prefix matching."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.casefold().split())
+
+
+class BookAutocompleteAbstractRepository(ABC):
+    @abstractmethod
+    def suggest(self, prefix: str, limit: int) -> List[Dict[str, Any]]:
+        """Get up to `limit` book titles and author names starting with a prefix."""
+        raise NotImplementedError("This method should be overridden.")
+
+    @abstractmethod
+    def add_books(self, book_entities: Iterable[BookEntity]):
+        """Index new book titles once the current transaction commits."""
+        raise NotImplementedError("This method should be overridden.")
+
+    @abstractmethod
+    def save_author(self, author_entity: AuthorEntity):
+        """Index a new or renamed author once the current transaction commits."""
+        raise NotImplementedError("This method should be overridden.")
+
+    @abstractmethod
+    def rebuild(self):
+        """Rebuild the index from the database."""
+        raise NotImplementedError("This method should be overridden.")
+
+    @abstractmethod
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the index size, memory use and age."""
+        raise NotImplementedError("This method should be overridden.")
+
+
+class BookAutocompleteRepository(BookAutocompleteAbstractRepository):
+    """
+    In-process prefix index over book titles and author names.
+
+    Normalized texts are kept in a sorted list next to a parallel list of
+    suggestions, so a lookup is a binary search plus a slice: no database
+    round trip and no per-keystroke query. The index is built on first use
+    from one values_list() scan per table and then kept current by the write
+    paths of this process: book creation and author saves. Everything else
+    (writes made by other processes, and book titles changed or books deleted
+    outside those paths, e.g. in the admin) shows up when the index is
+    rebuilt, after settings.BOOK_SUGGEST_MAX_AGE seconds.
+
+    The lists are never changed in place. A write merges its sorted entries
+    into copies of them and swaps the copies in, so _lock is only held to
+    read or swap the list references and lookups never wait for a merge.
+    Writes are serialized by _write_lock instead.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._keys: List[str] = []
+        self._suggestions: List[Suggestion] = []
+        self._author_keys: Dict[str, str] = {}
+        self._built_at: Optional[float] = None
+        self._build_seconds = 0.0
+        # Writes committed while a rebuild is scanning, replayed on its result
+        self._journal: Optional[List[Callable[[], None]]] = None
+
+    def suggest(self, prefix: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Get up to `limit` book titles and author names starting with a prefix.
+
+        Matching ignores case, accents and repeated whitespace; matches come
+        back in alphabetical order.
+        """
+        self._ensure_fresh()
+        key = normalize_suggestion_text(prefix)
+        with self._lock:
+            keys, suggestions = self._keys, self._suggestions
+        start = bisect_left(keys, key)
+        end = start
+        while end < len(keys) and end - start < limit and keys[end].startswith(key):
+            end += 1
+        matches = suggestions[start:end]
+        return [
+            {"kind": kind, "id": entity_id, "text": text}
+            for kind, entity_id, text in matches
+        ]
+
+    def add_books(self, book_entities: Iterable[BookEntity]):
+        """Index new book titles once the current transaction commits."""
+        entries = sorted(
+            (normalize_suggestion_text(book.title), (TITLE, str(book.id), book.title))
+            for book in book_entities
+        )
+        if not entries:
+            return
+
+        transaction.on_commit(lambda: self._apply(lambda: self._merge(entries)))
+
+    def save_author(self, author_entity: AuthorEntity):
+        """Index a new or renamed author once the current transaction commits."""
+        author_id, name = str(author_entity.id), author_entity.name
+        entries = [(normalize_suggestion_text(name), (AUTHOR, author_id, name))]
+
+        transaction.on_commit(
+            lambda: self._apply(
+                lambda: self._merge(entries, replaced={(AUTHOR, author_id)})
+            )
+        )
+
+    def rebuild(self):
+        """
+        Rebuild the index from the database.
+
+        The new arrays are built aside and swapped in, so lookups keep using
+        the old index meanwhile. Writes committed during the scan are replayed
+        on top of the new index, as the scan may not have seen them.
+        """
+        started = time.perf_counter()
+        with self._write_lock:
+            self._journal = []
+
+        entries = [
+            (normalize_suggestion_text(title), (TITLE, str(book_id), title))
+            for book_id, title in Book.objects.values_list("id", "title").iterator()
+        ]
+        entries += [
+            (normalize_suggestion_text(name), (AUTHOR, str(author_id), name))
+            for author_id, name in Author.objects.values_list("id", "name").iterator()
+        ]
+        entries.sort()
+        keys = [key for key, _ in entries]
+        suggestions = [suggestion for _, suggestion in entries]
+        author_keys = {
+            suggestion[1]: key for key, suggestion in entries if suggestion[0] == AUTHOR
+        }
+
+        with self._write_lock:
+            with self._lock:
+                self._keys, self._suggestions = keys, suggestions
+                self._author_keys = author_keys
+            journal, self._journal = self._journal, None
+            for write in journal:
+                write()
+            self._built_at = time.monotonic()
+            self._build_seconds = time.perf_counter() - started
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get the index size, memory use and age.
+
+        memory_bytes approximates the heap held by the index: both lists, the
+        normalized keys, the suggestion tuples and their strings.
+        """
+        self._ensure_fresh()
+        with self._lock:
+            keys, suggestions = self._keys, self._suggestions
+            authors = len(self._author_keys)
+        memory_bytes = sys.getsizeof(keys) + sys.getsizeof(suggestions)
+        memory_bytes += sum(sys.getsizeof(key) for key in keys)
+        for suggestion in suggestions:
+            memory_bytes += sys.getsizeof(suggestion)
+            memory_bytes += sys.getsizeof(suggestion[1])
+            memory_bytes += sys.getsizeof(suggestion[2])
+        return {
+            "entries": len(keys),
+            "authors": authors,
+            "titles": len(keys) - authors,
+            "memory_bytes": memory_bytes,
+            "build_seconds": round(self._build_seconds, 4),
+            "age_seconds": round(time.monotonic() - self._built_at, 1),
+        }
+
+    def _ensure_fresh(self):
+        """
+        Build the index on first use and rebuild it once it is too old.
+
+        Only the first build makes the caller wait. Later rebuilds run on a
+        background thread while every caller keeps answering from the current
+        index, so no request pays for the table scans.
+        """
+        built_at = self._built_at
+        max_age = settings.BOOK_SUGGEST_MAX_AGE
+        if built_at is not None and (
+            max_age <= 0 or time.monotonic() - built_at < max_age
+        ):
+            return
+
+        if built_at is None:
+            with self._build_lock:
+                if self._built_at is None:
+                    self.rebuild()
+            return
+
+        # Released by the background thread; a rebuild is already running
+        # when the lock is taken
+        if not self._build_lock.acquire(blocking=False):
+            return
+        threading.Thread(
+            target=self._rebuild_in_background,
+            args=(built_at,),
+            name="book-autocomplete-rebuild",
+            daemon=True,
+        ).start()
+
+    def _rebuild_in_background(self, built_at: Optional[float]):
+        """Rebuild unless another thread already did since `built_at`."""
+        try:
+            if self._built_at is built_at:
+                self.rebuild()
+        finally:
+            self._build_lock.release()
+            # The thread opened its own database connection
+            connection.close()
+
+    def _apply(self, write: Callable[[], None]):
+        """Apply a committed write, journaling it if a rebuild is running."""
+        with self._write_lock:
+            if self._journal is not None:
+                self._journal.append(write)
+            write()
+
+    def _merge(
+        self, entries: List[Entry], replaced: AbstractSet[Tuple[str, str]] = frozenset()
+    ):
+        """
+        Swap in copies of the lists with sorted `entries` merged in.
+
+        Suggestions of the (kind, id) pairs in `replaced` are dropped and exact
+        duplicates are skipped. One pass over the index, however many entries
+        are merged. Must be called with _write_lock held.
+        """
+        current: Iterable[Entry] = zip(self._keys, self._suggestions)
+        if replaced:
+            current = (entry for entry in current if entry[1][:2] not in replaced)
+
+        keys: List[str] = []
+        suggestions: List[Suggestion] = []
+        for key, suggestion in heapq.merge(current, entries):
+            # Entries differing only in their text sort next to each other
+            if keys and keys[-1] == key and suggestions[-1][:2] == suggestion[:2]:
+                continue
+            keys.append(key)
+            suggestions.append(suggestion)
+
+        author_keys = {
+            author_id: key
+            for author_id, key in self._author_keys.items()
+            if (AUTHOR, author_id) not in replaced
+        }
+        author_keys.update(
+            (suggestion[1], key)
+            for key, suggestion in entries
+            if suggestion[0] == AUTHOR
+        )
+        with self._lock:
+            self._keys, self._suggestions = keys, suggestions
+            self._author_keys = author_keys
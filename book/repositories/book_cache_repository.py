@@ -0,0 +1,140 @@
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from book.entities.book_entity import BookEntity
+
+
+class BookCacheAbstractRepository(ABC):
+    @abstractmethod
+    def get_book(self, book_id: uuid.UUID) -> Tuple[Optional[BookEntity], str]:
+        """Get a cached book entity by ID, and the version to pass to set_book."""
+        raise NotImplementedError("This method should be overridden.")
+
+    @abstractmethod
+    def set_book(self, book_entity: BookEntity, version: str):
+        """Store a book entity loaded after get_book returned `version`."""
+        raise NotImplementedError("This method should be overridden.")
+
+    @abstractmethod
+    def invalidate_books(self, book_ids: Iterable[uuid.UUID]):
+        """Drop cached book entities once the current transaction commits."""
+        raise NotImplementedError("This method should be overridden.")
+
+    @abstractmethod
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit, miss, invalidation and eviction counters."""
+        raise NotImplementedError("This method should be overridden.")
+
+
+class BookCacheRepository(BookCacheAbstractRepository):
+    """
+    Book entity cache backed by Django's cache framework.
+
+    Entries are keyed by book id and hold the pickled BookEntity, so the
+    backend can be swapped through settings.CACHES[settings.BOOK_CACHE_ALIAS].
+
+    Every book also has a version key holding a random token, which
+    invalidation replaces. Entries are stored with the version seen before
+    the database read and only served while it is still current, so a reader
+    that loaded the row before a write committed cannot cache the old row
+    for longer than its own request.
+    """
+
+    key_prefix = "book"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    @property
+    def cache(self):
+        return caches[settings.BOOK_CACHE_ALIAS]
+
+    def _key(self, book_id: uuid.UUID) -> str:
+        return f"{self.key_prefix}:{book_id}"
+
+    def _version_key(self, book_id: uuid.UUID) -> str:
+        return f"{self.key_prefix}:{book_id}:version"
+
+    def get_book(self, book_id: uuid.UUID) -> Tuple[Optional[BookEntity], str]:
+        """
+        Get a cached book entity by ID, and the version to pass to set_book.
+
+        The entry and its version are read in one round trip. A missing
+        version (never set, or evicted) is replaced by a new token, which no
+        stored entry can match.
+        """
+        key, version_key = self._key(book_id), self._version_key(book_id)
+        values = self.cache.get_many([key, version_key])
+        version = values.get(version_key)
+        if version is None:
+            version = uuid.uuid4().hex
+            if not self.cache.add(version_key, version, timeout=None):
+                # Another reader added one first
+                version = self.cache.get(version_key, version)
+
+        cached = values.get(key)
+        book_entity = cached[1] if cached and cached[0] == version else None
+        with self._lock:
+            if book_entity is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return book_entity, version
+
+    def set_book(self, book_entity: BookEntity, version: str):
+        """
+        Store a book entity loaded after get_book returned `version`.
+
+        If the book was invalidated in between, the entry is stored under the
+        old version and never served.
+        """
+        self.cache.set(self._key(book_entity.id), (version, book_entity))
+
+    def invalidate_books(self, book_ids: Iterable[uuid.UUID]):
+        """
+        Drop cached book entities once the current transaction commits.
+
+        Each book gets a new version, so entries stored by readers that
+        loaded the row before the commit are never served, and its entry is
+        deleted to free the space. Outside a transaction this happens
+        immediately.
+        """
+        book_ids = list(book_ids)
+        if not book_ids:
+            return
+
+        def bump_versions():
+            self.cache.set_many(
+                {self._version_key(book_id): uuid.uuid4().hex for book_id in book_ids},
+                timeout=None,
+            )
+            self.cache.delete_many([self._key(book_id) for book_id in book_ids])
+            with self._lock:
+                self._invalidations += len(book_ids)
+
+        transaction.on_commit(bump_versions)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit, miss, invalidation and eviction counters."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            stats: Dict[str, Any] = {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+                "invalidations": self._invalidations,
+            }
+
+        backend_stats = getattr(self.cache, "stats", None)
+        if callable(backend_stats):
+            stats.update(backend_stats())
+        return stats
@@ -0,0 +1,93 @@
+import uuid
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+
+from django.db.models import Case, F, PositiveIntegerField, Value, When
+from django.db.models.functions import Least
+
+from book.models.book_inventory import BookInventory
+from book.repositories.book_cache_repository import BookCacheAbstractRepository
+
+
+class BookInventoryAbstractRepository(ABC):
+    @abstractmethod
+    def reserve_copy(self, book_id: uuid.UUID) -> bool:
+        """Take one available copy of a book, if there is one."""
+        raise NotImplementedError("This method should be overridden.")
+
+    @abstractmethod
+    def release_copy(self, book_id: uuid.UUID) -> bool:
+        """Put one borrowed copy of a book back on the shelf."""
+        raise NotImplementedError("This method should be overridden.")
+
+    @abstractmethod
+    def release_copies(self, copies_by_book: Dict[uuid.UUID, int]) -> int:
+        """Put borrowed copies of several books back on the shelf."""
+        raise NotImplementedError("This method should be overridden.")
+
+
+class BookInventoryRepository(BookInventoryAbstractRepository):
+    def __init__(self, book_cache: Optional[BookCacheAbstractRepository] = None):
+        self.inventory_model = BookInventory
+        self.book_cache = book_cache
+
+    def reserve_copy(self, book_id: uuid.UUID) -> bool:
+        """
+        Take one available copy of a book, if there is one.
+
+        A single conditional UPDATE decrements the counter, so concurrent
+        callers can never take more copies than exist.
+        """
+        updated = self.inventory_model.objects.filter(
+            book_id=book_id, available_copies__gt=0
+        ).update(available_copies=F("available_copies") - 1)
+        self._invalidate_cache(book_id, updated)
+        return updated == 1
+
+    def release_copy(self, book_id: uuid.UUID) -> bool:
+        """Put one borrowed copy of a book back on the shelf."""
+        updated = self.inventory_model.objects.filter(
+            book_id=book_id, available_copies__lt=F("total_copies")
+        ).update(available_copies=F("available_copies") + 1)
+        self._invalidate_cache(book_id, updated)
+        return updated == 1
+
+    def release_copies(self, copies_by_book: Dict[uuid.UUID, int]) -> int:
+        """
+        Put borrowed copies of several books back on the shelf.
+
+        All counters move in one UPDATE with a CASE per book, capped at the
+        total number of copies, so a batch of returns costs one statement.
+
+        Args:
+            copies_by_book: Number of returned copies per book ID
+
+        Returns:
+            Number of inventory rows updated
+        """
+        if not copies_by_book:
+            return 0
+
+        returned_copies = Case(
+            *[
+                When(book_id=book_id, then=Value(copies))
+                for book_id, copies in copies_by_book.items()
+            ],
+            default=Value(0),
+            output_field=PositiveIntegerField(),
+        )
+        updated = self.inventory_model.objects.filter(
+            book_id__in=copies_by_book
+        ).update(
+            available_copies=Least(
+                F("available_copies") + returned_copies, F("total_copies")
+            )
+        )
+        if updated and self.book_cache is not None:
+            self.book_cache.invalidate_books(copies_by_book)
+        return updated
+
+    def _invalidate_cache(self, book_id: uuid.UUID, updated: int):
+        """Drop the cached book once its availability has changed."""
+        if updated and self.book_cache is not None:
+            self.book_cache.invalidate_books([book_id])
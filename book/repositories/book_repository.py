@@ -1,13 +1,129 @@
 import uuid
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from dataclasses import dataclass
+from datetime import date
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+from django.db.models import Prefetch, QuerySet, prefetch_related_objects
 
 from book.entities.author_entity import AuthorEntity
 from book.entities.book_entity import BookEntity
 from book.entities.genre_entity import GenreEntity
 from book.entities.publisher_entity import PublisherEntity
 from book.models.book import Book
+from book.models.book_inventory import BookInventory
 from book.models.genre import Genre
+from book.repositories.book_cache_repository import BookCacheAbstractRepository
+from librarymanagementsystem.pagination import Cursor, Page, paginate
+
+# Relations book_model_to_entity() reads, joined in by every hydrating query
+BOOK_RELATED_FIELDS = ("author", "publisher", "inventory")
+
+
+@dataclass(frozen=True)
+class BookFilter:
+    """Conditions narrowing a book listing; fields left as None do not filter."""
+
+    author_id: Optional[uuid.UUID] = None
+    publisher_id: Optional[uuid.UUID] = None
+    genre_id: Optional[uuid.UUID] = None
+    published_before: Optional[date] = None
+
+    def apply(self, queryset: QuerySet) -> QuerySet:
+        """
+        Narrow a Book queryset in SQL.
+
+        Author and publisher filter on the FK columns, which lead the
+        (author|publisher, created_at, id) indexes. Genre is a subquery on the
+        genre-book through table, so a book never appears twice.
+        """
+        if self.author_id is not None:
+            queryset = queryset.filter(author_id=self.author_id)
+        if self.publisher_id is not None:
+            queryset = queryset.filter(publisher_id=self.publisher_id)
+        if self.genre_id is not None:
+            queryset = queryset.filter(
+                id__in=Genre.books.through.objects.filter(
+                    genre_id=self.genre_id
+                ).values("book_id")
+            )
+        if self.published_before is not None:
+            queryset = queryset.filter(published_date__lt=self.published_before)
+        return queryset
+
+
+def book_genres_prefetch(prefix: str = "") -> Prefetch:
+    """Prefetch of a book's genres in a stable order, below an optional prefix."""
+    return Prefetch(f"{prefix}genres", queryset=Genre.objects.order_by("id"))
+
+
+def hydrate_books(queryset: QuerySet, prefix: str = "") -> QuerySet:
+    """
+    Load everything book_model_to_entity() needs along with a queryset.
+
+    Author, publisher and inventory are joined in, and all genres of the
+    selected books are fetched in one extra query, so hydrating N books costs
+    a constant number of statements. Pass a prefix such as "book__" to hydrate
+    the books of another model's queryset.
+    """
+    return queryset.select_related(
+        *(f"{prefix}{field}" for field in BOOK_RELATED_FIELDS)
+    ).prefetch_related(book_genres_prefetch(prefix))
+
+
+def book_model_to_entity(book_model: Book) -> BookEntity:
+    """
+    Convert a book model loaded with its related rows to an entity.
+
+    The model must come from a queryset hydrated by hydrate_books(), or the
+    author, publisher, inventory and genres each cost a query.
+    """
+    # genres.all() is served from the prefetch cache when the model was
+    # loaded through hydrate_books(); .first() would bypass it.
+    genre_entities = [
+        GenreEntity(
+            id=genre.id,
+            name=genre.name,
+            created_at=genre.created_at,
+            updated_at=genre.updated_at,
+        )
+        for genre in book_model.genres.all()
+    ]
+    publisher_entity = PublisherEntity(
+        id=book_model.publisher.id,
+        name=book_model.publisher.name,
+        website=book_model.publisher.website,
+        created_at=book_model.publisher.created_at,
+        updated_at=book_model.publisher.updated_at,
+    )
+    author_entity = AuthorEntity(
+        id=book_model.author.id,
+        name=book_model.author.name,
+        birth_date=book_model.author.birth_date,
+        death_date=book_model.author.death_date,
+        created_at=book_model.author.created_at,
+        updated_at=book_model.author.updated_at,
+    )
+
+    # Books without an inventory row have no copies to lend
+    inventory = getattr(book_model, "inventory", None)
+
+    return BookEntity(
+        id=book_model.id,
+        title=book_model.title,
+        description=book_model.description,
+        published_date=book_model.published_date,
+        isbn=book_model.isbn,
+        author=author_entity,
+        publisher=publisher_entity,
+        created_at=book_model.created_at,
+        updated_at=book_model.updated_at,
+        genre=genre_entities[0] if genre_entities else None,
+        genres=genre_entities,
+        total_copies=inventory.total_copies if inventory else 0,
+        available_copies=inventory.available_copies if inventory else 0,
+    )
 
 
 class BookAbstractRepository(ABC):
@@ -21,11 +137,35 @@ class BookAbstractRepository(ABC):
         """Save a book entity to the repository."""
         raise NotImplementedError("This method should be overridden.")
 
+    @abstractmethod
+    def bulk_save_books(
+        self, book_entities: List[BookEntity], batch_size: int
+    ) -> List[BookEntity]:
+        """Insert new book entities and their genre links in batches."""
+        raise NotImplementedError("This method should be overridden.")
+
+    @abstractmethod
+    def get_existing_isbns(self, isbns: Iterable[str]) -> Set[str]:
+        """Get which of the given ISBNs are already taken."""
+        raise NotImplementedError("This method should be overridden.")
+
     @abstractmethod
     def get_book_by_id(self, book_id: uuid.UUID) -> Optional[BookEntity]:
         """Get a book entity by ID."""
         raise NotImplementedError("This method should be overridden.")
 
+    @abstractmethod
+    def get_book_for_update(self, book_id: uuid.UUID) -> Optional[BookEntity]:
+        """Get a book entity by ID, locking its row until the transaction ends."""
+        raise NotImplementedError("This method should be overridden.")
+
+    @abstractmethod
+    def get_books_by_ids(
+        self, book_ids: Iterable[uuid.UUID]
+    ) -> Dict[uuid.UUID, BookEntity]:
+        """Get the book entities with the given IDs, keyed by ID."""
+        raise NotImplementedError("This method should be overridden.")
+
     @abstractmethod
     def get_book_by_isbn(self, isbn: str) -> Optional[BookEntity]:
         """Get a book entity by ISBN."""
@@ -37,14 +177,54 @@ class BookAbstractRepository(ABC):
         raise NotImplementedError("This method should be overridden.")
 
     @abstractmethod
-    def get_all_books(self) -> List[BookEntity]:
+    def get_all_books(self, include_details: bool = True) -> List[BookEntity]:
         """Get all book entities."""
         raise NotImplementedError("This method should be overridden.")
 
+    @abstractmethod
+    def get_books_page(
+        self,
+        cursor: Optional[Cursor],
+        page_size: int,
+        book_filter: Optional[BookFilter] = None,
+    ) -> Page:
+        """Get one keyset page of book entities ordered by (created_at, id)."""
+        raise NotImplementedError("This method should be overridden.")
+
+    @abstractmethod
+    def get_book_ids_page(
+        self,
+        cursor: Optional[Cursor],
+        page_size: int,
+        book_filter: Optional[BookFilter] = None,
+    ) -> Page:
+        """Get one keyset page of book IDs ordered by (created_at, id)."""
+        raise NotImplementedError("This method should be overridden.")
+
+    @abstractmethod
+    def count_books(self, book_filter: Optional[BookFilter] = None) -> int:
+        """Count the books matching a filter."""
+        raise NotImplementedError("This method should be overridden.")
+
+    @abstractmethod
+    def iter_book_chunks(self, chunk_size: int) -> Iterator[List[BookEntity]]:
+        """Stream all book entities in chunks ordered by (created_at, id)."""
+        raise NotImplementedError("This method should be overridden.")
+
 
 class BookRepository(BookAbstractRepository):
-    def __init__(self):
+    def __init__(self, book_cache: Optional[BookCacheAbstractRepository] = None):
         self.book_model = Book
+        self.book_cache = book_cache
+
+    def _invalidate_cache(self, book_id: uuid.UUID):
+        """Drop the cached entity of a book that was just written."""
+        if self.book_cache is not None:
+            self.book_cache.invalidate_books([book_id])
+
+    def _hydrated_queryset(self) -> QuerySet:
+        """Queryset that loads everything _model_to_entity needs up front."""
+        return hydrate_books(self.book_model.objects.all())
 
     def add_book(self, book_data):
         """Legacy method for Django model data."""
@@ -72,87 +252,232 @@ class BookRepository(BookAbstractRepository):
             updated_at=book_entity.updated_at,
         )
         book_model.save()
+        book_model.inventory, _ = BookInventory.objects.get_or_create(
+            book_id=book_model.id,
+            defaults={
+                "total_copies": book_entity.total_copies,
+                "available_copies": book_entity.available_copies,
+            },
+        )
+        self._invalidate_cache(book_model.id)
 
         # Convert back to entity
         return self._model_to_entity(book_model)
 
+    def bulk_save_books(
+        self, book_entities: List[BookEntity], batch_size: int
+    ) -> List[BookEntity]:
+        """
+        Insert new book entities and their genre links in batches.
+
+        Books, their inventory rows and the book/genre rows on the M2M through
+        model each go in with one bulk_create, so the number of statements
+        depends on the batch size rather than on the number of books.
+        """
+        book_models = [
+            self.book_model(
+                id=book_entity.id,
+                title=book_entity.title,
+                description=book_entity.description,
+                published_date=book_entity.published_date,
+                isbn=book_entity.isbn,
+                author_id=book_entity.author.id if book_entity.author else None,
+                publisher_id=book_entity.publisher.id
+                if book_entity.publisher
+                else None,
+            )
+            for book_entity in book_entities
+        ]
+        self.book_model.objects.bulk_create(book_models, batch_size=batch_size)
+        BookInventory.objects.bulk_create(
+            [
+                BookInventory(
+                    book_id=book_entity.id,
+                    total_copies=book_entity.total_copies,
+                    available_copies=book_entity.available_copies,
+                )
+                for book_entity in book_entities
+            ],
+            batch_size=batch_size,
+        )
+
+        book_genre_model = Genre.books.through
+        book_genre_model.objects.bulk_create(
+            [
+                book_genre_model(book_id=book_entity.id, genre_id=genre.id)
+                for book_entity in book_entities
+                for genre in book_entity.genres
+            ],
+            batch_size=batch_size,
+        )
+
+        # bulk_create() fills auto_now_add/auto_now fields on the instances
+        for book_entity, book_model in zip(book_entities, book_models):
+            book_entity.created_at = book_model.created_at
+            book_entity.updated_at = book_model.updated_at
+        return book_entities
+
+    def get_existing_isbns(self, isbns: Iterable[str]) -> Set[str]:
+        """Get which of the given ISBNs are already taken."""
+        return set(
+            self.book_model.objects.filter(
+                isbn__in={BookEntity.normalize_isbn(isbn) for isbn in isbns}
+            ).values_list("isbn", flat=True)
+        )
+
     def get_book_by_id(self, book_id: uuid.UUID) -> Optional[BookEntity]:
         """Get a book entity by ID."""
+        try:
+            book_model = self._hydrated_queryset().get(id=book_id)
+            return self._model_to_entity(book_model)
+        except self.book_model.DoesNotExist:
+            return None
+
+    def get_book_for_update(self, book_id: uuid.UUID) -> Optional[BookEntity]:
+        """
+        Get a book entity by ID, locking its row until the transaction ends.
+
+        Only the book row is locked (FOR UPDATE OF), not the joined author,
+        publisher and inventory rows. Must be called inside transaction.atomic().
+        """
         try:
             book_model = (
-                self.book_model.objects.select_related("author", "publisher")
-                .prefetch_related("genres")
+                self._hydrated_queryset()
+                .select_for_update(of=("self",))
                 .get(id=book_id)
             )
             return self._model_to_entity(book_model)
         except self.book_model.DoesNotExist:
             return None
 
+    def get_books_by_ids(
+        self, book_ids: Iterable[uuid.UUID]
+    ) -> Dict[uuid.UUID, BookEntity]:
+        """
+        Get the book entities with the given IDs, keyed by ID.
+
+        All books are loaded by one joined query plus one genre prefetch,
+        however many IDs are given. Missing IDs are left out of the result.
+        """
+        book_ids = list(book_ids)
+        if not book_ids:
+            return {}
+        return {
+            book_model.id: self._model_to_entity(book_model)
+            for book_model in self._hydrated_queryset().filter(id__in=book_ids)
+        }
+
     def get_book_by_isbn(self, isbn: str) -> Optional[BookEntity]:
         """Get a book entity by ISBN."""
         try:
-            book_model = self.book_model.objects.get(isbn=isbn)
+            book_model = self._hydrated_queryset().get(
+                isbn=BookEntity.normalize_isbn(isbn)
+            )
             return self._model_to_entity(book_model)
         except self.book_model.DoesNotExist:
             return None
 
-    def get_all_books(self) -> List[BookEntity]:
-        """Get all book entities."""
+    def get_all_books(self, include_details: bool = True) -> List[BookEntity]:
+        """
+        Get all book entities.
+
+        Without details the books are read in one query without joins: author,
+        publisher and genres are left empty, only copy counts are loaded.
+        """
+        if include_details:
+            book_models = self._hydrated_queryset()
+            return [self._model_to_entity(book_model) for book_model in book_models]
+
+        return [
+            self._summary_to_entity(book_model)
+            for book_model in self.book_model.objects.select_related("inventory")
+        ]
+
+    def get_books_page(
+        self,
+        cursor: Optional[Cursor],
+        page_size: int,
+        book_filter: Optional[BookFilter] = None,
+    ) -> Page:
+        """Get one keyset page of book entities ordered by (created_at, id)."""
+        queryset = self._hydrated_queryset()
+        if book_filter is not None:
+            queryset = book_filter.apply(queryset)
+        page = paginate(queryset, ("created_at", "id"), cursor, page_size)
+        page.items = [self._model_to_entity(book_model) for book_model in page.items]
+        return page
+
+    def get_book_ids_page(
+        self,
+        cursor: Optional[Cursor],
+        page_size: int,
+        book_filter: Optional[BookFilter] = None,
+    ) -> Page:
+        """
+        Get one keyset page of book IDs ordered by (created_at, id).
+
+        Only the key columns are selected, so with an author or publisher
+        filter the page can be read from the index alone.
+        """
+        queryset = self.book_model.objects.values("created_at", "id")
+        if book_filter is not None:
+            queryset = book_filter.apply(queryset)
+        page = paginate(queryset, ("created_at", "id"), cursor, page_size)
+        page.items = [row["id"] for row in page.items]
+        return page
+
+    def count_books(self, book_filter: Optional[BookFilter] = None) -> int:
+        """Count the books matching a filter with a single COUNT query."""
+        queryset = self.book_model.objects.all()
+        if book_filter is not None:
+            queryset = book_filter.apply(queryset)
+        return queryset.count()
+
+    def iter_book_chunks(self, chunk_size: int) -> Iterator[List[BookEntity]]:
+        """
+        Stream all book entities in chunks ordered by (created_at, id).
+
+        Rows are read through a server-side cursor, so at most one chunk of
+        books is held in memory at a time. prefetch_related() is ignored by
+        iterator(), so each chunk's genres are loaded in one batched query.
+        """
         book_models = (
-            self.book_model.objects.select_related("author", "publisher")
-            .prefetch_related("genres")
-            .all()
+            self.book_model.objects.select_related("author", "publisher", "inventory")
+            .order_by("created_at", "id")
+            .iterator(chunk_size=chunk_size)
         )
-        return [self._model_to_entity(book_model) for book_model in book_models]
+        while True:
+            chunk = list(islice(book_models, chunk_size))
+            if not chunk:
+                return
+            prefetch_related_objects(chunk, book_genres_prefetch())
+            yield [self._model_to_entity(book_model) for book_model in chunk]
 
     def add_book_to_genre(self, book_id: uuid.UUID, genre: Genre):
         """Add a genre to a book entity."""
         # Add genre to the book entity
         book = self.book_model.objects.get(id=book_id)
         book.genres.add(genre)  # type: ignore
-        return self._model_to_entity(book)
+        self._invalidate_cache(book_id)
+        return self._model_to_entity(self._hydrated_queryset().get(id=book_id))
 
         # Get the genre entity and add the book to it
 
     def _model_to_entity(self, book_model: Book) -> BookEntity:
         """Convert Django model to entity."""
-        genre = book_model.genres.first() if book_model.genres.first() else None
-        genre_entity = None
-        author_entity = None
-        publisher_entity = None
-
-        if genre:
-            genre_entity = GenreEntity(
-                id=genre.id,
-                name=genre.name,
-                created_at=genre.created_at,
-                updated_at=genre.updated_at,
-            )
-        publisher_entity = PublisherEntity(
-            id=book_model.publisher.id,
-            name=book_model.publisher.name,
-            website=book_model.publisher.website,
-            created_at=book_model.publisher.created_at,
-            updated_at=book_model.publisher.updated_at,
-        )
-        author_entity = AuthorEntity(
-            id=book_model.author.id,
-            name=book_model.author.name,
-            birth_date=book_model.author.birth_date,
-            death_date=book_model.author.death_date,
-            created_at=book_model.author.created_at,
-            updated_at=book_model.author.updated_at,
-        )
+        return book_model_to_entity(book_model)
 
+    def _summary_to_entity(self, book_model: Book) -> BookEntity:
+        """Convert Django model to entity without author, publisher or genres."""
+        inventory = getattr(book_model, "inventory", None)
         return BookEntity(
             id=book_model.id,
             title=book_model.title,
             description=book_model.description,
             published_date=book_model.published_date,
             isbn=book_model.isbn,
-            author=author_entity,
-            publisher=publisher_entity,
             created_at=book_model.created_at,
             updated_at=book_model.updated_at,
-            genre=genre_entity,
+            total_copies=inventory.total_copies if inventory else 0,
+            available_copies=inventory.available_copies if inventory else 0,
         )
@@ -0,0 +1,202 @@
+import re
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import connection
+
+from book.models.book import Book
+from book.repositories.book_repository import BookAbstractRepository
+from librarymanagementsystem.pagination import Cursor, Page, encode_cursor
+
+
+class BookSearchAbstractRepository(ABC):
+    @abstractmethod
+    def search_books(
+        self, query: str, cursor: Optional[Cursor], page_size: int
+    ) -> Page:
+        """Get one keyset page of books matching a search query, best match first."""
+        raise NotImplementedError("This method should be overridden.")
+
+
+class BookSearchRepository(BookSearchAbstractRepository):
+    """
+    Ranked book search over the index created by the 0007_book_search migration.
+
+    Backends only provide the SQL that selects matching book ids with a
+    relevance rank (higher is better); paging on (rank, id) and loading the
+    books is shared. Books are hydrated through the book repository, so a
+    page costs one search query plus the usual book and genre queries.
+
+    Ranking needs every candidate scored before the best can be picked, so
+    the candidates are capped at settings.BOOK_SEARCH_MAX_CANDIDATES matches
+    in index order. A page never ranks more rows than that however common
+    the query is; for queries matching more books, results come from the
+    first matches only.
+    """
+
+    def __init__(self, book_repository: BookAbstractRepository):
+        self.book_repository = book_repository
+
+    @abstractmethod
+    def _ranked_sql(self, query: str, limit: int) -> Tuple[str, List[Any]]:
+        """
+        Build the SQL selecting the `id` and `rank` of up to `limit` matching books.
+
+        The same books must be selected on every call while the index does not
+        change, so that pages of one search line up. Returns an empty SQL
+        string when the query cannot match anything.
+        """
+        raise NotImplementedError("This method should be overridden.")
+
+    def search_books(
+        self, query: str, cursor: Optional[Cursor], page_size: int
+    ) -> Page:
+        """
+        Get one keyset page of books matching a search query, best match first.
+
+        Pages are ordered by (-rank, -id) and cursors carry the rank of their
+        boundary row, so no page depends on an offset. Every page ranks the
+        capped candidate set again, as the cursor filters the ranked
+        subquery, so its cost is bounded by BOOK_SEARCH_MAX_CANDIDATES rather
+        than by the number of matches; only the page's own rows plus one are
+        hydrated into entities.
+
+        Args:
+            query: The search text as typed by the user
+            cursor: Decoded cursor, or None for the first page
+            page_size: Maximum number of books on the page
+
+        Returns:
+            Page of book entities with next and previous cursor tokens
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        sql, params = self._ranked_sql(query, settings.BOOK_SEARCH_MAX_CANDIDATES)
+        if not sql:
+            return Page()
+
+        backwards = cursor is not None and cursor.reverse
+        rows = self._fetch_ranked(sql, params, cursor, backwards, page_size + 1)
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if backwards:
+            rows.reverse()
+
+        books = self.book_repository.get_books_by_ids([book_id for book_id, _ in rows])
+        page = Page(items=[books[book_id] for book_id, _ in rows if book_id in books])
+        if rows:
+            first = (rows[0][1], rows[0][0])
+            last = (rows[-1][1], rows[-1][0])
+            if backwards:
+                page.next_cursor = encode_cursor(last)
+                if has_more:
+                    page.previous_cursor = encode_cursor(first, reverse=True)
+            else:
+                if has_more:
+                    page.next_cursor = encode_cursor(last)
+                if cursor is not None:
+                    page.previous_cursor = encode_cursor(first, reverse=True)
+        return page
+
+    def _fetch_ranked(
+        self,
+        sql: str,
+        params: List[Any],
+        cursor: Optional[Cursor],
+        backwards: bool,
+        limit: int,
+    ) -> List[Tuple[uuid.UUID, float]]:
+        """Read up to `limit` (id, rank) rows past the cursor position."""
+        operator, direction = (">", "ASC") if backwards else ("<", "DESC")
+        sql = f"SELECT id, rank FROM ({sql}) AS ranked"
+        params = list(params)
+        if cursor is not None:
+            rank, book_id = self._cursor_position(cursor)
+            sql += f" WHERE rank {operator} %s OR (rank = %s AND id {operator} %s)"
+            params += [rank, rank, book_id]
+        sql += f" ORDER BY rank {direction}, id {direction} LIMIT %s"
+        params.append(limit)
+
+        pk = Book._meta.pk
+        with connection.cursor() as db_cursor:
+            db_cursor.execute(sql, params)
+            return [
+                (pk.to_python(book_id), float(rank))
+                for book_id, rank in db_cursor.fetchall()
+            ]
+
+    def _cursor_position(self, cursor: Cursor) -> Tuple[float, Any]:
+        """Validate a (rank, id) cursor and convert it to query parameters."""
+        try:
+            rank, book_id = cursor.position
+            rank = float(rank)
+            book_id = uuid.UUID(str(book_id))
+        except (TypeError, ValueError):
+            raise ValueError("Invalid cursor")
+        return rank, Book._meta.pk.get_db_prep_value(book_id, connection)
+
+
+class PostgresBookSearchRepository(BookSearchRepository):
+    """
+    Search backed by the GIN-indexed book_book.search_vector column.
+
+    The query is parsed with websearch_to_tsquery (quoted phrases, OR and -
+    work as on web search engines). Titles within pg_trgm similarity of the
+    query match too, so a misspelled title still finds the book; both
+    conditions are answered from GIN indexes and combined in a bitmap OR.
+    Rank is ts_rank_cd over the weighted vector (title > author > description)
+    plus the title's trigram similarity, computed for the candidates with the
+    lowest ids only.
+    """
+
+    def _ranked_sql(self, query: str, limit: int) -> Tuple[str, List[Any]]:
+        sql = """
+            SELECT b.id,
+                (ts_rank_cd(b.search_vector, q.query) + similarity(b.title, %s))::float8
+                    AS rank
+            FROM websearch_to_tsquery('english', %s) AS q(query),
+            LATERAL (
+                SELECT id, title, search_vector
+                FROM book_book
+                WHERE search_vector @@ q.query OR title %% %s
+                ORDER BY id
+                LIMIT %s
+            ) AS b
+        """
+        return sql, [query, query, query, limit]
+
+
+class SqliteBookSearchRepository(BookSearchRepository):
+    """
+    Search backed by the book_search FTS5 table, for local development and tests.
+
+    Every word of the query must match (porter-stemmed) and results are ranked
+    by bm25 with the same title > author > description weighting as on
+    PostgreSQL, for the candidates first in rowid order only. There is no
+    typo tolerance.
+    """
+
+    # bm25() column weights: book_id (unindexed), title, author_name, description
+    column_weights = (0.0, 10.0, 5.0, 1.0)
+
+    def _ranked_sql(self, query: str, limit: int) -> Tuple[str, List[Any]]:
+        # Quote every word so FTS5 query syntax in user input is matched literally
+        words = re.findall(r"\w+", query)
+        if not words:
+            return "", []
+
+        match = " ".join(f'"{word}"' for word in words)
+        weights = ", ".join(str(weight) for weight in self.column_weights)
+        # FTS5 returns matches in rowid order, so the candidates cost no sort;
+        # bm25() needs the outer MATCH and only runs for those candidates
+        sql = f"""
+            SELECT book_id AS id, -bm25(book_search, {weights}) AS rank
+            FROM book_search
+            WHERE book_search MATCH %s AND rowid IN (
+                SELECT rowid FROM book_search WHERE book_search MATCH %s LIMIT %s
+            )
+        """
+        return sql, [match, match, limit]
@@ -1,9 +1,12 @@
 import uuid
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, Iterable, Optional
+
+from django.db.models import Count
 
 from book.entities.genre_entity import GenreEntity
 from book.models.genre import Genre
+from book.repositories.book_cache_repository import BookCacheAbstractRepository
 
 
 class GenreAbstractRepository(ABC):
@@ -18,10 +21,19 @@ class GenreAbstractRepository(ABC):
     #     raise NotImplementedError("This method should be overridden.")
 
     @abstractmethod
-    def get_genre_entity_by_id(self, genre_id: uuid.UUID) -> Optional[GenreEntity]:
+    def get_genre_entity_by_id(
+        self, genre_id: uuid.UUID, with_book_count: bool = False
+    ) -> Optional[GenreEntity]:
         """Get a genre entity by ID."""
         raise NotImplementedError("This method should be overridden.")
 
+    @abstractmethod
+    def get_genre_entities_by_ids(
+        self, genre_ids: Iterable[uuid.UUID]
+    ) -> Dict[uuid.UUID, GenreEntity]:
+        """Get genre entities for many IDs with a single query."""
+        raise NotImplementedError("This method should be overridden.")
+
     @abstractmethod
     def save_genre(self, genre_entity: GenreEntity) -> GenreEntity:
         """Save a genre entity to the repository."""
@@ -34,8 +46,9 @@ class GenreAbstractRepository(ABC):
 
 
 class GenreRepository(GenreAbstractRepository):
-    def __init__(self):
+    def __init__(self, book_cache: Optional[BookCacheAbstractRepository] = None):
         self.genre_model = Genre
+        self.book_cache = book_cache
 
     def get_genre_by_id(self, genre_id):
         """Legacy method for Django model data."""
@@ -53,14 +66,33 @@ class GenreRepository(GenreAbstractRepository):
     #         # Save the updated genre entity
     #         self.save_genre(genre_entity)
 
-    def get_genre_entity_by_id(self, genre_id: uuid.UUID) -> Optional[GenreEntity]:
-        """Get a genre entity by ID."""
+    def get_genre_entity_by_id(
+        self, genre_id: uuid.UUID, with_book_count: bool = False
+    ) -> Optional[GenreEntity]:
+        """
+        Get a genre entity by ID.
+
+        The genre's books are not read; pass with_book_count=True to count them
+        in the same query, for callers that need get_book_count().
+        """
+        queryset = self.genre_model.objects.all()
+        if with_book_count:
+            queryset = queryset.annotate(book_count=Count("books"))
         try:
-            genre_model = self.genre_model.objects.get(id=genre_id)
+            genre_model = queryset.get(id=genre_id)
             return self._model_to_entity(genre_model)
         except self.genre_model.DoesNotExist:
             return None
 
+    def get_genre_entities_by_ids(
+        self, genre_ids: Iterable[uuid.UUID]
+    ) -> Dict[uuid.UUID, GenreEntity]:
+        """Get genre entities for many IDs with a single query."""
+        return {
+            genre_model.id: self._model_to_entity(genre_model)
+            for genre_model in self.genre_model.objects.filter(id__in=set(genre_ids))
+        }
+
     def save_genre(self, genre_entity: GenreEntity) -> GenreEntity:
         """Save a genre entity to the repository."""
         # Convert entity to Django model
@@ -71,21 +103,33 @@ class GenreRepository(GenreAbstractRepository):
             updated_at=genre_entity.updated_at,
         )
         genre_model.save()
+        if self.book_cache is not None:
+            # Cached books embed this genre, so drop them
+            self.book_cache.invalidate_books(
+                genre_model.books.values_list("id", flat=True)
+            )
 
         # Convert back to entity
         return self._model_to_entity(genre_model)
 
     def _model_to_entity(self, genre_model: Genre) -> GenreEntity:
-        """Convert Django model to entity."""
-        # Get book IDs from the related books
-        book_ids = list(genre_model.books.values_list("id", flat=True))
-
+        """
+        Convert Django model to entity.
+
+        Book IDs and the book count are read from the genre-book through table
+        only when the entity asks for them, unless the count was annotated.
+        """
+        memberships = self.genre_model.books.through.objects.filter(
+            genre_id=genre_model.id
+        )
         return GenreEntity(
             id=genre_model.id,
             name=genre_model.name,
             created_at=genre_model.created_at,
             updated_at=genre_model.updated_at,
-            book_ids=book_ids,
+            book_count=getattr(genre_model, "book_count", None),
+            book_ids_loader=lambda: list(memberships.values_list("book_id", flat=True)),
+            book_count_loader=memberships.count,
         )
 
     def entity_to_model(self, entity: GenreEntity) -> Genre:
@@ -1,9 +1,10 @@
 import uuid
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
 from book.entities.publisher_entity import PublisherEntity
 from book.models.publisher import Publisher
+from book.repositories.book_cache_repository import BookCacheAbstractRepository
 
 
 class PublisherAbstractRepository(ABC):
@@ -19,6 +20,13 @@ class PublisherAbstractRepository(ABC):
         """Get a publisher entity by ID."""
         raise NotImplementedError("This method should be overridden.")
 
+    @abstractmethod
+    def get_publisher_entities_by_ids(
+        self, publisher_ids: Iterable[uuid.UUID]
+    ) -> Dict[uuid.UUID, PublisherEntity]:
+        """Get publisher entities for many IDs with a single query."""
+        raise NotImplementedError("This method should be overridden.")
+
     @abstractmethod
     def save_publisher(self, publisher_entity: PublisherEntity) -> PublisherEntity:
         """Save a publisher entity to the repository."""
@@ -26,8 +34,9 @@ class PublisherAbstractRepository(ABC):
 
 
 class PublisherRepository(PublisherAbstractRepository):
-    def __init__(self):
+    def __init__(self, book_cache: Optional[BookCacheAbstractRepository] = None):
         self.publisher_model = Publisher
+        self.book_cache = book_cache
 
     def get_publisher_by_id(self, publisher_id):
         """Legacy method for Django model data."""
@@ -43,6 +52,17 @@ class PublisherRepository(PublisherAbstractRepository):
         except self.publisher_model.DoesNotExist:
             return None
 
+    def get_publisher_entities_by_ids(
+        self, publisher_ids: Iterable[uuid.UUID]
+    ) -> Dict[uuid.UUID, PublisherEntity]:
+        """Get publisher entities for many IDs with a single query."""
+        return {
+            publisher_model.id: self._model_to_entity(publisher_model)
+            for publisher_model in self.publisher_model.objects.filter(
+                id__in=set(publisher_ids)
+            )
+        }
+
     def save_publisher(self, publisher_entity: PublisherEntity) -> PublisherEntity:
         """Save a publisher entity to the repository."""
         # Convert entity to Django model
@@ -54,6 +74,11 @@ class PublisherRepository(PublisherAbstractRepository):
             updated_at=publisher_entity.updated_at,
         )
         publisher_model.save()
+        if self.book_cache is not None:
+            # Cached books embed this publisher, so drop them
+            self.book_cache.invalidate_books(
+                publisher_model.book_set.values_list("id", flat=True)
+            )
 
         # Convert back to entity
         return self._model_to_entity(publisher_model)
@@ -1,8 +1,14 @@
 # This file makes the serializes directory a Python package
 
 from .author_response_serializer import AuthorResponseSerializer
+from .book_batch_response_serializer import BookBatchResponseSerializer
+from .book_bulk_create_response_serializer import BookBulkCreateResponseSerializer
 from .book_create_serializer import BookCreateSerializer
+from .book_id_page_response_serializer import BookIdPageResponseSerializer
+from .book_page_response_serializer import BookPageResponseSerializer
 from .book_response_serializer import BookResponseSerializer
+from .book_suggestion_response_serializer import BookSuggestionResponseSerializer
+from .book_suggestion_serializer import BookSuggestionSerializer
 from .enriched_book_response_serializer import EnrichedBookResponseSerializer
 from .genre_response_serializer import GenreResponseSerializer
 from .publisher_response_serializer import PublisherResponseSerializer
@@ -14,4 +20,10 @@ __all__ = [
     "PublisherResponseSerializer",
     "GenreResponseSerializer",
     "EnrichedBookResponseSerializer",
+    "BookPageResponseSerializer",
+    "BookBulkCreateResponseSerializer",
+    "BookSuggestionSerializer",
+    "BookSuggestionResponseSerializer",
+    "BookBatchResponseSerializer",
+    "BookIdPageResponseSerializer",
 ]
@@ -0,0 +1,19 @@
+from rest_framework import serializers
+
+from .enriched_book_response_serializer import EnrichedBookResponseSerializer
+
+
+class BookBatchResponseSerializer(serializers.Serializer):
+    """Serializer for the result of a batch book lookup."""
+
+    results = EnrichedBookResponseSerializer(many=True)
+    missing = serializers.ListField(child=serializers.UUIDField())
+
+    @classmethod
+    def create_response(cls, books, missing_ids):
+        """Create a response instance with the given data."""
+        data = {
+            "results": books,
+            "missing": missing_ids,
+        }
+        return cls(data)
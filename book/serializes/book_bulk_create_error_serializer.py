@@ -0,0 +1,8 @@
+from rest_framework import serializers
+
+
+class BookBulkCreateErrorSerializer(serializers.Serializer):
+    """Serializer for a rejected item of a bulk book creation request."""
+
+    index = serializers.IntegerField()
+    error = serializers.JSONField()
@@ -0,0 +1,24 @@
+from rest_framework import serializers
+
+from .book_bulk_create_error_serializer import BookBulkCreateErrorSerializer
+from .book_response_serializer import BookResponseSerializer
+
+
+class BookBulkCreateResponseSerializer(serializers.Serializer):
+    """Serializer for the result of a bulk book creation request."""
+
+    created = BookResponseSerializer(many=True)
+    errors = BookBulkCreateErrorSerializer(many=True)
+    created_count = serializers.IntegerField()
+    error_count = serializers.IntegerField()
+
+    @classmethod
+    def create_response(cls, created_books, errors):
+        """Create a response instance with the given data."""
+        data = {
+            "created": [book.to_dict() for book in created_books],
+            "errors": sorted(errors, key=lambda error: error["index"]),
+            "created_count": len(created_books),
+            "error_count": len(errors),
+        }
+        return cls(data)
@@ -5,7 +5,9 @@ class BookCreateSerializer(serializers.Serializer):
     title = serializers.CharField(max_length=100)
     description = serializers.CharField(max_length=255)
     published_date = serializers.DateField()
-    isbn = serializers.CharField(max_length=13)
+    # Room for hyphenated ISBN-13s; stored normalized to 13 digits
+    isbn = serializers.CharField(max_length=17)
     author_id = serializers.UUIDField()
     publisher_id = serializers.UUIDField()
     genre_id = serializers.UUIDField()
+    total_copies = serializers.IntegerField(min_value=1, default=1)
@@ -0,0 +1,19 @@
+from rest_framework import serializers
+
+
+class BookIdPageResponseSerializer(serializers.Serializer):
+    """Serializer for a keyset-paginated page of book IDs."""
+
+    results = serializers.ListField(child=serializers.UUIDField())
+    next = serializers.URLField(allow_null=True)
+    previous = serializers.URLField(allow_null=True)
+
+    @classmethod
+    def create_response(cls, book_ids, next_url, previous_url):
+        """Create a response instance with the given data."""
+        data = {
+            "results": book_ids,
+            "next": next_url,
+            "previous": previous_url,
+        }
+        return cls(data)
@@ -0,0 +1,21 @@
+from rest_framework import serializers
+
+from .enriched_book_response_serializer import EnrichedBookResponseSerializer
+
+
+class BookPageResponseSerializer(serializers.Serializer):
+    """Serializer for a keyset-paginated page of enriched books."""
+
+    results = EnrichedBookResponseSerializer(many=True)
+    next = serializers.URLField(allow_null=True)
+    previous = serializers.URLField(allow_null=True)
+
+    @classmethod
+    def create_response(cls, books, next_url, previous_url):
+        """Create a response instance with the given data."""
+        data = {
+            "results": books,
+            "next": next_url,
+            "previous": previous_url,
+        }
+        return cls(data)
@@ -12,5 +12,8 @@ class BookResponseSerializer(serializers.Serializer):
     author_id = serializers.UUIDField()
     publisher_id = serializers.UUIDField()
     genre_id = serializers.UUIDField(allow_null=True)
+    total_copies = serializers.IntegerField()
+    available_copies = serializers.IntegerField()
+    is_available = serializers.BooleanField()
     created_at = serializers.DateTimeField()
     updated_at = serializers.DateTimeField()
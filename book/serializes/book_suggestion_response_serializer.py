@@ -0,0 +1,19 @@
+from rest_framework import serializers
+
+from .book_suggestion_serializer import BookSuggestionSerializer
+
+
+class BookSuggestionResponseSerializer(serializers.Serializer):
+    """Serializer for the autocomplete suggestions of a prefix."""
+
+    prefix = serializers.CharField()
+    results = BookSuggestionSerializer(many=True)
+
+    @classmethod
+    def create_response(cls, prefix, suggestions):
+        """Create a response instance with the given data."""
+        data = {
+            "prefix": prefix,
+            "results": suggestions,
+        }
+        return cls(data)
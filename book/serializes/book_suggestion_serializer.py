@@ -0,0 +1,9 @@
+from rest_framework import serializers
+
+
+class BookSuggestionSerializer(serializers.Serializer):
+    """Serializer for one autocomplete suggestion."""
+
+    kind = serializers.ChoiceField(choices=["title", "author"])
+    id = serializers.UUIDField()
+    text = serializers.CharField()
@@ -18,5 +18,9 @@ class EnrichedBookResponseSerializer(serializers.Serializer):
     )
     publisher = PublisherResponseSerializer(allow_null=True)
     genre = GenreResponseSerializer(allow_null=True)
+    genres = GenreResponseSerializer(many=True)
+    total_copies = serializers.IntegerField()
+    available_copies = serializers.IntegerField()
+    is_available = serializers.BooleanField(source="is_available_for_borrowing")
     created_at = serializers.DateTimeField()
     updated_at = serializers.DateTimeField()
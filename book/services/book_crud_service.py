@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
@@ -7,6 +7,7 @@ from django.forms import ValidationError
 from book.entities.book_entity import BookEntity
 from book.use_cases.create_book_use_case import CreateBookUseCase
 from book.use_cases.get_book_use_case import GetBookUseCase
+from librarymanagementsystem.pagination import Page
 
 
 class BookCrudService:
@@ -37,6 +38,26 @@ class BookCrudService:
         except (ValueError, RuntimeError) as e:
             raise ValidationError(e)
 
+    def create_books_bulk(
+        self, books_data: List[Dict[str, Any]]
+    ) -> Tuple[List[BookEntity], List[Dict[str, Any]]]:
+        """
+        Create many books at once using the CreateBookUseCase.
+
+        Args:
+            books_data: List of dictionaries containing book information
+
+        Returns:
+            Tuple of the created book entities and per-item errors
+
+        Raises:
+            ValidationError: If the batch is empty or too large
+        """
+        try:
+            return self.create_book_use_case.execute_bulk(books_data)
+        except ValueError as e:
+            raise ValidationError(str(e))
+
     def get_book_by_id(self, book_id: str) -> Optional[BookEntity]:
         """
         Get a book by ID using the GetBookUseCase.
@@ -52,7 +73,44 @@ class BookCrudService:
         except ValueError as e:
             raise ValidationError(str(e))
 
-    def get_all_books(self) -> List[BookEntity]:
+    def get_book_for_update(self, book_id: str) -> Optional[BookEntity]:
+        """
+        Get a book by ID and lock its row using the GetBookUseCase.
+
+        Must be called inside transaction.atomic().
+
+        Args:
+            book_id: The book ID as string
+
+        Returns:
+            The locked book entity, or None if not found
+        """
+        try:
+            return self.get_book_use_case.get_book_for_update(book_id)
+        except ValueError as e:
+            raise ValidationError(str(e))
+
+    def get_books_by_ids(
+        self, book_ids: List[str]
+    ) -> Tuple[List[BookEntity], List[str]]:
+        """
+        Get many books by ID using the GetBookUseCase.
+
+        Args:
+            book_ids: The book IDs as strings
+
+        Returns:
+            Tuple of the found books and the missing IDs, both in request order
+
+        Raises:
+            ValidationError: If the IDs are missing, too many or malformed
+        """
+        try:
+            return self.get_book_use_case.get_books_by_ids(book_ids)
+        except ValueError as e:
+            raise ValidationError(str(e))
+
+    def get_all_books(self, include_details: bool = True) -> List[BookEntity]:
         """
         Get all books using the GetBookUseCase.
 
@@ -60,75 +118,239 @@ class BookCrudService:
             include_details: Whether to include author, publisher, and genre details
 
         Returns:
-            List of book dictionaries
-        """
-        return self.get_book_use_case.get_all_books()
-
-    # def get_books_by_author(self, author_id: str) -> List[Dict[str, Any]]:
-    #     """
-    #     Get all books by a specific author using the GetBookUseCase.
-
-    #     Args:
-    #         author_id: The author ID as string
-
-    #     Returns:
-    #         List of book dictionaries
-    #     """
-    #     try:
-    #         return self.get_book_use_case.get_books_by_author(author_id)
-    #     except (ValueError, RuntimeError) as e:
-    #         raise ValidationError(str(e))
-
-    # def get_books_by_publisher(self, publisher_id: str) -> List[Dict[str, Any]]:
-    #     """
-    #     Get all books by a specific publisher using the GetBookUseCase.
-
-    #     Args:
-    #         publisher_id: The publisher ID as string
-
-    #     Returns:
-    #         List of book dictionaries
-    #     """
-    #     try:
-    #         return self.get_book_use_case.get_books_by_publisher(publisher_id)
-    #     except (ValueError, RuntimeError) as e:
-    #         raise ValidationError(str(e))
-
-    # def search_books_by_title(self, title: str) -> List[Dict[str, Any]]:
-    #     """
-    #     Search books by title using the GetBookUseCase.
-
-    #     Args:
-    #         title: The title to search for
-
-    #     Returns:
-    #         List of matching book dictionaries
-    #     """
-    #     try:
-    #         return self.get_book_use_case.search_books_by_title(title)
-    #     except ValueError as e:
-    #         raise ValidationError(str(e))
-
-    # def get_classic_books(self) -> List[Dict[str, Any]]:
-    #     """
-    #     Get all classic books using the GetBookUseCase.
-
-    #     Returns:
-    #         List of classic book dictionaries
-    #     """
-    #     return self.get_book_use_case.get_classic_books()
-
-    # def get_books_by_genre(self, genre_id: str) -> List[Dict[str, Any]]:
-    #     """
-    #     Get all books in a specific genre using the GetBookUseCase.
-
-    #     Args:
-    #         genre_id: The genre ID as string
-
-    #     Returns:
-    #         List of book dictionaries
-    #     """
-    #     try:
-    #         return self.get_book_use_case.get_books_by_genre(genre_id)
-    #     except (ValueError, RuntimeError) as e:
-    #         raise ValidationError(str(e))
+            List of book entities
+        """
+        return self.get_book_use_case.get_all_books(include_details)
+
+    def get_books_page(
+        self, cursor: Optional[str] = None, page_size: Optional[int] = None
+    ) -> Page:
+        """
+        Get one keyset-paginated page of books using the GetBookUseCase.
+
+        Args:
+            cursor: Opaque cursor token from a previous page
+            page_size: Requested number of books per page
+
+        Returns:
+            Page of book entities with next and previous cursor tokens
+
+        Raises:
+            ValidationError: If the cursor or page size is invalid
+        """
+        try:
+            return self.get_book_use_case.get_books_page(cursor, page_size)
+        except ValueError as e:
+            raise ValidationError(str(e))
+
+    def search_books(
+        self,
+        query: str,
+        cursor: Optional[str] = None,
+        page_size: Optional[int] = None,
+    ) -> Page:
+        """
+        Search books using the GetBookUseCase.
+
+        Args:
+            query: The search text
+            cursor: Opaque cursor token from a previous page
+            page_size: Requested number of books per page
+
+        Returns:
+            Page of book entities, best match first, with next and previous cursor tokens
+
+        Raises:
+            ValidationError: If the query, cursor or page size is invalid
+        """
+        try:
+            return self.get_book_use_case.search_books(query, cursor, page_size)
+        except ValueError as e:
+            raise ValidationError(str(e))
+
+    def search_books_by_title(self, title: str) -> List[BookEntity]:
+        """
+        Search books by title using the GetBookUseCase.
+
+        Args:
+            title: The title to search for
+
+        Returns:
+            List of matching book entities, best match first
+
+        Raises:
+            ValidationError: If the title is empty
+        """
+        try:
+            return self.get_book_use_case.search_books_by_title(title)
+        except ValueError as e:
+            raise ValidationError(str(e))
+
+    def suggest(self, prefix: str, limit: Any = None) -> List[Dict[str, Any]]:
+        """
+        Suggest book titles and author names using the GetBookUseCase.
+
+        Args:
+            prefix: The text typed so far
+            limit: Maximum number of suggestions
+
+        Returns:
+            List of suggestion dictionaries in alphabetical order
+
+        Raises:
+            ValidationError: If the prefix or limit is invalid
+        """
+        try:
+            return self.get_book_use_case.suggest(prefix, limit)
+        except ValueError as e:
+            raise ValidationError(str(e))
+
+    def get_suggest_stats(self) -> Dict[str, Any]:
+        """
+        Get the autocomplete index counters using the GetBookUseCase.
+
+        Returns:
+            Dictionary of index statistics
+        """
+        return self.get_book_use_case.get_suggest_stats()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get the book cache counters using the GetBookUseCase.
+
+        Returns:
+            Dictionary of cache statistics
+        """
+        return self.get_book_use_case.get_cache_stats()
+
+    def export_books(self, chunk_size: int) -> Iterator[List[BookEntity]]:
+        """
+        Stream every book in chunks using the GetBookUseCase.
+
+        Args:
+            chunk_size: Number of books fetched from the database per round trip
+
+        Returns:
+            Iterator over lists of book entities
+
+        Raises:
+            ValidationError: If the chunk size is invalid
+        """
+        try:
+            return self.get_book_use_case.iter_book_chunks(chunk_size)
+        except ValueError as e:
+            raise ValidationError(str(e))
+
+    def get_books_by_author(
+        self,
+        author_id: str,
+        cursor: Optional[str] = None,
+        page_size: Optional[int] = None,
+        projection: Optional[str] = None,
+    ) -> Optional[Union[Page, int]]:
+        """
+        Get one page of the books by an author using the GetBookUseCase.
+
+        Args:
+            author_id: The author ID as string
+            cursor: Opaque cursor token from a previous page
+            page_size: Requested number of books per page
+            projection: "books" (default), "ids" or "count"
+
+        Returns:
+            Page of books or book IDs, or a count; None if the author does not exist
+
+        Raises:
+            ValidationError: If the author ID, cursor, page size or projection is invalid
+        """
+        try:
+            return self.get_book_use_case.get_books_by_author(
+                author_id, cursor, page_size, projection
+            )
+        except (ValueError, RuntimeError) as e:
+            raise ValidationError(str(e))
+
+    def get_books_by_publisher(
+        self,
+        publisher_id: str,
+        cursor: Optional[str] = None,
+        page_size: Optional[int] = None,
+        projection: Optional[str] = None,
+    ) -> Optional[Union[Page, int]]:
+        """
+        Get one page of the books by a publisher using the GetBookUseCase.
+
+        Args:
+            publisher_id: The publisher ID as string
+            cursor: Opaque cursor token from a previous page
+            page_size: Requested number of books per page
+            projection: "books" (default), "ids" or "count"
+
+        Returns:
+            Page of books or book IDs, or a count; None if the publisher does not exist
+
+        Raises:
+            ValidationError: If the publisher ID, cursor, page size or projection is invalid
+        """
+        try:
+            return self.get_book_use_case.get_books_by_publisher(
+                publisher_id, cursor, page_size, projection
+            )
+        except (ValueError, RuntimeError) as e:
+            raise ValidationError(str(e))
+
+    def get_classic_books(
+        self,
+        cursor: Optional[str] = None,
+        page_size: Optional[int] = None,
+        projection: Optional[str] = None,
+    ) -> Union[Page, int]:
+        """
+        Get one page of classic books using the GetBookUseCase.
+
+        Args:
+            cursor: Opaque cursor token from a previous page
+            page_size: Requested number of books per page
+            projection: "books" (default), "ids" or "count"
+
+        Returns:
+            Page of books or book IDs, or a count
+
+        Raises:
+            ValidationError: If the cursor, page size or projection is invalid
+        """
+        try:
+            return self.get_book_use_case.get_classic_books(
+                cursor, page_size, projection
+            )
+        except ValueError as e:
+            raise ValidationError(str(e))
+
+    def get_books_by_genre(
+        self,
+        genre_id: str,
+        cursor: Optional[str] = None,
+        page_size: Optional[int] = None,
+        projection: Optional[str] = None,
+    ) -> Optional[Union[Page, int]]:
+        """
+        Get one page of the books in a genre using the GetBookUseCase.
+
+        Args:
+            genre_id: The genre ID as string
+            cursor: Opaque cursor token from a previous page
+            page_size: Requested number of books per page
+            projection: "books" (default), "ids" or "count"
+
+        Returns:
+            Page of books or book IDs, or a count; None if the genre does not exist
+
+        Raises:
+            ValidationError: If the genre ID, cursor, page size or projection is invalid
+        """
+        try:
+            return self.get_book_use_case.get_books_by_genre(
+                genre_id, cursor, page_size, projection
+            )
+        except (ValueError, RuntimeError) as e:
+            raise ValidationError(str(e))
@@ -61,7 +61,12 @@ class GenreService:
             Dictionary with genre statistics
         """
         try:
-            genre = self.get_genre_entity(genre_id)
+            try:
+                genre = self.genre_repository.get_genre_entity_by_id(
+                    uuid.UUID(genre_id), with_book_count=True
+                )
+            except ValueError:
+                raise ValidationError(f"Invalid genre ID format: {genre_id}")
             if not genre:
                 raise ValidationError(f"Genre with ID {genre_id} not found")
 
@@ -75,7 +80,6 @@ class GenreService:
                 "is_non_fiction": genre.is_non_fiction(),
                 "category": genre.get_category(),
                 "display_name": genre.get_display_name(),
-                "book_ids": [str(book_id) for book_id in genre.book_ids],
             }
         except Exception as e:
             raise ValidationError(str(e))
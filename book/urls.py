@@ -5,6 +5,37 @@ from book.views import book_view
 
 urlpatterns = [
     path("", book_view.BookCreateAndGetView.as_view(), name="book_create_and_get"),
+    path("bulk/", book_view.BookBulkCreateView.as_view(), name="book_bulk_create"),
+    path("batch/", book_view.BookBatchView.as_view(), name="book_batch"),
+    path(
+        "by-author/<uuid:author_id>/",
+        book_view.BooksByAuthorView.as_view(),
+        name="books_by_author",
+    ),
+    path(
+        "by-publisher/<uuid:publisher_id>/",
+        book_view.BooksByPublisherView.as_view(),
+        name="books_by_publisher",
+    ),
+    path(
+        "by-genre/<uuid:genre_id>/",
+        book_view.BooksByGenreView.as_view(),
+        name="books_by_genre",
+    ),
+    path("classics/", book_view.ClassicBooksView.as_view(), name="book_classics"),
+    path("search/", book_view.BookSearchView.as_view(), name="book_search"),
+    path("suggest/", book_view.BookSuggestView.as_view(), name="book_suggest"),
+    path(
+        "suggest/stats/",
+        book_view.BookSuggestStatsView.as_view(),
+        name="book_suggest_stats",
+    ),
+    path(
+        "cache/stats/",
+        book_view.BookCacheStatsView.as_view(),
+        name="book_cache_stats",
+    ),
+    path("export/", book_view.BookExportView.as_view(), name="book_export"),
     path(
         "<uuid:book_id>/",
         book_view.BookCreateAndGetView.as_view(),
@@ -1,12 +1,16 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from django.db import transaction
+from django.conf import settings
+from django.db import IntegrityError, transaction
 
 from book.entities.author_entity import AuthorEntity
 from book.entities.book_entity import BookEntity
 from book.entities.genre_entity import GenreEntity
 from book.entities.publisher_entity import PublisherEntity
 from book.repositories.author_repository import AuthorAbstractRepository
+from book.repositories.book_autocomplete_repository import (
+    BookAutocompleteAbstractRepository,
+)
 from book.repositories.book_repository import BookAbstractRepository
 from book.repositories.genre_repository import GenreAbstractRepository
 from book.repositories.publisher_repository import PublisherAbstractRepository
@@ -21,11 +25,13 @@ class CreateBookUseCase:
         author_repository: AuthorAbstractRepository,
         publisher_repository: PublisherAbstractRepository,
         genre_repository: GenreAbstractRepository,
+        book_autocomplete: Optional[BookAutocompleteAbstractRepository] = None,
     ):
         self.book_repository = book_repository
         self.author_repository = author_repository
         self.publisher_repository = publisher_repository
         self.genre_repository = genre_repository
+        self.book_autocomplete = book_autocomplete
 
     def execute(self, book_data: Dict[str, Any]) -> BookEntity:
         """
@@ -38,7 +44,8 @@ class CreateBookUseCase:
             BookEntity: The created book entity
 
         Raises:
-            ValueError: If validation fails
+            ValueError: If validation fails, including when a concurrent
+                request created a book with the same ISBN after the check
             RuntimeError: If required entities don't exist
         """
         # Validate input data
@@ -73,17 +80,144 @@ class CreateBookUseCase:
             author=author,
             publisher=publisher,
             genre=genre,
+            total_copies=book_data.get("total_copies", 1),
         )
 
-        with transaction.atomic():
-            saved_book = self.book_repository.save_book(book_entity)
-            genre_model = self.genre_repository.entity_to_model(genre)
-            saved_book = self.book_repository.add_book_to_genre(
-                saved_book.id, genre_model
-            )
+        try:
+            with transaction.atomic():
+                saved_book = self.book_repository.save_book(book_entity)
+                genre_model = self.genre_repository.entity_to_model(genre)
+                saved_book = self.book_repository.add_book_to_genre(
+                    saved_book.id, genre_model
+                )
+                if self.book_autocomplete is not None:
+                    self.book_autocomplete.add_books([saved_book])
+        except IntegrityError:
+            # Another request created the ISBN between the check and the insert
+            if self.book_repository.get_book_by_isbn(book_entity.isbn) is None:
+                raise
+            raise ValueError(f"Book with ISBN {book_entity.isbn} already exists")
 
         return saved_book
 
+    def execute_bulk(
+        self, books_data: List[Dict[str, Any]]
+    ) -> Tuple[List[BookEntity], List[Dict[str, Any]]]:
+        """
+        Create many books at once.
+
+        References are resolved with one IN query per table and ISBN
+        collisions with one more, instead of four lookups per book. Valid books
+        are inserted with bulk_create in a single transaction; invalid ones are
+        reported and skipped. Books whose ISBN a concurrent request inserted
+        after the check are reported the same way, and the rest inserted again.
+
+        Args:
+            books_data: List of dictionaries containing book information
+
+        Returns:
+            Tuple of the created book entities and a list of
+            {"index": ..., "error": ...} dictionaries for rejected items
+
+        Raises:
+            ValueError: If the batch is empty or larger than
+                settings.BOOK_BULK_CREATE_MAX_ITEMS
+        """
+        if not books_data:
+            raise ValueError("At least one book is required")
+        if len(books_data) > settings.BOOK_BULK_CREATE_MAX_ITEMS:
+            raise ValueError(
+                f"Cannot create more than {settings.BOOK_BULK_CREATE_MAX_ITEMS} "
+                "books in one request"
+            )
+
+        authors = self.author_repository.get_author_entities_by_ids(
+            book_data["author_id"] for book_data in books_data
+        )
+        publishers = self.publisher_repository.get_publisher_entities_by_ids(
+            book_data["publisher_id"] for book_data in books_data
+        )
+        genres = self.genre_repository.get_genre_entities_by_ids(
+            book_data["genre_id"] for book_data in books_data
+        )
+        existing_isbns = self.book_repository.get_existing_isbns(
+            book_data["isbn"] for book_data in books_data
+        )
+
+        book_entities: List[BookEntity] = []
+        indexes: Dict[str, int] = {}
+        errors: List[Dict[str, Any]] = []
+        batch_isbns = set()
+        for index, book_data in enumerate(books_data):
+            isbn = BookEntity.normalize_isbn(book_data["isbn"])
+            try:
+                if isbn in batch_isbns:
+                    raise ValueError(f"Duplicate ISBN {isbn} in request")
+                if isbn in existing_isbns:
+                    raise ValueError(f"Book with ISBN {isbn} already exists")
+                author = authors.get(book_data["author_id"])
+                publisher = publishers.get(book_data["publisher_id"])
+                genre = genres.get(book_data["genre_id"])
+                self._validate_input_data(
+                    book=None, author=author, publisher=publisher, genre=genre
+                )
+                book_entity = BookEntity.create(
+                    title=book_data["title"],
+                    description=book_data["description"],
+                    published_date=book_data["published_date"],
+                    isbn=isbn,
+                    author=author,
+                    publisher=publisher,
+                    genre=genre,
+                    total_copies=book_data.get("total_copies", 1),
+                )
+            except (ValueError, RuntimeError) as e:
+                errors.append({"index": index, "error": str(e)})
+                continue
+
+            batch_isbns.add(isbn)
+            indexes[isbn] = index
+            book_entities.append(book_entity)
+
+        if not book_entities:
+            return book_entities, errors
+        try:
+            book_entities = self._bulk_save(book_entities)
+        except IntegrityError:
+            # Another request created some of the ISBNs after the check
+            taken = self.book_repository.get_existing_isbns(
+                book_entity.isbn for book_entity in book_entities
+            )
+            if not taken:
+                raise
+            errors.extend(
+                {
+                    "index": indexes[isbn],
+                    "error": f"Book with ISBN {isbn} already exists",
+                }
+                for isbn in taken
+            )
+            errors.sort(key=lambda error: error["index"])
+            book_entities = [
+                book_entity
+                for book_entity in book_entities
+                if book_entity.isbn not in taken
+            ]
+            if book_entities:
+                book_entities = self._bulk_save(book_entities)
+
+        return book_entities, errors
+
+    def _bulk_save(self, book_entities: List[BookEntity]) -> List[BookEntity]:
+        """Insert new books and index them, all or nothing."""
+        with transaction.atomic():
+            book_entities = self.book_repository.bulk_save_books(
+                book_entities, settings.BOOK_BULK_CREATE_BATCH_SIZE
+            )
+            if self.book_autocomplete is not None:
+                self.book_autocomplete.add_books(book_entities)
+        return book_entities
+
     def _validate_input_data(
         self,
         book: Optional[BookEntity],
@@ -1,15 +1,24 @@
 import uuid
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from datetime import date
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from django.conf import settings
 
 from book.entities.author_entity import AuthorEntity
 from book.entities.book_entity import BookEntity
 from book.entities.genre_entity import GenreEntity
 from book.entities.publisher_entity import PublisherEntity
 from book.repositories.author_repository import AuthorAbstractRepository
-from book.repositories.book_repository import BookAbstractRepository
+from book.repositories.book_autocomplete_repository import (
+    BookAutocompleteAbstractRepository,
+)
+from book.repositories.book_cache_repository import BookCacheAbstractRepository
+from book.repositories.book_repository import BookAbstractRepository, BookFilter
+from book.repositories.book_search_repository import BookSearchAbstractRepository
 from book.repositories.genre_repository import GenreAbstractRepository
 from book.repositories.publisher_repository import PublisherAbstractRepository
+from librarymanagementsystem.pagination import Page, decode_cursor, resolve_page_size
 
 
 class BookRepositoryInterface(ABC):
@@ -71,22 +80,41 @@ class GenreRepositoryInterface(ABC):
 class GetBookUseCase:
     """Use case for retrieving books."""
 
+    # Longest search query accepted, to keep query parsing and ranking cheap
+    max_search_query_length = 200
+
+    # Suggestions returned by default and at most per autocomplete lookup
+    default_suggestion_limit = 10
+    max_suggestion_limit = 50
+
+    # Shapes of a filtered book listing: full books, IDs only, or just a count
+    book_list_projections = ("books", "ids", "count")
+
     def __init__(
         self,
         book_repository: BookAbstractRepository,
         author_repository: AuthorAbstractRepository,
         publisher_repository: PublisherAbstractRepository,
         genre_repository: GenreAbstractRepository,
+        book_search_repository: BookSearchAbstractRepository,
+        book_autocomplete: BookAutocompleteAbstractRepository,
+        book_cache: Optional[BookCacheAbstractRepository] = None,
     ):
         self.book_repository = book_repository
         self.author_repository = author_repository
         self.publisher_repository = publisher_repository
         self.genre_repository = genre_repository
+        self.book_search_repository = book_search_repository
+        self.book_autocomplete = book_autocomplete
+        self.book_cache = book_cache
 
     def get_book_by_id(self, book_id: str) -> Optional[BookEntity]:
         """
         Get a book by ID with full details.
 
+        Reads through the book cache when one is configured; misses are loaded
+        from the repository and stored for the next request.
+
         Args:
             book_id: The book ID as string
 
@@ -98,13 +126,94 @@ class GetBookUseCase:
         except ValueError:
             raise ValueError(f"Invalid book ID format: {book_id}")
 
+        if self.book_cache is not None:
+            book_entity, cache_version = self.book_cache.get_book(book_uuid)
+            if book_entity is not None:
+                return book_entity
+
         book_entity = self.book_repository.get_book_by_id(book_uuid)
         if not book_entity:
             return None
 
+        if self.book_cache is not None:
+            self.book_cache.set_book(book_entity, cache_version)
+
         return book_entity
 
-    def get_all_books(self) -> List[BookEntity]:
+    def get_book_for_update(self, book_id: str) -> Optional[BookEntity]:
+        """
+        Get a book by ID and lock it for the rest of the current transaction.
+
+        Bypasses the book cache so callers see the committed row.
+
+        Args:
+            book_id: The book ID as string
+
+        Returns:
+            The locked book entity, or None if not found
+
+        Raises:
+            ValueError: If the book ID is not a valid UUID
+        """
+        try:
+            book_uuid = uuid.UUID(str(book_id))
+        except ValueError:
+            raise ValueError(f"Invalid book ID format: {book_id}")
+
+        return self.book_repository.get_book_for_update(book_uuid)
+
+    def get_books_by_ids(
+        self, book_ids: List[str]
+    ) -> Tuple[List[BookEntity], List[str]]:
+        """
+        Get many books by ID with full details in one round of queries.
+
+        Args:
+            book_ids: The book IDs as strings; repeated IDs are looked up once
+
+        Returns:
+            Tuple of the found books in request order and the IDs that were
+            not found, also in request order
+
+        Raises:
+            ValueError: If no IDs are given, too many are given or an ID is
+                not a valid UUID
+        """
+        if not book_ids:
+            raise ValueError("At least one book ID is required")
+        if len(book_ids) > settings.BOOK_BATCH_LOOKUP_MAX_ITEMS:
+            raise ValueError(
+                f"Cannot look up more than {settings.BOOK_BATCH_LOOKUP_MAX_ITEMS} "
+                "books in one request"
+            )
+
+        book_uuids = []
+        for book_id in book_ids:
+            try:
+                book_uuids.append(uuid.UUID(str(book_id)))
+            except ValueError:
+                raise ValueError(f"Invalid book ID format: {book_id}")
+        book_uuids = list(dict.fromkeys(book_uuids))
+
+        books = self.book_repository.get_books_by_ids(book_uuids)
+        found = [books[book_uuid] for book_uuid in book_uuids if book_uuid in books]
+        missing = [str(book_uuid) for book_uuid in book_uuids if book_uuid not in books]
+        return found, missing
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get the book cache counters.
+
+        Returns:
+            Dictionary with hits, misses, hit_ratio, invalidations and, when the
+            backend reports them, size, max_entries and evictions
+        """
+        if self.book_cache is None:
+            return {"enabled": False}
+
+        return {"enabled": True, **self.book_cache.get_stats()}
+
+    def get_all_books(self, include_details: bool = True) -> List[BookEntity]:
         """
         Get all books with optional details.
 
@@ -112,137 +221,320 @@ class GetBookUseCase:
             include_details: Whether to include author, publisher, and genre details
 
         Returns:
-            List of book dictionaries
-        """
-        return self.book_repository.get_all_books()
-
-    # def get_books_by_author(self, author_id: str) -> List[Dict[str, Any]]:
-    #     """
-    #     Get all books by a specific author.
-
-    #     Args:
-    #         author_id: The author ID as string
-
-    #     Returns:
-    #         List of book dictionaries
-    #     """
-    #     try:
-    #         author_uuid = uuid.UUID(author_id)
-    #     except ValueError:
-    #         raise ValueError(f"Invalid author ID format: {author_id}")
-
-    #     # Verify author exists
-    #     author = self.author_repository.get_author_entity_by_id(author_uuid)
-    #     if not author:
-    #         raise RuntimeError(f"Author with ID {author_id} not found")
-
-    #     book_entities = self.book_repository.get_books_by_author(author_uuid)
-    #     return [self._enrich_book_data(book) for book in book_entities]
-
-    # def get_books_by_publisher(self, publisher_id: str) -> List[Dict[str, Any]]:
-    #     """
-    #     Get all books by a specific publisher.
-
-    #     Args:
-    #         publisher_id: The publisher ID as string
-
-    #     Returns:
-    #         List of book dictionaries
-    #     """
-    #     try:
-    #         publisher_uuid = uuid.UUID(publisher_id)
-    #     except ValueError:
-    #         raise ValueError(f"Invalid publisher ID format: {publisher_id}")
-
-    #     # Verify publisher exists
-    #     publisher = self.publisher_repository.get_publisher_entity_by_id(publisher_uuid)
-    #     if not publisher:
-    #         raise RuntimeError(f"Publisher with ID {publisher_id} not found")
-
-    #     book_entities = self.book_repository.get_books_by_publisher(publisher_uuid)
-    #     return [self._enrich_book_data(book) for book in book_entities]
-
-    # def search_books_by_title(self, title: str) -> List[Dict[str, Any]]:
-    #     """
-    #     Search books by title.
-
-    #     Args:
-    #         title: The title to search for
-
-    #     Returns:
-    #         List of matching book dictionaries
-    #     """
-    #     if not title or not title.strip():
-    #         raise ValueError("Search title cannot be empty")
-
-    #     book_entities = self.book_repository.search_books_by_title(title.strip())
-    #     return [self._enrich_book_data(book) for book in book_entities]
-
-    # def get_classic_books(self) -> List[Dict[str, Any]]:
-    #     """
-    #     Get all classic books (older than 50 years).
-
-    #     Returns:
-    #         List of classic book dictionaries
-    #     """
-    #     all_books = self.book_repository.get_all_books()
-    #     classic_books = [book for book in all_books if book.is_classic()]
-    #     return [self._enrich_book_data(book) for book in classic_books]
-
-    # def get_books_by_genre(self, genre_id: str) -> List[Dict[str, Any]]:
-    #     """
-    #     Get all books in a specific genre.
-
-    #     Args:
-    #         genre_id: The genre ID as string
-
-    #     Returns:
-    #         List of book dictionaries
-    #     """
-    #     try:
-    #         genre_uuid = uuid.UUID(genre_id)
-    #     except ValueError:
-    #         raise ValueError(f"Invalid genre ID format: {genre_id}")
-
-    #     # Verify genre exists
-    #     genre = self.genre_repository.get_genre_entity_by_id(genre_uuid)
-    #     if not genre:
-    #         raise RuntimeError(f"Genre with ID {genre_id} not found")
-
-    #     all_books = self.book_repository.get_all_books()
-    #     genre_books = [book for book in all_books if book.genre_id == genre_uuid]
-    #     return [self._enrich_book_data(book) for book in genre_books]
-
-    # def _enrich_book_data(self, book_entity: BookEntity) -> Dict[str, Any]:
-    #     """
-    #     Enrich book data with related entity information.
-
-    #     Args:
-    #         book_entity: The book entity to enrich
-
-    #     Returns:
-    #         Dictionary with enriched book data
-    #     """
-    #     book_data = book_entity.to_dict()
-
-    #     # Add author details
-    #     author = self.author_repository.get_author_entity_by_id(book_entity.author_id)
-    #     if author:
-    #         book_data["author"] = author.to_dict()
-
-    #     # Add publisher details
-    #     publisher = self.publisher_repository.get_publisher_entity_by_id(
-    #         book_entity.publisher_id
-    #     )
-    #     if publisher:
-    #         book_data["publisher"] = publisher.to_dict()
-
-    #     # Add genre details
-    #     genres = []
-    #     if book_entity.genre_id:
-    #         genre = self.genre_repository.get_genre_entity_by_id(book_entity.genre_id)
-    #         if genre:
-    #             genres.append(genre.to_dict())
-    #     book_data["genres"] = genres
-
-    #     return book_data
+            List of book entities
+        """
+        return self.book_repository.get_all_books(include_details)
+
+    def get_books_page(
+        self, cursor: Optional[str] = None, page_size: Optional[int] = None
+    ) -> Page:
+        """
+        Get one page of books using keyset pagination on (created_at, id).
+
+        Args:
+            cursor: Opaque cursor token from a previous page, or None for the first page
+            page_size: Requested number of books, capped at settings.MAX_PAGE_SIZE
+
+        Returns:
+            Page of book entities with next and previous cursor tokens
+
+        Raises:
+            ValueError: If the cursor or page size is invalid
+        """
+        return self.book_repository.get_books_page(
+            decode_cursor(cursor), resolve_page_size(page_size)
+        )
+
+    def search_books(
+        self,
+        query: str,
+        cursor: Optional[str] = None,
+        page_size: Optional[int] = None,
+    ) -> Page:
+        """
+        Search books by title, author name and description.
+
+        Args:
+            query: The search text
+            cursor: Opaque cursor token from a previous page, or None for the first page
+            page_size: Requested number of books, capped at settings.MAX_PAGE_SIZE
+
+        Returns:
+            Page of book entities, best match first, with next and previous cursor tokens
+
+        Raises:
+            ValueError: If the query is empty or too long, or the cursor or page
+                size is invalid
+        """
+        query = (query or "").strip()
+        if not query:
+            raise ValueError("Search query cannot be empty")
+        if len(query) > self.max_search_query_length:
+            raise ValueError(
+                f"Search query cannot be longer than "
+                f"{self.max_search_query_length} characters"
+            )
+
+        return self.book_search_repository.search_books(
+            query, decode_cursor(cursor), resolve_page_size(page_size)
+        )
+
+    def search_books_by_title(self, title: str) -> List[BookEntity]:
+        """
+        Search books by title, returning the first page of best matches.
+
+        Args:
+            title: The title to search for
+
+        Returns:
+            List of matching book entities, best match first
+
+        Raises:
+            ValueError: If the title is empty
+        """
+        if not title or not title.strip():
+            raise ValueError("Search title cannot be empty")
+
+        return self.search_books(title).items
+
+    def suggest(self, prefix: str, limit: Any = None) -> List[Dict[str, Any]]:
+        """
+        Suggest book titles and author names starting with a prefix.
+
+        Served from the in-process autocomplete index without a database query.
+
+        Args:
+            prefix: The text typed so far
+            limit: Maximum number of suggestions, capped at max_suggestion_limit
+
+        Returns:
+            List of {"kind": "title" | "author", "id": ..., "text": ...}
+            dictionaries in alphabetical order
+
+        Raises:
+            ValueError: If the prefix is empty or the limit is not a positive integer
+        """
+        if not prefix or not prefix.strip():
+            raise ValueError("Prefix cannot be empty")
+
+        if limit in (None, ""):
+            limit = self.default_suggestion_limit
+        try:
+            limit = int(limit)
+        except (TypeError, ValueError):
+            raise ValueError("limit must be an integer")
+        if limit < 1:
+            raise ValueError("limit must be a positive integer")
+
+        return self.book_autocomplete.suggest(
+            prefix, min(limit, self.max_suggestion_limit)
+        )
+
+    def get_suggest_stats(self) -> Dict[str, Any]:
+        """
+        Get the autocomplete index counters.
+
+        Returns:
+            Dictionary with entries, authors, titles, memory_bytes,
+            build_seconds and age_seconds
+        """
+        return self.book_autocomplete.get_stats()
+
+    def iter_book_chunks(self, chunk_size: int) -> Iterator[List[BookEntity]]:
+        """
+        Stream every book in chunks for export.
+
+        Args:
+            chunk_size: Number of books fetched from the database per round trip
+
+        Returns:
+            Iterator over lists of book entities ordered by (created_at, id)
+
+        Raises:
+            ValueError: If the chunk size is not a positive integer
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+
+        return self.book_repository.iter_book_chunks(chunk_size)
+
+    def get_books_by_author(
+        self,
+        author_id: str,
+        cursor: Optional[str] = None,
+        page_size: Optional[int] = None,
+        projection: Optional[str] = None,
+    ) -> Optional[Union[Page, int]]:
+        """
+        Get one page of the books by an author, ordered by (created_at, id).
+
+        Args:
+            author_id: The author ID as string
+            cursor: Opaque cursor token from a previous page, or None for the first page
+            page_size: Requested number of books, capped at settings.MAX_PAGE_SIZE
+            projection: "books" (default), "ids" or "count"
+
+        Returns:
+            Page of book entities or book IDs, or the number of books for the
+            "count" projection; None if the author does not exist
+
+        Raises:
+            ValueError: If the author ID, cursor, page size or projection is invalid
+        """
+        author_uuid = self._parse_id(author_id, "author")
+        return self._list_books(
+            BookFilter(author_id=author_uuid),
+            cursor,
+            page_size,
+            projection,
+            exists=lambda: (
+                self.author_repository.get_author_entity_by_id(author_uuid) is not None
+            ),
+        )
+
+    def get_books_by_publisher(
+        self,
+        publisher_id: str,
+        cursor: Optional[str] = None,
+        page_size: Optional[int] = None,
+        projection: Optional[str] = None,
+    ) -> Optional[Union[Page, int]]:
+        """
+        Get one page of the books by a publisher, ordered by (created_at, id).
+
+        Args:
+            publisher_id: The publisher ID as string
+            cursor: Opaque cursor token from a previous page, or None for the first page
+            page_size: Requested number of books, capped at settings.MAX_PAGE_SIZE
+            projection: "books" (default), "ids" or "count"
+
+        Returns:
+            Page of book entities or book IDs, or the number of books for the
+            "count" projection; None if the publisher does not exist
+
+        Raises:
+            ValueError: If the publisher ID, cursor, page size or projection is invalid
+        """
+        publisher_uuid = self._parse_id(publisher_id, "publisher")
+        return self._list_books(
+            BookFilter(publisher_id=publisher_uuid),
+            cursor,
+            page_size,
+            projection,
+            exists=lambda: (
+                self.publisher_repository.get_publisher_entity_by_id(publisher_uuid)
+                is not None
+            ),
+        )
+
+    def get_books_by_genre(
+        self,
+        genre_id: str,
+        cursor: Optional[str] = None,
+        page_size: Optional[int] = None,
+        projection: Optional[str] = None,
+    ) -> Optional[Union[Page, int]]:
+        """
+        Get one page of the books in a genre, ordered by (created_at, id).
+
+        Args:
+            genre_id: The genre ID as string
+            cursor: Opaque cursor token from a previous page, or None for the first page
+            page_size: Requested number of books, capped at settings.MAX_PAGE_SIZE
+            projection: "books" (default), "ids" or "count"
+
+        Returns:
+            Page of book entities or book IDs, or the number of books for the
+            "count" projection; None if the genre does not exist
+
+        Raises:
+            ValueError: If the genre ID, cursor, page size or projection is invalid
+        """
+        genre_uuid = self._parse_id(genre_id, "genre")
+        return self._list_books(
+            BookFilter(genre_id=genre_uuid),
+            cursor,
+            page_size,
+            projection,
+            exists=lambda: (
+                self.genre_repository.get_genre_entity_by_id(genre_uuid) is not None
+            ),
+        )
+
+    def get_classic_books(
+        self,
+        cursor: Optional[str] = None,
+        page_size: Optional[int] = None,
+        projection: Optional[str] = None,
+    ) -> Union[Page, int]:
+        """
+        Get one page of classic books, ordered by (created_at, id).
+
+        A book is a classic when it was published in a calendar year at least
+        BookEntity.classic_age_years before the current one, as in
+        BookEntity.is_classic().
+
+        Args:
+            cursor: Opaque cursor token from a previous page, or None for the first page
+            page_size: Requested number of books, capped at settings.MAX_PAGE_SIZE
+            projection: "books" (default), "ids" or "count"
+
+        Returns:
+            Page of book entities or book IDs, or the number of classic books
+            for the "count" projection
+
+        Raises:
+            ValueError: If the cursor, page size or projection is invalid
+        """
+        first_recent_year = date.today().year - BookEntity.classic_age_years + 1
+        return self._list_books(
+            BookFilter(published_before=date(first_recent_year, 1, 1)),
+            cursor,
+            page_size,
+            projection,
+        )
+
+    def _parse_id(self, value: str, name: str) -> uuid.UUID:
+        """Parse an ID given as string, naming the entity in the error."""
+        try:
+            return uuid.UUID(str(value))
+        except ValueError:
+            raise ValueError(f"Invalid {name} ID format: {value}")
+
+    def _list_books(
+        self,
+        book_filter: BookFilter,
+        cursor: Optional[str],
+        page_size: Optional[int],
+        projection: Optional[str],
+        exists: Optional[Callable[[], bool]] = None,
+    ) -> Optional[Union[Page, int]]:
+        """
+        Read a filtered book listing in the requested projection.
+
+        The filtered-on entity is only looked up when the first page or the
+        count comes back empty, to tell an unknown ID apart from one with no
+        books without a second query on every call.
+        """
+        projection = projection or "books"
+        if projection not in self.book_list_projections:
+            raise ValueError(
+                "projection must be one of: " + ", ".join(self.book_list_projections)
+            )
+
+        if projection == "count":
+            result = self.book_repository.count_books(book_filter)
+            empty = result == 0
+        else:
+            decoded_cursor = decode_cursor(cursor)
+            get_page = (
+                self.book_repository.get_book_ids_page
+                if projection == "ids"
+                else self.book_repository.get_books_page
+            )
+            result = get_page(decoded_cursor, resolve_page_size(page_size), book_filter)
+            empty = not result.items and decoded_cursor is None
+
+        if empty and exists is not None and not exists():
+            return None
+        return result
@@ -1,18 +1,30 @@
-from typing import Any, Dict
+import csv
+import json
+from typing import Any, Dict, Iterable, Iterator, List
 
+from django.conf import settings
 from django.forms import ValidationError as DjangoValidationError
+from django.http import StreamingHttpResponse
 from rest_framework import serializers
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
 from rest_framework.views import APIView
 
+from book.entities.book_entity import BookEntity
 from book.serializes import (
+    BookBatchResponseSerializer,
+    BookBulkCreateResponseSerializer,
     BookCreateSerializer,
+    BookIdPageResponseSerializer,
+    BookPageResponseSerializer,
     BookResponseSerializer,
+    BookSuggestionResponseSerializer,
     EnrichedBookResponseSerializer,
 )
 from book.services.book_crud_service import BookCrudService
 from librarymanagementsystem.container import container
+from librarymanagementsystem.pagination import page_url
 
 
 class BookCreateAndGetView(APIView):
@@ -28,7 +40,9 @@ class BookCreateAndGetView(APIView):
 
         Returns:
             - If book_id provided: Single book with enriched data
-            - If no book_id: List of all books
+            - If no book_id: One keyset-paginated page of books. Accepts the
+              `cursor` and `page_size` query parameters and returns `next` and
+              `previous` links.
         """
         try:
             book_service: BookCrudService = container.book_container.book_service()
@@ -49,12 +63,20 @@ class BookCreateAndGetView(APIView):
                 response_serializer = EnrichedBookResponseSerializer(book_data)
                 return Response(response_serializer.data, status=200)
             else:
-                # Get all books (no validation or ISBN required)
-                books_data = book_service.get_all_books()
+                # Get one page of books
+                try:
+                    page = book_service.get_books_page(
+                        cursor=request.query_params.get("cursor"),
+                        page_size=request.query_params.get("page_size"),
+                    )
+                except DjangoValidationError as ve:
+                    return Response({"error": str(ve)}, status=400)
 
-                # Serialize list of enriched book data
-                response_serializer = EnrichedBookResponseSerializer(
-                    books_data, many=True
+                # Serialize the page of enriched book data
+                response_serializer = BookPageResponseSerializer.create_response(
+                    page.items,
+                    page_url(request, page.next_cursor),
+                    page_url(request, page.previous_cursor),
                 )
                 return Response(response_serializer.data, status=200)
 
@@ -82,3 +104,406 @@ class BookCreateAndGetView(APIView):
         # Serialize the response using BookResponseSerializer
         response_serializer = BookResponseSerializer(created_book.to_dict())
         return Response(response_serializer.data, status=201)
+
+
+class BookBulkCreateView(APIView):
+    permission_classes = [AllowAny]
+
+    def post(self, request):
+        """
+        POST method to create many books in one request.
+
+        Args:
+            request: The HTTP request with a body of the form {"books": [...]},
+                where each item has the same fields as a single book creation.
+
+        Returns:
+            201 with the created books and the rejected items (by index) if at
+            least one book was created, otherwise 400 with the rejected items.
+        """
+        books = request.data.get("books") if isinstance(request.data, dict) else None
+        if not isinstance(books, list) or not books:
+            return Response(
+                {"error": "Request body must contain a non-empty 'books' list"},
+                status=400,
+            )
+
+        # Field-level validation per item, so one bad item doesn't sink the batch
+        valid_indexes = []
+        valid_books = []
+        errors = []
+        for index, book in enumerate(books):
+            book_create_serializer = BookCreateSerializer(data=book)
+            if book_create_serializer.is_valid():
+                valid_indexes.append(index)
+                valid_books.append(book_create_serializer.validated_data)
+            else:
+                errors.append({"index": index, "error": book_create_serializer.errors})
+
+        created_books = []
+        if valid_books:
+            try:
+                book_service: BookCrudService = container.book_container.book_service()
+                created_books, book_errors = book_service.create_books_bulk(valid_books)
+            except DjangoValidationError as ve:
+                return Response({"error": str(ve)}, status=400)
+            except Exception as e:
+                return Response({"error": str(e)}, status=500)
+
+            # Map errors back to positions in the original request
+            errors += [
+                {"index": valid_indexes[error["index"]], "error": error["error"]}
+                for error in book_errors
+            ]
+
+        response_serializer = BookBulkCreateResponseSerializer.create_response(
+            created_books, errors
+        )
+        return Response(response_serializer.data, status=201 if created_books else 400)
+
+
+class BookBatchView(APIView):
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        """
+        GET method to fetch many books by ID.
+
+        Args:
+            request: The HTTP request with comma-separated book IDs in the
+                `ids` query parameter
+
+        Returns:
+            Same as POST.
+        """
+        ids = request.query_params.get("ids", "")
+        return self._lookup([book_id for book_id in ids.split(",") if book_id])
+
+    def post(self, request):
+        """
+        POST method to fetch many books by ID.
+
+        Args:
+            request: The HTTP request with a body of the form {"ids": [...]}
+
+        Returns:
+            The found books with enriched data in request order, plus the IDs
+            that do not exist; 400 if the IDs are missing, malformed or more
+            than settings.BOOK_BATCH_LOOKUP_MAX_ITEMS.
+        """
+        ids = request.data.get("ids") if isinstance(request.data, dict) else None
+        if not isinstance(ids, list):
+            return Response(
+                {"error": "Request body must contain an 'ids' list"}, status=400
+            )
+        return self._lookup(ids)
+
+    def _lookup(self, book_ids: List[Any]) -> Response:
+        try:
+            book_service: BookCrudService = container.book_container.book_service()
+            books, missing_ids = book_service.get_books_by_ids(book_ids)
+        except DjangoValidationError as ve:
+            return Response({"error": str(ve)}, status=400)
+        except Exception as e:
+            return Response({"error": str(e)}, status=500)
+
+        response_serializer = BookBatchResponseSerializer.create_response(
+            books, missing_ids
+        )
+        return Response(response_serializer.data, status=200)
+
+
+class BookFilteredListView(APIView):
+    """
+    Base for the book listings narrowed by author, publisher, genre or age.
+
+    Every listing accepts `cursor` and `page_size`, plus `projection`:
+    "books" (default) returns enriched books, "ids" only their IDs, and
+    "count" only {"count": n}. Subclasses name the BookCrudService method
+    that lists their books; it is called with the URL parameters as strings
+    followed by those options, and returns None when the filtered-on entity
+    does not exist.
+    """
+
+    permission_classes = [AllowAny]
+    service_method = ""
+    not_found_message = ""
+
+    def get(self, request, **kwargs):
+        """
+        GET method to list one page of the matching books.
+
+        Returns:
+            A keyset-paginated page of enriched books or book IDs with `next`
+            and `previous` links, or the number of matching books; 400 if a
+            parameter is invalid and 404 if the filtered-on entity does not exist.
+        """
+        projection = request.query_params.get("projection")
+        options = {
+            "cursor": request.query_params.get("cursor"),
+            "page_size": request.query_params.get("page_size"),
+            "projection": projection,
+        }
+        try:
+            book_service: BookCrudService = container.book_container.book_service()
+            list_books = getattr(book_service, self.service_method)
+            result = list_books(*(str(value) for value in kwargs.values()), **options)
+        except DjangoValidationError as ve:
+            return Response({"error": str(ve)}, status=400)
+        except Exception as e:
+            return Response({"error": str(e)}, status=500)
+
+        if result is None:
+            return Response(
+                {"error": self.not_found_message.format(*kwargs.values())},
+                status=404,
+            )
+        if projection == "count":
+            return Response({"count": result}, status=200)
+
+        serializer_class = (
+            BookIdPageResponseSerializer
+            if projection == "ids"
+            else BookPageResponseSerializer
+        )
+        response_serializer = serializer_class.create_response(
+            result.items,
+            page_url(request, result.next_cursor),
+            page_url(request, result.previous_cursor),
+        )
+        return Response(response_serializer.data, status=200)
+
+
+class BooksByAuthorView(BookFilteredListView):
+    service_method = "get_books_by_author"
+    not_found_message = "Author with ID {} not found"
+
+
+class BooksByPublisherView(BookFilteredListView):
+    service_method = "get_books_by_publisher"
+    not_found_message = "Publisher with ID {} not found"
+
+
+class BooksByGenreView(BookFilteredListView):
+    service_method = "get_books_by_genre"
+    not_found_message = "Genre with ID {} not found"
+
+
+class ClassicBooksView(BookFilteredListView):
+    service_method = "get_classic_books"
+
+
+class BookSearchView(APIView):
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        """
+        GET method to search books by title, author name and description.
+
+        Args:
+            request: The HTTP request with the search text in the `q` query
+                parameter, plus optional `cursor` and `page_size`
+
+        Returns:
+            One keyset-paginated page of enriched books, best match first, with
+            `next` and `previous` links; 400 if the query is missing or invalid.
+        """
+        try:
+            book_service: BookCrudService = container.book_container.book_service()
+            page = book_service.search_books(
+                request.query_params.get("q", ""),
+                cursor=request.query_params.get("cursor"),
+                page_size=request.query_params.get("page_size"),
+            )
+        except DjangoValidationError as ve:
+            return Response({"error": str(ve)}, status=400)
+        except Exception as e:
+            return Response({"error": str(e)}, status=500)
+
+        response_serializer = BookPageResponseSerializer.create_response(
+            page.items,
+            page_url(request, page.next_cursor),
+            page_url(request, page.previous_cursor),
+        )
+        return Response(response_serializer.data, status=200)
+
+
+class BookSuggestView(APIView):
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        """
+        GET method to suggest book titles and author names as the user types.
+
+        Args:
+            request: The HTTP request with the typed text in the `prefix` query
+                parameter and an optional `limit`
+
+        Returns:
+            The top matching titles and author names in alphabetical order,
+            answered from memory; 400 if the prefix is missing or the limit
+            is invalid.
+        """
+        prefix = request.query_params.get("prefix", "")
+        try:
+            book_service: BookCrudService = container.book_container.book_service()
+            suggestions = book_service.suggest(
+                prefix, request.query_params.get("limit")
+            )
+        except DjangoValidationError as ve:
+            return Response({"error": str(ve)}, status=400)
+        except Exception as e:
+            return Response({"error": str(e)}, status=500)
+
+        response_serializer = BookSuggestionResponseSerializer.create_response(
+            prefix, suggestions
+        )
+        return Response(response_serializer.data, status=200)
+
+
+class BookSuggestStatsView(APIView):
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        """
+        GET method to report the autocomplete index size and memory use.
+
+        Returns:
+            Entry counts, approximate memory in bytes, last build duration and
+            index age in seconds for this process.
+        """
+        try:
+            book_service: BookCrudService = container.book_container.book_service()
+            return Response(book_service.get_suggest_stats(), status=200)
+        except Exception as e:
+            return Response({"error": str(e)}, status=500)
+
+
+class BookCacheStatsView(APIView):
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        """
+        GET method to report book cache counters.
+
+        Returns:
+            Hits, misses, hit ratio and invalidations for this process, plus
+            size, capacity and evictions when the cache backend reports them.
+        """
+        try:
+            book_service: BookCrudService = container.book_container.book_service()
+            return Response(book_service.get_cache_stats(), status=200)
+        except Exception as e:
+            return Response({"error": str(e)}, status=500)
+
+
+EXPORT_CSV_COLUMNS = [
+    "id",
+    "title",
+    "description",
+    "published_date",
+    "isbn",
+    "author_id",
+    "author_name",
+    "publisher_id",
+    "publisher_name",
+    "genre_ids",
+    "genre_names",
+    "created_at",
+    "updated_at",
+]
+
+
+class _Echo:
+    """File-like object whose write() hands the line back to the caller."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def _serialize_chunks(
+    chunks: Iterable[List[BookEntity]],
+) -> Iterator[List[Dict[str, Any]]]:
+    """Serialize each chunk of entities into the enriched book response shape."""
+    for chunk in chunks:
+        yield EnrichedBookResponseSerializer(chunk, many=True).data
+
+
+def _ndjson_stream(chunks: Iterable[List[BookEntity]]) -> Iterator[str]:
+    """Yield one block of newline-delimited JSON per chunk of books."""
+    for rows in _serialize_chunks(chunks):
+        yield "".join(json.dumps(row, cls=JSONEncoder) + "\n" for row in rows)
+
+
+def _csv_stream(chunks: Iterable[List[BookEntity]]) -> Iterator[str]:
+    """Yield a header line, then one block of CSV lines per chunk of books."""
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_CSV_COLUMNS)
+    for rows in _serialize_chunks(chunks):
+        yield "".join(
+            writer.writerow(
+                [
+                    row["id"],
+                    row["title"],
+                    row["description"],
+                    row["published_date"],
+                    row["isbn"],
+                    row["author"]["id"] if row["author"] else "",
+                    row["author"]["name"] if row["author"] else "",
+                    row["publisher"]["id"] if row["publisher"] else "",
+                    row["publisher"]["name"] if row["publisher"] else "",
+                    ";".join(genre["id"] for genre in row["genres"]),
+                    ";".join(genre["name"] for genre in row["genres"]),
+                    row["created_at"],
+                    row["updated_at"],
+                ]
+            )
+            for row in rows
+        )
+
+
+class BookExportView(APIView):
+    permission_classes = [AllowAny]
+
+    # The `output` query parameter picks the format; `format` is reserved by
+    # DRF for renderer negotiation.
+    stream_formats = {
+        "ndjson": (_ndjson_stream, "application/x-ndjson"),
+        "csv": (_csv_stream, "text/csv"),
+    }
+
+    def get(self, request):
+        """
+        GET method to stream the full book catalog.
+
+        Args:
+            request: The HTTP request. `output` selects `ndjson` (default) or `csv`.
+
+        Returns:
+            StreamingHttpResponse with one record per book, in the same shape as
+            EnrichedBookResponseSerializer. Books are read from the database in
+            chunks of settings.BOOK_EXPORT_CHUNK_SIZE, so memory use does not
+            grow with the size of the catalog.
+        """
+        output = request.query_params.get("output", "ndjson")
+        if output not in self.stream_formats:
+            return Response(
+                {
+                    "error": f"Unsupported output format: {output}. "
+                    f"Use one of: {', '.join(self.stream_formats)}"
+                },
+                status=400,
+            )
+
+        try:
+            book_service: BookCrudService = container.book_container.book_service()
+            chunks = book_service.export_books(settings.BOOK_EXPORT_CHUNK_SIZE)
+        except DjangoValidationError as ve:
+            return Response({"error": str(ve)}, status=400)
+        except Exception as e:
+            return Response({"error": str(e)}, status=500)
+
+        stream, content_type = self.stream_formats[output]
+        response = StreamingHttpResponse(stream(chunks), content_type=content_type)
+        response["Content-Disposition"] = f'attachment; filename="books.{output}"'
+        return response
@@ -0,0 +1,23 @@
+from importlib import import_module
+
+import pytest
+from django.db import connection
+
+
+@pytest.fixture(scope="session")
+def django_db_setup(django_db_setup, django_db_blocker):  # noqa: ARG001
+    """
+    Add the database objects that only RunPython migrations create.
+
+    Tests and benchmarks run with --no-migrations, so the book search index
+    and its triggers are installed here from the migration that defines them.
+    """
+    book_search = import_module("book.migrations.0007_book_search")
+    with django_db_blocker.unblock(), connection.schema_editor() as schema_editor:
+        book_search.create_search_index(None, schema_editor)
+
+
+def pytest_runtest_setup(item):
+    """Skip tests marked postgresql when running on another database."""
+    if item.get_closest_marker("postgresql") and connection.vendor != "postgresql":
+        pytest.skip("needs a PostgreSQL database")
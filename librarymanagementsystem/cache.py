@@ -0,0 +1,37 @@
+from collections import Counter
+from typing import Any, Dict
+
+from django.core.cache.backends.locmem import LocMemCache
+
+# Eviction counts per cache LOCATION. Django builds one backend instance per
+# thread, so the count lives next to the shared store rather than on self.
+_evictions: Counter = Counter()
+
+
+class CountingLocMemCache(LocMemCache):
+    """
+    Local-memory LRU cache that also counts evictions.
+
+    LocMemCache keeps entries in recency order and culls the least recently
+    used ones once MAX_ENTRIES is reached; this subclass only records how many
+    entries each cull dropped. Counts are per process, like the cache itself.
+    """
+
+    def __init__(self, name, params):
+        super().__init__(name, params)
+        self._location = name
+
+    def _cull(self):
+        # Called by LocMemCache._set() with self._lock already held
+        size_before = len(self._cache)
+        super()._cull()
+        _evictions[self._location] += size_before - len(self._cache)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the current size, capacity and eviction count of the cache."""
+        with self._lock:
+            return {
+                "size": len(self._cache),
+                "max_entries": self._max_entries,
+                "evictions": _evictions[self._location],
+            }
@@ -30,5 +30,8 @@ container.wire(
 container.member_container.book_crud_service.override(
     container.book_container.book_service
 )
+container.member_container.book_inventory_repository.override(
+    container.book_container.book_inventory_repository
+)
 
 # Book app services
@@ -0,0 +1,140 @@
+from typing import Any, Callable, Dict, List, Tuple
+
+from django.db import NotSupportedError, connections, router
+from django.db.models import DateField, Func, IntegerField, QuerySet, Value
+from django.db.models.sql import UpdateQuery
+
+
+class AddDays(Func):
+    """
+    Shift a date expression by a whole number of days, keeping it a date.
+
+    PostgreSQL adds an integer to a date directly; SQLite goes through its
+    date() modifiers. Django's own `F(...) + timedelta(...)` returns a
+    datetime string on SQLite, which a DateField cannot read back.
+    """
+
+    arg_joiner = " + "
+    template = "(%(expressions)s)"
+    output_field = DateField()
+
+    def __init__(self, expression, days: int, **extra):
+        self.days = int(days)
+        super().__init__(expression, Value(self.days), **extra)
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        sql, params = compiler.compile(self.source_expressions[0])
+        return f"DATE({sql}, %s)", [*params, f"{self.days:+d} days"]
+
+
+class DaysBetween(Func):
+    """
+    Whole days from the start date expression to the end date expression.
+
+    PostgreSQL subtracts dates into an integer; SQLite compares Julian days.
+    """
+
+    arg_joiner = " - "
+    template = "(%(expressions)s)"
+    output_field = IntegerField()
+
+    def __init__(self, end, start, **extra):
+        super().__init__(end, start, **extra)
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        end_sql, end_params = compiler.compile(self.source_expressions[0])
+        start_sql, start_params = compiler.compile(self.source_expressions[1])
+        return (
+            f"CAST(JULIANDAY({end_sql}) - JULIANDAY({start_sql}) AS INTEGER)",
+            [*end_params, *start_params],
+        )
+
+
+def update_returning(queryset: QuerySet, **values: Any) -> List[Dict[str, Any]]:
+    """
+    Run `queryset.update(**values)` and return the updated rows.
+
+    The UPDATE carries a RETURNING clause, so conditional updates report the
+    rows they changed in the same round trip instead of a follow-up SELECT.
+    Rows come back as dicts keyed by field attname (e.g. "book_id"), with the
+    same Python types a regular query would produce.
+
+    Django 3.2 has no public UPDATE ... RETURNING, so the statement is built
+    from ORM internals. Each one is used by a single helper below, and
+    tests/test_integration/test_update_returning.py checks all of them, so an
+    upgrade that changes one fails there rather than at runtime.
+
+    Args:
+        queryset: The filtered queryset to update
+        **values: Field values or expressions, as for QuerySet.update()
+
+    Returns:
+        List of updated rows, in no particular order
+
+    Raises:
+        NotSupportedError: If the database has no UPDATE ... RETURNING
+    """
+    model = queryset.model
+    connection = _write_connection(queryset)
+    if connection.vendor not in ("postgresql", "sqlite"):
+        raise NotSupportedError(
+            f"UPDATE ... RETURNING is not supported on {connection.vendor}"
+        )
+
+    sql, params = _compile_update(queryset, values, connection)
+    if not sql:
+        return []
+
+    fields = model._meta.concrete_fields
+    returning = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+    with connection.cursor() as cursor:
+        cursor.execute(f"{sql} RETURNING {returning}", params)
+        rows = cursor.fetchall()
+
+    columns = [
+        (field.attname, *_select_converters(model, field, connection))
+        for field in fields
+    ]
+    results = []
+    for row in rows:
+        result = {}
+        for (attname, col, converters), value in zip(columns, row):
+            for converter in converters:
+                value = converter(value, col, connection)
+            result[attname] = value
+        results.append(result)
+    return results
+
+
+def _write_connection(queryset: QuerySet):
+    """The connection QuerySet.update() would write through (uses `_db`)."""
+    return connections[queryset._db or router.db_for_write(queryset.model)]
+
+
+def _compile_update(
+    queryset: QuerySet, values: Dict[str, Any], connection
+) -> Tuple[str, tuple]:
+    """
+    Compile the UPDATE that QuerySet.update() would run, without running it.
+
+    Mirrors QuerySet.update(): Query.chain(UpdateQuery), add_update_values()
+    and cleared annotations. Returns an empty SQL string when there is
+    nothing to update.
+    """
+    query = queryset.query.chain(UpdateQuery)
+    query.add_update_values(values)
+    query.annotations = {}
+    return query.get_compiler(connection=connection).as_sql()
+
+
+def _select_converters(model, field, connection) -> Tuple[Any, List[Callable]]:
+    """
+    The column and the converters a SELECT of `field` would apply.
+
+    Mirrors SQLCompiler.get_converters(): backend converters first, then the
+    field's own.
+    """
+    col = field.get_col(model._meta.db_table)
+    converters = connection.ops.get_db_converters(col)
+    converters += field.get_db_converters(connection)
+    return col, converters
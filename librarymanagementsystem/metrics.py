@@ -0,0 +1,200 @@
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from dependency_injector import providers
+from django.conf import settings
+
+# Upper bounds (seconds) of the latency histogram buckets; +Inf is implicit
+DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# (layer, operation), e.g. ("use_case", "CreateBookUseCase.execute")
+SeriesKey = Tuple[str, str]
+
+
+class MetricsRegistry:
+    """
+    In-process latency histograms and error counters, one series per operation.
+
+    Each series keeps a count per histogram bucket, the sum of durations and
+    the number of failed calls; `observe()` is a lock and a few additions.
+
+    With settings.METRICS_MULTIPROC_DIR set (gunicorn and other pre-fork
+    servers), every process also writes its series to metrics_<pid>.json in
+    that directory, at most every settings.METRICS_FLUSH_INTERVAL seconds and
+    on every scrape. Rendering sums the files of all processes, so whichever
+    worker answers /metrics reports the totals of the whole server. Files of
+    exited workers are kept, as their counts are part of those totals; empty
+    the directory when the server starts.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._series: Dict[SeriesKey, List[Any]] = {}
+        self._flushed_at = 0.0
+
+    def observe(self, layer: str, operation: str, seconds: float, error: bool = False):
+        """Record one call of an operation."""
+        with self._lock:
+            self._reset_if_forked()
+            series = self._series.get((layer, operation))
+            if series is None:
+                # [bucket counts (last one is +Inf), sum, count, errors]
+                series = [[0] * (len(DURATION_BUCKETS) + 1), 0.0, 0, 0]
+                self._series[(layer, operation)] = series
+            bucket = 0
+            while bucket < len(DURATION_BUCKETS) and seconds > DURATION_BUCKETS[bucket]:
+                bucket += 1
+            series[0][bucket] += 1
+            series[1] += seconds
+            series[2] += 1
+            if error:
+                series[3] += 1
+
+            directory = settings.METRICS_MULTIPROC_DIR
+            now = time.monotonic()
+            if directory and now - self._flushed_at >= settings.METRICS_FLUSH_INTERVAL:
+                self._flush(directory, now)
+
+    def timed(self, layer: str, operation: str) -> Callable:
+        """Decorator recording the duration of every call, and whether it raised."""
+
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                started = time.perf_counter()
+                error = True
+                try:
+                    result = func(*args, **kwargs)
+                    error = False
+                    return result
+                finally:
+                    self.observe(layer, operation, time.perf_counter() - started, error)
+
+            return wrapper
+
+        return decorator
+
+    def instrument(self, instance: Any, layer: str) -> Any:
+        """
+        Time every public method of an object, in place, and return the object.
+
+        Wrappers are set as instance attributes, so the object keeps its class
+        and calls between its own methods are measured too. Generator methods
+        are left alone: their call returns before any work is done.
+        """
+        cls = type(instance)
+        for name, member in inspect.getmembers(cls, inspect.isfunction):
+            if name.startswith("_") or inspect.isgeneratorfunction(member):
+                continue
+            method = getattr(instance, name)
+            operation = f"{cls.__name__}.{name}"
+            setattr(instance, name, self.timed(layer, operation)(method))
+        return instance
+
+    def collect(self) -> Dict[SeriesKey, List[Any]]:
+        """Get the series of this process, summed with other processes' files."""
+        with self._lock:
+            self._reset_if_forked()
+            directory = settings.METRICS_MULTIPROC_DIR
+            if not directory:
+                return {key: _copy(series) for key, series in self._series.items()}
+            self._flush(directory, time.monotonic())
+
+        totals: Dict[SeriesKey, List[Any]] = {}
+        for path in sorted(Path(directory).glob("metrics_*.json")):
+            try:
+                rows = json.loads(path.read_text())
+            except (OSError, ValueError):
+                # Being replaced by its process, or half-written by a crash
+                continue
+            for layer, operation, series in rows:
+                total = totals.setdefault(
+                    (layer, operation), [[0] * len(series[0]), 0.0, 0, 0]
+                )
+                for bucket, count in enumerate(series[0]):
+                    total[0][bucket] += count
+                for index in (1, 2, 3):
+                    total[index] += series[index]
+        return totals
+
+    def render(self) -> str:
+        """Render all series in the Prometheus text exposition format."""
+        series_by_key = sorted(self.collect().items())
+        lines = [
+            "# HELP lms_call_duration_seconds Duration of view, use case and"
+            " repository calls.",
+            "# TYPE lms_call_duration_seconds histogram",
+        ]
+        for (layer, operation), (buckets, total, count, _) in series_by_key:
+            labels = f'layer="{layer}",operation="{operation}"'
+            cumulative = 0
+            for bound, bucket_count in zip((*DURATION_BUCKETS, "+Inf"), buckets):
+                cumulative += bucket_count
+                lines.append(
+                    f'lms_call_duration_seconds_bucket{{{labels},le="{bound}"}}'
+                    f" {cumulative}"
+                )
+            lines.append(f"lms_call_duration_seconds_sum{{{labels}}} {total!r}")
+            lines.append(f"lms_call_duration_seconds_count{{{labels}}} {count}")
+
+        lines += [
+            "# HELP lms_call_errors_total Calls that raised, and views that"
+            " answered with a 5xx status.",
+            "# TYPE lms_call_errors_total counter",
+        ]
+        for (layer, operation), (_, _, _, errors) in series_by_key:
+            lines.append(
+                f'lms_call_errors_total{{layer="{layer}",operation="{operation}"}}'
+                f" {errors}"
+            )
+        return "\n".join(lines) + "\n"
+
+    def _reset_if_forked(self):
+        # A worker forked from a process that already recorded calls must not
+        # report them a second time under its own pid. Called with the lock held.
+        pid = os.getpid()
+        if pid != self._pid:
+            self._pid = pid
+            self._series = {}
+            self._flushed_at = 0.0
+
+    def _flush(self, directory: str, now: float):
+        # Called with the lock held; the rename makes the update atomic for readers
+        rows = [
+            [layer, operation, series]
+            for (layer, operation), series in self._series.items()
+        ]
+        path = Path(directory) / f"metrics_{self._pid}.json"
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(json.dumps(rows))
+        os.replace(temporary, path)
+        self._flushed_at = now
+
+
+def _copy(series: List[Any]) -> List[Any]:
+    return [list(series[0]), *series[1:]]
+
+
+# Process-wide registry fed by the container providers and the request middleware
+registry = MetricsRegistry()
+
+
+def instrumented(layer: str, provider: providers.Provider) -> providers.Singleton:
+    """
+    Wrap a singleton provider so that the object it provides reports metrics.
+
+    Args:
+        layer: Metric label for the object, e.g. "repository" or "use_case"
+        provider: The provider building the object
+
+    Returns:
+        Singleton provider of the same object with its public methods timed
+    """
+    return providers.Singleton(registry.instrument, provider, layer)
@@ -0,0 +1,191 @@
+import cProfile
+import logging
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+from librarymanagementsystem.metrics import registry
+from librarymanagementsystem.profiling import (
+    PROFILE_TOKEN_HEADER,
+    is_valid_profile_token,
+    profile_store,
+    profiling_enabled,
+)
+
+logger = logging.getLogger("librarymanagementsystem.requests")
+
+
+class QueryStats:
+    """Query count and time of one request, fed by a connection execute wrapper."""
+
+    __slots__ = ("_seen", "count", "duplicates", "seconds")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.duplicates = 0
+        self._seen = set()
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - started
+            self.count += 1
+            # The same parameterized SQL run twice in a request is usually an
+            # N+1 loop. Only the hash of each distinct statement is kept, not
+            # its text.
+            sql_hash = hash(sql)
+            if sql_hash in self._seen:
+                self.duplicates += 1
+            else:
+                self._seen.add(sql_hash)
+
+
+class QueryInstrumentationMiddleware:
+    """
+    Count and time the SQL queries of every request.
+
+    A `connection.execute_wrapper` is installed on each database connection
+    for the duration of the request, so per query the overhead is two clock
+    reads, a hash and a set lookup. The only state that grows with the request
+    is one integer hash per distinct SQL statement. The totals are sent
+    back in a `Server-Timing` header (db and total durations, visible in
+    browser dev tools) and logged as one key=value line on the
+    "librarymanagementsystem.requests" logger. Requests over
+    settings.REQUEST_QUERY_BUDGET queries or settings.REQUEST_LATENCY_BUDGET_MS
+    milliseconds are logged at WARNING with over_budget=true.
+
+    The request duration of class-based views also goes to the metrics
+    registry, as the "view" layer series of `<ViewClass>.<method>`.
+
+    Queries run while a streaming response is iterated happen after the
+    middleware has returned and are not counted.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        stats = QueryStats()
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(stats))
+            response = self.get_response(request)
+        total_seconds = time.perf_counter() - started
+        total_ms = total_seconds * 1000
+        db_ms = stats.seconds * 1000
+
+        response["Server-Timing"] = (
+            f'db;dur={db_ms:.1f};desc="{stats.count} queries", total;dur={total_ms:.1f}'
+        )
+
+        over_budget = (
+            stats.count > settings.REQUEST_QUERY_BUDGET
+            or total_ms > settings.REQUEST_LATENCY_BUDGET_MS
+        )
+        fields = {
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "duration_ms": round(total_ms, 1),
+            "queries": stats.count,
+            "duplicate_queries": stats.duplicates,
+            "db_ms": round(db_ms, 1),
+            "over_budget": over_budget,
+        }
+        level = logging.WARNING if over_budget else logging.INFO
+        if logger.isEnabledFor(level):
+            logger.log(
+                level,
+                " ".join(f"{key}={_format(value)}" for key, value in fields.items()),
+                extra={"request_metrics": fields},
+            )
+
+        match = request.resolver_match
+        view_class = getattr(match.func, "view_class", None) if match else None
+        if view_class is not None:
+            registry.observe(
+                "view",
+                f"{view_class.__name__}.{request.method.lower()}",
+                total_seconds,
+                error=response.status_code >= 500,
+            )
+        return response
+
+
+class ProfilingMiddleware:
+    """
+    Run single requests under cProfile, on demand.
+
+    A request is profiled when it carries a valid, unexpired X-Profile-Token
+    header (see `manage.py request_profiles token`), or when a staff user
+    adds `?profile` to the URL. Every other request only pays for the header
+    and query string lookups. The profile goes to the on-disk ring buffer of
+    librarymanagementsystem.profiling and its id is returned in the
+    X-Profile-Id response header; `manage.py request_profiles dump <id>`
+    prints it.
+
+    Off unless settings.PROFILING_ENABLED is set, which also requires
+    settings.PROFILING_SECRET; the server refuses to start with one and not
+    the other.
+
+    Listed last in MIDDLEWARE, so the profile covers the view dispatch and
+    not the rest of the middleware stack.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        profiling_enabled()
+
+    def __call__(self, request):
+        trigger = self._get_trigger(request)
+        if trigger is None:
+            return self.get_response(request)
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler is already active in this thread
+            return self.get_response(request)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            profiler.disable()
+        duration_ms = (time.perf_counter() - started) * 1000
+
+        response["X-Profile-Id"] = profile_store.save(
+            profiler,
+            {
+                "method": request.method,
+                "path": request.path,
+                "status": response.status_code,
+                "duration_ms": round(duration_ms, 1),
+                "trigger": trigger,
+            },
+        )
+        return response
+
+    def _get_trigger(self, request):
+        if not profiling_enabled():
+            return None
+        token = request.headers.get(PROFILE_TOKEN_HEADER)
+        if token:
+            return "token" if is_valid_profile_token(token) else None
+        if "profile" in request.GET:
+            user = getattr(request, "user", None)
+            if user is not None and user.is_staff:
+                return "staff"
+        return None
+
+
+def _format(value) -> str:
+    if isinstance(value, bool):
+        return str(value).lower()
+    return str(value)
@@ -0,0 +1,193 @@
+import base64
+import binascii
+import json
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Q, QuerySet
+from rest_framework.utils.urls import replace_query_param
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """Decoded keyset cursor pointing at the boundary row of a page."""
+
+    position: Tuple[Any, ...]
+    reverse: bool = False
+
+
+@dataclass
+class Page:
+    """A single page of keyset-paginated results."""
+
+    items: List[Any] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    previous_cursor: Optional[str] = None
+
+
+def _to_json(value: Any) -> Any:
+    """Convert a keyset value to a JSON-safe value without losing precision."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def encode_cursor(position: Sequence[Any], reverse: bool = False) -> str:
+    """Encode a keyset position into an opaque, URL-safe cursor token."""
+    payload = json.dumps(
+        {"p": [_to_json(value) for value in position], "r": reverse},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: Optional[str]) -> Optional[Cursor]:
+    """
+    Decode a cursor token produced by encode_cursor.
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    if not token:
+        return None
+
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        position = tuple(payload["p"])
+        reverse = bool(payload.get("r", False))
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise ValueError("Invalid cursor")
+
+    if not position:
+        raise ValueError("Invalid cursor")
+
+    return Cursor(position=position, reverse=reverse)
+
+
+def resolve_page_size(page_size: Any = None) -> int:
+    """
+    Resolve a requested page size against the configured default and maximum.
+
+    Raises:
+        ValueError: If the page size is not a positive integer
+    """
+    if page_size in (None, ""):
+        return settings.DEFAULT_PAGE_SIZE
+
+    try:
+        page_size = int(page_size)
+    except (TypeError, ValueError):
+        raise ValueError("page_size must be an integer")
+
+    if page_size < 1:
+        raise ValueError("page_size must be a positive integer")
+
+    return min(page_size, settings.MAX_PAGE_SIZE)
+
+
+def _keyset_q(
+    queryset: QuerySet,
+    fields: Sequence[str],
+    position: Sequence[Any],
+    descending: bool,
+) -> Q:
+    """Build the row-value comparison `(f1, f2, ...) > (v1, v2, ...)` as a Q."""
+    if len(position) != len(fields):
+        raise ValueError("Invalid cursor")
+
+    values = []
+    for field_name, value in zip(fields, position):
+        model_field = queryset.model._meta.get_field(field_name)
+        try:
+            values.append(model_field.to_python(value))
+        except (ValidationError, TypeError):
+            # Crafted tokens can carry any JSON value, not only strings
+            raise ValueError("Invalid cursor")
+
+    lookup = "lt" if descending else "gt"
+    condition = Q()
+    for index, field_name in enumerate(fields):
+        equal_prefix = {fields[i]: values[i] for i in range(index)}
+        condition |= Q(**equal_prefix, **{f"{field_name}__{lookup}": values[index]})
+    return condition
+
+
+def _position(row: Any, fields: Sequence[str]) -> Tuple[Any, ...]:
+    """Extract the keyset position from a model instance or a values() row."""
+    if isinstance(row, dict):
+        return tuple(row[field_name] for field_name in fields)
+    return tuple(getattr(row, field_name) for field_name in fields)
+
+
+def paginate(
+    queryset: QuerySet,
+    ordering: Sequence[str],
+    cursor: Optional[Cursor],
+    page_size: int,
+) -> Page:
+    """
+    Fetch one keyset page of a queryset.
+
+    The ordering must be unique (end with the primary key) and use a single
+    direction, e.g. ("created_at", "id") or ("-borrowing_date", "-id"). Only
+    page_size + 1 rows are read, so the cost of a page does not depend on how
+    deep into the result set it is.
+
+    Args:
+        queryset: The filtered queryset to paginate
+        ordering: Field names defining a total order over the queryset
+        cursor: Decoded cursor, or None for the first page
+        page_size: Maximum number of items on the page
+
+    Returns:
+        Page with model instances (or values() rows) and cursor tokens
+    """
+    descending = ordering[0].startswith("-")
+    fields = [field_name.lstrip("-") for field_name in ordering]
+    backwards = cursor is not None and cursor.reverse
+    scan_descending = descending != backwards
+
+    queryset = queryset.order_by(
+        *[("-" if scan_descending else "") + field_name for field_name in fields]
+    )
+    if cursor is not None:
+        queryset = queryset.filter(
+            _keyset_q(queryset, fields, cursor.position, scan_descending)
+        )
+
+    rows = list(queryset[: page_size + 1])
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    if backwards:
+        rows.reverse()
+
+    next_cursor = None
+    previous_cursor = None
+    if rows:
+        first = _position(rows[0], fields)
+        last = _position(rows[-1], fields)
+        if backwards:
+            next_cursor = encode_cursor(last)
+            if has_more:
+                previous_cursor = encode_cursor(first, reverse=True)
+        else:
+            if has_more:
+                next_cursor = encode_cursor(last)
+            if cursor is not None:
+                previous_cursor = encode_cursor(first, reverse=True)
+
+    return Page(items=rows, next_cursor=next_cursor, previous_cursor=previous_cursor)
+
+
+def page_url(request, cursor: Optional[str]) -> Optional[str]:
+    """Build the absolute URL of the page a cursor token points at."""
+    if cursor is None:
+        return None
+    return replace_query_param(request.build_absolute_uri(), "cursor", cursor)
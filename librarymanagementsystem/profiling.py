@@ -0,0 +1,156 @@
+import contextlib
+import cProfile
+import json
+import os
+import pstats
+import re
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signing import BadSignature, TimestampSigner
+
+# Request header carrying a token from `manage.py request_profiles token`
+PROFILE_TOKEN_HEADER = "X-Profile-Token"
+
+_SALT = "librarymanagementsystem.profiling"
+_TOKEN_VALUE = "profile"
+_PROFILE_ID = re.compile(r"^\d{8}T\d{12}-[0-9a-f]{8}$")
+
+
+def profiling_enabled() -> bool:
+    """
+    Check whether request profiling is turned on.
+
+    Raises:
+        ImproperlyConfigured: If it is turned on without settings.PROFILING_SECRET
+    """
+    if settings.PROFILING_ENABLED and not settings.PROFILING_SECRET:
+        raise ImproperlyConfigured(
+            "PROFILING_ENABLED requires PROFILING_SECRET to sign profile tokens"
+        )
+    return settings.PROFILING_ENABLED
+
+
+def _get_signer() -> TimestampSigner:
+    """
+    Get the signer of profile tokens.
+
+    Tokens are keyed with settings.PROFILING_SECRET rather than SECRET_KEY,
+    so whoever knows the Django key cannot mint them.
+
+    Raises:
+        ImproperlyConfigured: If settings.PROFILING_SECRET is not set
+    """
+    if not settings.PROFILING_SECRET:
+        raise ImproperlyConfigured("PROFILING_SECRET is not set")
+    return TimestampSigner(key=settings.PROFILING_SECRET, salt=_SALT)
+
+
+def make_profile_token() -> str:
+    """
+    Mint a token that turns on profiling for requests carrying it.
+
+    Raises:
+        ImproperlyConfigured: If settings.PROFILING_SECRET is not set
+    """
+    return _get_signer().sign(_TOKEN_VALUE)
+
+
+def is_valid_profile_token(token: str) -> bool:
+    """Check a profile token's signature and that it is not older than allowed."""
+    try:
+        value = _get_signer().unsign(token, max_age=settings.PROFILING_TOKEN_MAX_AGE)
+    except BadSignature:
+        return False
+    return value == _TOKEN_VALUE
+
+
+class ProfileStore:
+    """
+    Bounded on-disk ring buffer of request profiles.
+
+    Every profile is a `<id>.prof` file in pstats format (readable by
+    pstats, snakeviz and similar tools) next to a `<id>.json` file with the
+    request it was taken from. Ids start with the capture time, so sorting
+    them sorts profiles by age; once more than settings.PROFILING_MAX_PROFILES
+    are stored the oldest are deleted. The directory may be shared by
+    several worker processes.
+    """
+
+    @property
+    def directory(self) -> Path:
+        return Path(settings.PROFILING_DIR)
+
+    def save(self, profiler: cProfile.Profile, metadata: Dict[str, Any]) -> str:
+        """
+        Store a finished profile and drop the oldest ones over the limit.
+
+        Args:
+            profiler: The disabled profiler holding the capture
+            metadata: Details of the profiled request
+
+        Returns:
+            The id of the stored profile
+        """
+        created_at = datetime.now(timezone.utc)
+        profile_id = f"{created_at:%Y%m%dT%H%M%S%f}-{uuid.uuid4().hex[:8]}"
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        profiler.dump_stats(str(self.directory / f"{profile_id}.prof"))
+        metadata = {"id": profile_id, "created_at": created_at.isoformat(), **metadata}
+        temporary = self.directory / f"{profile_id}.json.tmp"
+        temporary.write_text(json.dumps(metadata))
+        os.replace(temporary, self.directory / f"{profile_id}.json")
+
+        self._trim()
+        return profile_id
+
+    def list_profiles(self) -> List[Dict[str, Any]]:
+        """Get the metadata of every stored profile, newest first."""
+        profiles = []
+        for path in sorted(self.directory.glob("*.json"), reverse=True):
+            try:
+                profiles.append(json.loads(path.read_text()))
+            except (OSError, ValueError):
+                # Trimmed by another process meanwhile
+                continue
+        return profiles
+
+    def get_path(self, profile_id: str) -> Path:
+        """
+        Get the pstats file of a stored profile.
+
+        Raises:
+            ValueError: If the id is malformed or the profile is gone
+        """
+        if not _PROFILE_ID.match(profile_id):
+            raise ValueError(f"Invalid profile id: {profile_id}")
+        path = self.directory / f"{profile_id}.prof"
+        if not path.exists():
+            raise ValueError(f"Profile {profile_id} not found")
+        return path
+
+    def get_stats(self, profile_id: str) -> pstats.Stats:
+        """
+        Load a stored profile for reporting.
+
+        Raises:
+            ValueError: If the id is malformed or the profile is gone
+        """
+        return pstats.Stats(str(self.get_path(profile_id)))
+
+    def _trim(self):
+        profile_ids = sorted(path.stem for path in self.directory.glob("*.prof"))
+        excess = len(profile_ids) - settings.PROFILING_MAX_PROFILES
+        for profile_id in profile_ids[: max(excess, 0)]:
+            for suffix in (".json", ".prof"):
+                # Another process may be trimming the same profiles
+                with contextlib.suppress(FileNotFoundError):
+                    (self.directory / f"{profile_id}{suffix}").unlink()
+
+
+profile_store = ProfileStore()
@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/3.2/ref/settings/
 """
 
 import os
+from decimal import Decimal
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -44,6 +45,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "librarymanagementsystem.middleware.QueryInstrumentationMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -51,6 +53,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "librarymanagementsystem.middleware.ProfilingMiddleware",
 ]
 
 ROOT_URLCONF = "librarymanagementsystem.urls"
@@ -131,6 +134,103 @@ STATIC_URL = "/static/"
 # https://docs.djangoproject.com/en/3.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+# Cache
+# https://docs.djangoproject.com/en/3.2/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    # Read-through cache of BookEntity objects for book detail reads. The
+    # local-memory backend is an LRU bounded by MAX_ENTRIES, which counts two
+    # keys per cached book (the entity and its version); point this alias at
+    # a shared backend (e.g. Redis/Memcached) to share it across processes.
+    "books": {
+        "BACKEND": "librarymanagementsystem.cache.CountingLocMemCache",
+        "LOCATION": "books",
+        "TIMEOUT": int(os.getenv("BOOK_CACHE_TIMEOUT", "300")),
+        "OPTIONS": {
+            "MAX_ENTRIES": int(os.getenv("BOOK_CACHE_MAX_ENTRIES", "10000")),
+        },
+    },
+}
+
+BOOK_CACHE_ALIAS = "books"
+
+# In-process title/author autocomplete index: seconds before it is rebuilt from
+# the database to pick up writes made by other processes (0 never rebuilds)
+BOOK_SUGGEST_MAX_AGE = int(os.getenv("BOOK_SUGGEST_MAX_AGE", "300"))
+
+# Matching books ranked per search query; when more books match, only this
+# many (in index order) are ranked and paged through
+BOOK_SEARCH_MAX_CANDIDATES = int(os.getenv("BOOK_SEARCH_MAX_CANDIDATES", "1000"))
+
+# Keyset (cursor) pagination for list endpoints
+DEFAULT_PAGE_SIZE = int(os.getenv("DEFAULT_PAGE_SIZE", "50"))
+MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", "200"))
+
+# Bulk book creation: rows per INSERT statement and books per request
+BOOK_BULK_CREATE_BATCH_SIZE = int(os.getenv("BOOK_BULK_CREATE_BATCH_SIZE", "500"))
+BOOK_BULK_CREATE_MAX_ITEMS = int(os.getenv("BOOK_BULK_CREATE_MAX_ITEMS", "5000"))
+
+# Books a single batch lookup request may ask for
+BOOK_BATCH_LOOKUP_MAX_ITEMS = int(os.getenv("BOOK_BATCH_LOOKUP_MAX_ITEMS", "300"))
+
+# Rows fetched per server-side cursor round trip by the streaming book export
+BOOK_EXPORT_CHUNK_SIZE = int(os.getenv("BOOK_EXPORT_CHUNK_SIZE", "500"))
+
+# Borrowings a single batch return request may close
+BORROWING_BATCH_RETURN_MAX_ITEMS = int(
+    os.getenv("BORROWING_BATCH_RETURN_MAX_ITEMS", "1000")
+)
+
+# Fine charged per day a borrowed book is overdue
+BORROWING_DAILY_FINE = Decimal(os.getenv("BORROWING_DAILY_FINE", "1.00"))
+
+# Rows read per keyset query when scanning overdue borrowings
+BORROWING_OVERDUE_CHUNK_SIZE = int(os.getenv("BORROWING_OVERDUE_CHUNK_SIZE", "1000"))
+
+# Per-request query budgets: requests over either one are logged as warnings
+REQUEST_QUERY_BUDGET = int(os.getenv("REQUEST_QUERY_BUDGET", "20"))
+REQUEST_LATENCY_BUDGET_MS = int(os.getenv("REQUEST_LATENCY_BUDGET_MS", "500"))
+
+# Metrics served at /metrics. Under a pre-fork server (gunicorn) point
+# METRICS_MULTIPROC_DIR at a directory shared by the workers, emptied at
+# startup, so every scrape reports the totals of all workers; each worker
+# writes its own counts there at most every METRICS_FLUSH_INTERVAL seconds
+METRICS_MULTIPROC_DIR = os.getenv("METRICS_MULTIPROC_DIR", "")
+METRICS_FLUSH_INTERVAL = int(os.getenv("METRICS_FLUSH_INTERVAL", "5"))
+
+# On-demand request profiling, off by default: requests with a valid
+# X-Profile-Token header (tokens expire after PROFILING_TOKEN_MAX_AGE seconds)
+# or a staff user's ?profile query parameter are profiled into a ring buffer
+# of the newest PROFILING_MAX_PROFILES captures in PROFILING_DIR. Tokens are
+# signed with PROFILING_SECRET, never with SECRET_KEY, and profiling cannot be
+# enabled without it
+PROFILING_ENABLED = bool(int(os.getenv("PROFILING_ENABLED", "0")))
+PROFILING_SECRET = os.getenv("PROFILING_SECRET", "")
+PROFILING_DIR = os.getenv("PROFILING_DIR", str(BASE_DIR / "profiles"))
+PROFILING_MAX_PROFILES = int(os.getenv("PROFILING_MAX_PROFILES", "20"))
+PROFILING_TOKEN_MAX_AGE = int(os.getenv("PROFILING_TOKEN_MAX_AGE", "3600"))
+
+# One line per request from QueryInstrumentationMiddleware; set
+# REQUEST_LOG_LEVEL=WARNING to only log requests over budget
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "librarymanagementsystem.requests": {
+            "handlers": ["console"],
+            "level": os.getenv("REQUEST_LOG_LEVEL", "INFO"),
+            "propagate": False,
+        },
+    },
+}
+
 REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.AllowAny",
@@ -17,8 +17,12 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import include, path
 
+from librarymanagementsystem.views import MetricsView
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/books/", include("book.urls")),
     path("api/members/", include("member.urls")),
+    # Prometheus scrapes the bare path, so no trailing slash here
+    path("metrics", MetricsView.as_view(), name="metrics"),
 ]
@@ -0,0 +1,16 @@
+from django.http import HttpResponse
+from rest_framework.permissions import AllowAny
+from rest_framework.views import APIView
+
+from librarymanagementsystem.metrics import registry
+
+
+class MetricsView(APIView):
+    """Serve the metrics registry in the Prometheus text exposition format."""
+
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        return HttpResponse(
+            registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8"
+        )
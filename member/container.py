@@ -1,6 +1,8 @@
 from dependency_injector import containers, providers
 
+from librarymanagementsystem.metrics import instrumented
 from member.repositories.borrowing_repository import BorrowingRepository
+from member.repositories.member_dashboard_repository import MemberDashboardRepository
 from member.repositories.member_repository import MemberRepository
 from member.services.member_service import MemberService
 from member.use_cases.borrow_book_use_case import BorrowBookUseCase
@@ -10,18 +12,30 @@ class MemberContainer(containers.DeclarativeContainer):
     """Member app container."""
 
     # Repositories
-    borrowing_repository = providers.Singleton(BorrowingRepository)
-    member_repository = providers.Singleton(MemberRepository)
+    borrowing_repository = instrumented(
+        "repository", providers.Singleton(BorrowingRepository)
+    )
+    member_repository = instrumented(
+        "repository", providers.Singleton(MemberRepository)
+    )
+    member_dashboard_repository = instrumented(
+        "repository", providers.Singleton(MemberDashboardRepository)
+    )
 
-    # Book repository will be injected from the main container
+    # Book service and inventory will be injected from the main container
     book_crud_service = providers.Dependency()
+    book_inventory_repository = providers.Dependency()
 
     # Use Cases
-    borrow_book_use_case = providers.Singleton(
-        BorrowBookUseCase,
-        member_repository=member_repository,
-        borrowing_repository=borrowing_repository,
-        book_crud_service=book_crud_service,
+    borrow_book_use_case = instrumented(
+        "use_case",
+        providers.Singleton(
+            BorrowBookUseCase,
+            member_repository=member_repository,
+            borrowing_repository=borrowing_repository,
+            book_crud_service=book_crud_service,
+            book_inventory_repository=book_inventory_repository,
+        ),
     )
 
     # Services
@@ -30,4 +44,5 @@ class MemberContainer(containers.DeclarativeContainer):
         borrowing_repository=borrowing_repository,
         member_repository=member_repository,
         borrow_book_use_case=borrow_book_use_case,
+        member_dashboard_repository=member_dashboard_repository,
     )
@@ -12,10 +12,22 @@ class BorrowingEntity:
     member_id: uuid.UUID
     borrowing_date: date
     returning_date: Optional[date] = None
+    due_date: Optional[date] = None
+    # Only set when the borrowing was loaded together with its book
+    book_title: Optional[str] = None
     id: uuid.UUID = field(default_factory=uuid.uuid4)
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
 
+    # Length of a loan, and how long into it and by how much it can be renewed
+    loan_days = 14
+    renewal_window_days = 7
+    renewal_days = 7
+
+    def __post_init__(self):
+        if self.due_date is None and self.borrowing_date:
+            self.due_date = self.borrowing_date + timedelta(days=self.loan_days)
+
     @classmethod
     def create(
         cls, book_id: uuid.UUID, member_id: uuid.UUID, borrowing_date: date
@@ -51,14 +63,16 @@ class BorrowingEntity:
         if self.is_returned():
             return False
 
-        max_borrowing_days = self._get_max_borrowing_days()
-        due_date = self.borrowing_date + timedelta(days=max_borrowing_days)
-        return date.today() > due_date
+        return date.today() > self.get_due_date()
 
     def get_due_date(self) -> date:
         """Get the due date for returning the book."""
+        return self.due_date
+
+    def is_renewed(self) -> bool:
+        """Check if the due date has been extended past the regular loan."""
         max_borrowing_days = self._get_max_borrowing_days()
-        return self.borrowing_date + timedelta(days=max_borrowing_days)
+        return self.due_date > self.borrowing_date + timedelta(days=max_borrowing_days)
 
     def get_days_overdue(self) -> int:
         """Get the number of days the book is overdue."""
@@ -79,7 +93,7 @@ class BorrowingEntity:
     def _get_max_borrowing_days(self) -> int:
         """Get the maximum number of days a book can be borrowed."""
         # Default borrowing period is 14 days
-        return 14
+        return self.loan_days
 
     def return_book(self, return_date: Optional[date] = None):
         """Mark the book as returned."""
@@ -129,20 +143,22 @@ class BorrowingEntity:
         if self.is_returned():
             return False
 
-        # Can only renew if not overdue and within first week
-        if self.is_overdue():
+        # Can only renew once, if not overdue and within first week
+        if self.is_overdue() or self.is_renewed():
             return False
 
         days_borrowed = self.get_borrowing_duration_days()
-        return days_borrowed <= 7
+        return days_borrowed <= self.renewal_window_days
 
-    def renew_borrowing(self, renewal_days: int = 7):
+    def renew_borrowing(self, renewal_days: Optional[int] = None):
         """Renew the borrowing for additional days."""
         if not self.can_be_renewed():
             raise ValueError("Borrowing cannot be renewed")
 
-        # Extend the borrowing date by renewal_days
-        self.borrowing_date = self.borrowing_date - timedelta(days=renewal_days)
+        # Extend the due date by renewal_days
+        if renewal_days is None:
+            renewal_days = self.renewal_days
+        self.due_date = self.due_date + timedelta(days=renewal_days)
         self.updated_at = datetime.now()
 
     def get_remaining_days(self) -> int:
@@ -159,6 +175,7 @@ class BorrowingEntity:
         return {
             "id": str(self.id),
             "book_id": str(self.book_id),
+            "book_title": self.book_title,
             "member_id": str(self.member_id),
             "borrowing_date": self.borrowing_date.isoformat(),
             "returning_date": self.returning_date.isoformat()
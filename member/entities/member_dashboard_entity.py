@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+from member.entities.borrowing_entity import BorrowingEntity
+from member.entities.member_entity import MemberEntity
+
+
+@dataclass
+class MemberDashboardEntity:
+    """Read model of a member with borrowing statistics and active borrowings."""
+
+    member: MemberEntity
+    stats: Dict[str, Any]
+    active_borrowings: List[BorrowingEntity] = field(default_factory=list)
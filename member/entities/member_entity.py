@@ -14,7 +14,10 @@ class MemberEntity:
     id: uuid.UUID = field(default_factory=uuid.uuid4)
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
-    borrowing_ids: List[uuid.UUID] = field(default_factory=list)
+    active_borrowing_ids: List[uuid.UUID] = field(default_factory=list)
+
+    # Members with more borrowings than this over their history are heavy borrowers
+    heavy_borrower_threshold = 10
 
     @classmethod
     def create(
@@ -101,31 +104,36 @@ class MemberEntity:
         """Get the member's initials."""
         return f"{self.first_name[0]}.{self.last_name[0]}."
 
-    def get_borrowing_count(self) -> int:
+    def get_active_borrowing_count(self) -> int:
         """Get the number of current borrowings."""
-        return len(self.borrowing_ids)
+        return len(self.active_borrowing_ids)
 
     def can_borrow_more_books(self, max_books: int = 5) -> bool:
         """Check if the member can borrow more books."""
-        return self.get_borrowing_count() < max_books
+        return self.get_active_borrowing_count() < max_books
 
     def is_active_borrower(self) -> bool:
         """Check if the member is an active borrower (has borrowed books)."""
-        return self.get_borrowing_count() > 0
+        return self.get_active_borrowing_count() > 0
+
+    def is_heavy_borrower(self, total_borrowings: int) -> bool:
+        """
+        Check if the member is a heavy borrower (has borrowed more than 10 books).
 
-    def is_heavy_borrower(self) -> bool:
-        """Check if the member is a heavy borrower (has borrowed more than 10 books)."""
-        return self.get_borrowing_count() > 10
+        The entity only holds the active borrowings, so the count over the
+        whole history is passed in.
+        """
+        return total_borrowings > self.heavy_borrower_threshold
 
     def add_borrowing(self, borrowing_id: uuid.UUID):
-        """Add a borrowing to this member."""
-        if borrowing_id not in self.borrowing_ids:
-            self.borrowing_ids.append(borrowing_id)
+        """Add an active borrowing to this member."""
+        if borrowing_id not in self.active_borrowing_ids:
+            self.active_borrowing_ids.append(borrowing_id)
 
     def remove_borrowing(self, borrowing_id: uuid.UUID):
-        """Remove a borrowing from this member."""
-        if borrowing_id in self.borrowing_ids:
-            self.borrowing_ids.remove(borrowing_id)
+        """Remove an active borrowing from this member."""
+        if borrowing_id in self.active_borrowing_ids:
+            self.active_borrowing_ids.remove(borrowing_id)
 
     def update_first_name(self, new_first_name: str):
         """Update the first name with validation."""
@@ -172,11 +180,12 @@ class MemberEntity:
             "is_minor": self.is_minor(),
             "is_senior": self.is_senior(),
             "is_adult": self.is_adult(),
-            "borrowing_ids": [str(borrowing_id) for borrowing_id in self.borrowing_ids],
-            "borrowing_count": self.get_borrowing_count(),
+            "active_borrowing_ids": [
+                str(borrowing_id) for borrowing_id in self.active_borrowing_ids
+            ],
+            "active_borrowing_count": self.get_active_borrowing_count(),
             "can_borrow_more": self.can_borrow_more_books(),
             "is_active_borrower": self.is_active_borrower(),
-            "is_heavy_borrower": self.is_heavy_borrower(),
             "membership_duration_days": self.get_membership_duration_days(),
             "is_long_term_member": self.is_long_term_member(),
         }
@@ -0,0 +1,149 @@
+import time
+import uuid
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from book.models.author import Author
+from book.models.book import Book
+from book.models.publisher import Publisher
+from member.entities.borrowing_entity import BorrowingEntity
+from member.models.borrowing_history import BorrowingHistory
+from member.models.member import Member
+from member.repositories.borrowing_repository import BorrowingRepository
+
+
+def _lazy_model_to_entity(borrowing_model: BorrowingHistory) -> BorrowingEntity:
+    """The previous hydration path, which followed both foreign keys."""
+    return BorrowingEntity(
+        id=borrowing_model.id,
+        book_id=borrowing_model.book.id,
+        member_id=borrowing_model.member.id,
+        borrowing_date=borrowing_model.borrowing_date,
+        returning_date=borrowing_model.returning_date,
+        due_date=borrowing_model.due_date,
+        created_at=borrowing_model.created_at,
+        updated_at=borrowing_model.updated_at,
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare how many borrowing entities per second each hydration path "
+        "builds when reading a member's active borrowings. Seeds its own rows "
+        "inside a transaction that is rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--borrowings",
+            type=int,
+            default=500,
+            help="Active borrowings seeded for the benchmark member.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Runs per path; the fastest one is reported.",
+        )
+
+    def handle(self, *args, **options):
+        if options["borrowings"] < 1 or options["repeat"] < 1:
+            raise CommandError("--borrowings and --repeat must be positive")
+
+        with transaction.atomic():
+            member_id = self._seed(options["borrowings"])
+            self._run(member_id, options["repeat"])
+            transaction.set_rollback(True)
+
+    def _seed(self, count: int) -> uuid.UUID:
+        author = Author.objects.create(name="Bench Author", birth_date=date(1970, 1, 1))
+        publisher = Publisher.objects.create(
+            name="Bench Publisher", website="https://bench.example.com"
+        )
+        books = Book.objects.bulk_create(
+            Book(
+                title=f"Bench Book {index}",
+                description="Seeded by benchmark_borrowing_hydration",
+                published_date=date(2000, 1, 1),
+                isbn=uuid.uuid4().hex[:13],
+                author=author,
+                publisher=publisher,
+            )
+            for index in range(count)
+        )
+        member = Member.objects.create(
+            id=uuid.uuid4(),
+            first_name="Bench",
+            last_name="Member",
+            birth_date=date(1990, 1, 1),
+        )
+        today = date.today()
+        BorrowingHistory.objects.bulk_create(
+            BorrowingHistory(
+                id=uuid.uuid4(),
+                book=book,
+                member=member,
+                borrowing_date=today,
+                due_date=today,
+            )
+            for book in books
+        )
+        return member.id
+
+    def _run(self, member_id: uuid.UUID, repeat: int):
+        repository = BorrowingRepository()
+
+        def active():
+            return BorrowingHistory.objects.filter(
+                member_id=member_id, returning_date__isnull=True
+            )
+
+        paths = {
+            "lazy FK (before)": lambda: [
+                _lazy_model_to_entity(borrowing_model) for borrowing_model in active()
+            ],
+            "model, FK ids": lambda: [
+                repository._model_to_entity(borrowing_model)
+                for borrowing_model in active()
+            ],
+            "values() rows": lambda: repository.get_active_borrowings_by_member_entity(
+                member_id
+            ),
+            "select_related(book)": lambda: (
+                repository.get_active_borrowings_by_member_entity(
+                    member_id, with_book=True
+                )
+            ),
+        }
+
+        self.stdout.write(
+            f"{'path':<22} {'entities':>9} {'queries':>8} {'seconds':>9} "
+            f"{'entities/s':>11}"
+        )
+        for name, build in paths.items():
+            best = None
+            for _ in range(repeat):
+                entities, queries, elapsed = self._measure(build)
+                best = elapsed if best is None else min(best, elapsed)
+            self.stdout.write(
+                f"{name:<22} {len(entities):>9} {queries:>8} {best:>9.4f} "
+                f"{len(entities) / best:>11.0f}"
+            )
+
+    def _measure(self, build):
+        """Run build() once, returning its result, query count and seconds."""
+        queries = 0
+
+        def count_query(execute, sql, params, many, context):
+            nonlocal queries
+            queries += 1
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(count_query):
+            started = time.perf_counter()
+            result = build()
+            elapsed = time.perf_counter() - started
+        return result, queries, elapsed
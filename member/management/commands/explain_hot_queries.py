@@ -0,0 +1,65 @@
+import uuid
+from datetime import date
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from book.models.book import Book
+from member.models.borrowing_history import BorrowingHistory
+
+
+class Command(BaseCommand):
+    help = (
+        "Print the query plans of the hot book and borrowing lookups. Run it "
+        "before and after applying migrations on a seeded database to compare "
+        "index usage."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--analyze",
+            action="store_true",
+            help="Execute the queries and report actual timings (PostgreSQL only).",
+        )
+
+    def handle(self, *args, **options):
+        explain_options = {}
+        if connection.vendor == "postgresql":
+            explain_options = {"analyze": options["analyze"], "buffers": True}
+        elif options["analyze"]:
+            self.stderr.write("--analyze is only supported on PostgreSQL; ignoring it.")
+
+        # Probe with real values when there is data so the planner sees
+        # representative selectivity.
+        book = Book.objects.only("id", "isbn").first()
+        borrowing = BorrowingHistory.objects.only("member_id", "book_id").first()
+        isbn = book.isbn if book else "0000000000000"
+        member_id = borrowing.member_id if borrowing else uuid.uuid4()
+        book_id = borrowing.book_id if borrowing else uuid.uuid4()
+
+        queries = {
+            "Book by ISBN (create, lookup)": Book.objects.filter(isbn=isbn),
+            "First book page (created_at, id)": Book.objects.order_by(
+                "created_at", "id"
+            )[:51],
+            "Active borrowings of a member": BorrowingHistory.objects.filter(
+                member_id=member_id, returning_date__isnull=True
+            ),
+            "Active borrowings of a book": BorrowingHistory.objects.filter(
+                book_id=book_id, returning_date__isnull=True
+            ),
+            "First history page of a member (-borrowing_date, -id)": (
+                BorrowingHistory.objects.filter(member_id=member_id).order_by(
+                    "-borrowing_date", "-id"
+                )[:51]
+            ),
+            "First overdue page (due_date, id)": BorrowingHistory.objects.filter(
+                returning_date__isnull=True, due_date__lt=date.today()
+            ).order_by("due_date", "id")[:51],
+        }
+
+        for title, queryset in queries.items():
+            self.stdout.write(self.style.MIGRATE_HEADING(title))
+            self.stdout.write(str(queryset.query))
+            self.stdout.write(queryset.explain(**explain_options))
+            self.stdout.write("")
@@ -0,0 +1,530 @@
+import io
+import random
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from itertools import accumulate, islice
+from typing import Any, Dict, Iterable, Iterator, List
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, models, transaction
+from django.db.models import Max
+from django.utils import timezone
+from faker import Faker
+
+from book.models.author import Author
+from book.models.book import Book
+from book.models.book_inventory import BookInventory
+from book.models.genre import Genre
+from book.models.publisher import Publisher
+from member.entities.borrowing_entity import BorrowingEntity
+from member.models.borrowing_history import BorrowingHistory
+from member.models.member import Member
+from member.use_cases.borrow_book_use_case import BorrowBookUseCase
+
+GENRE_NAMES = [
+    "Fantasy",
+    "Science Fiction",
+    "Mystery",
+    "Thriller",
+    "Romance",
+    "Horror",
+    "Historical Fiction",
+    "Literary Fiction",
+    "Young Adult",
+    "Children's",
+    "Biography",
+    "Memoir",
+    "History",
+    "Science",
+    "Philosophy",
+    "Poetry",
+    "Drama",
+    "Travel",
+    "Self-Help",
+    "Business",
+    "Cooking",
+    "Art",
+    "Religion",
+    "Psychology",
+    "Politics",
+    "Graphic Novel",
+    "Adventure",
+    "Crime",
+    "Classics",
+    "Humor",
+]
+
+# Faker output is drawn into pools once; rows pick from them with the seeded
+# generator, as calling Faker per row would dominate the run time
+TEXT_POOL_SIZE = 5_000
+
+# Borrowings this many days old or newer may still be active
+LOAN_DAYS = 21
+
+# Share of the books that are bestsellers and get extra copies
+BESTSELLER_SHARE = 0.01
+
+# Numbers available between the 978 prefix and the check digit of an ISBN-13
+ISBN_NUMBERS = 10**9
+
+# Rows are dicts keyed by field attname (e.g. "author_id")
+Row = Dict[str, Any]
+
+
+class BulkCreateWriter:
+    """Write rows with bulk_create, one INSERT per batch; works on any database."""
+
+    def __init__(self, batch_size: int):
+        self.batch_size = batch_size
+
+    def write(self, model, rows: Iterable[Row]) -> int:
+        count = 0
+        for batch in _batched(rows, self.batch_size):
+            model.objects.bulk_create([model(**row) for row in batch])
+            count += len(batch)
+        return count
+
+
+class CopyWriter:
+    """
+    Write rows with PostgreSQL COPY FROM STDIN, one COPY per batch.
+
+    COPY skips per-statement parsing and planning and is several times faster
+    than multi-row INSERTs on large tables. auto_now fields are not applied,
+    so rows must carry every column except auto-increment keys.
+    """
+
+    def __init__(self, batch_size: int):
+        self.batch_size = batch_size
+
+    def write(self, model, rows: Iterable[Row]) -> int:
+        fields = [
+            field
+            for field in model._meta.concrete_fields
+            if not isinstance(field, models.AutoField)
+        ]
+        quote_name = connection.ops.quote_name
+        sql = (
+            f"COPY {quote_name(model._meta.db_table)} "
+            f"({', '.join(quote_name(field.column) for field in fields)}) FROM STDIN"
+        )
+        count = 0
+        for batch in _batched(rows, self.batch_size):
+            buffer = io.StringIO()
+            for row in batch:
+                buffer.write(
+                    "\t".join(_copy_value(row[field.attname]) for field in fields)
+                )
+                buffer.write("\n")
+            buffer.seek(0)
+            with connection.cursor() as cursor:
+                cursor.copy_expert(sql, buffer)
+            count += len(batch)
+        return count
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a large, realistic library for load testing: Faker names and "
+        "texts, Zipf-distributed book popularity and member activity, books in "
+        "several genres and long borrowing histories. The same --seed always "
+        "produces the same rows, with dates relative to today. Uses COPY on "
+        "PostgreSQL and bulk_create elsewhere."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--books", type=int, default=10_000)
+        parser.add_argument("--members", type=int, default=1_000)
+        parser.add_argument("--borrowings", type=int, default=100_000)
+        parser.add_argument(
+            "--authors", type=int, default=None, help="Default: one per 20 books."
+        )
+        parser.add_argument(
+            "--publishers", type=int, default=None, help="Default: one per 500 books."
+        )
+        parser.add_argument("--genres", type=int, default=len(GENRE_NAMES))
+        parser.add_argument(
+            "--max-genres-per-book",
+            type=int,
+            default=3,
+            help="Books get 1 to this many genres, fewer being likelier.",
+        )
+        parser.add_argument(
+            "--book-skew",
+            type=float,
+            default=1.1,
+            help="Zipf exponent of book popularity (0 is uniform).",
+        )
+        parser.add_argument(
+            "--member-skew",
+            type=float,
+            default=0.8,
+            help="Zipf exponent of member activity (0 is uniform).",
+        )
+        parser.add_argument(
+            "--history-days",
+            type=int,
+            default=5 * 365,
+            help="Borrowings are spread over this many days up to today.",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--batch-size", type=int, default=10_000)
+        parser.add_argument(
+            "--method",
+            choices=["auto", "bulk", "copy"],
+            default="auto",
+            help="auto uses COPY on PostgreSQL and bulk_create elsewhere.",
+        )
+        parser.add_argument(
+            "--clear",
+            action="store_true",
+            help="Delete all library data first.",
+        )
+
+    def handle(self, *args, **options):
+        books, members = options["books"], options["members"]
+        if books < 1 or members < 1 or options["borrowings"] < 0:
+            raise CommandError("--books and --members must be positive")
+        if options["batch_size"] < 1 or options["max_genres_per_book"] < 1:
+            raise CommandError(
+                "--batch-size and --max-genres-per-book must be positive"
+            )
+
+        method = options["method"]
+        if method == "auto":
+            method = "copy" if connection.vendor == "postgresql" else "bulk"
+        if method == "copy" and connection.vendor != "postgresql":
+            raise CommandError("--method copy needs PostgreSQL")
+        writer_class = CopyWriter if method == "copy" else BulkCreateWriter
+        self.writer = writer_class(options["batch_size"])
+
+        self.rng = random.Random(options["seed"])
+        self.fake = Faker()
+        self.fake.seed_instance(options["seed"])
+        self.now = timezone.now()
+
+        started = time.perf_counter()
+        with transaction.atomic():
+            if options["clear"]:
+                self._clear()
+            author_ids = self._authors(options["authors"] or max(books // 20, 1))
+            publisher_ids = self._publishers(
+                options["publishers"] or max(books // 500, 1)
+            )
+            genre_ids = self._genres(options["genres"])
+            book_ids = self._books(books, author_ids, publisher_ids)
+            self._book_genres(book_ids, genre_ids, options["max_genres_per_book"])
+            member_ids = self._members(members)
+            copies = self._copies(book_ids)
+            active_per_book = self._borrowings(
+                options["borrowings"],
+                book_ids,
+                member_ids,
+                copies,
+                options,
+            )
+            self._inventory(book_ids, copies, active_per_book)
+        self.stdout.write(
+            f"Done in {time.perf_counter() - started:.1f}s using {method}"
+        )
+
+    def _clear(self):
+        for model in (
+            BorrowingHistory,
+            BookInventory,
+            Genre.books.through,
+            Book,
+            Genre,
+            Author,
+            Publisher,
+            Member,
+        ):
+            model.objects.all().delete()
+
+    def _write(self, label: str, model, rows: Iterable[Row]):
+        started = time.perf_counter()
+        count = self.writer.write(model, rows)
+        self.stdout.write(
+            f"{label:<12} {count:>11,} rows {time.perf_counter() - started:>8.1f}s"
+        )
+
+    def _new_id(self) -> uuid.UUID:
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def _authors(self, count: int) -> List[uuid.UUID]:
+        ids = [self._new_id() for _ in range(count)]
+
+        def rows():
+            for author_id in ids:
+                birth_date = self.fake.date_between(date(1800, 1, 1), date(2000, 1, 1))
+                died = birth_date.year < 1930 or self.rng.random() < 0.1
+                yield {
+                    "id": author_id,
+                    "name": self.fake.name(),
+                    "birth_date": birth_date,
+                    "death_date": birth_date
+                    + timedelta(days=self.rng.randrange(30 * 365, 95 * 365))
+                    if died
+                    else None,
+                    **self._timestamps(),
+                }
+
+        self._write("authors", Author, rows())
+        return ids
+
+    def _publishers(self, count: int) -> List[uuid.UUID]:
+        ids = [self._new_id() for _ in range(count)]
+        rows = (
+            {
+                "id": publisher_id,
+                "name": self.fake.company()[:100],
+                "website": self.fake.url(),
+                **self._timestamps(),
+            }
+            for publisher_id in ids
+        )
+        self._write("publishers", Publisher, rows)
+        return ids
+
+    def _genres(self, count: int) -> List[uuid.UUID]:
+        ids = [self._new_id() for _ in range(count)]
+        rows = (
+            {
+                "id": genre_id,
+                "name": GENRE_NAMES[index % len(GENRE_NAMES)]
+                + (
+                    f" {index // len(GENRE_NAMES) + 1}"
+                    if index >= len(GENRE_NAMES)
+                    else ""
+                ),
+                **self._timestamps(),
+            }
+            for index, genre_id in enumerate(ids)
+        )
+        self._write("genres", Genre, rows)
+        return ids
+
+    def _books(
+        self,
+        count: int,
+        author_ids: List[uuid.UUID],
+        publisher_ids: List[uuid.UUID],
+    ) -> List[uuid.UUID]:
+        ids = [self._new_id() for _ in range(count)]
+        titles = [
+            self.fake.sentence(nb_words=self.rng.randint(1, 6))
+            .rstrip(".")
+            .title()[:100]
+            for _ in range(min(count, TEXT_POOL_SIZE))
+        ]
+        descriptions = [
+            self.fake.paragraph(nb_sentences=4)
+            for _ in range(min(count, TEXT_POOL_SIZE))
+        ]
+        first_isbn = _next_isbn_number()
+        if first_isbn + count > ISBN_NUMBERS:
+            raise CommandError("Not enough 978 ISBNs left after the existing books")
+        rng = self.rng
+
+        def rows():
+            for index, book_id in enumerate(ids):
+                yield {
+                    "id": book_id,
+                    "title": rng.choice(titles),
+                    "description": rng.choice(descriptions),
+                    "published_date": date(1850, 1, 1)
+                    + timedelta(days=rng.randrange(63_000)),
+                    "isbn": _isbn13(first_isbn + index),
+                    "author_id": rng.choice(author_ids),
+                    "publisher_id": rng.choice(publisher_ids),
+                    **self._timestamps(),
+                }
+
+        self._write("books", Book, rows())
+        return ids
+
+    def _book_genres(
+        self, book_ids: List[uuid.UUID], genre_ids: List[uuid.UUID], max_genres: int
+    ):
+        max_genres = min(max_genres, len(genre_ids))
+        # One genre is likeliest, each extra genre half as likely as the previous
+        genre_counts = list(range(1, max_genres + 1))
+        weights = [2.0**-index for index in range(max_genres)]
+        rng = self.rng
+
+        def rows():
+            for book_id in book_ids:
+                (count,) = rng.choices(genre_counts, weights=weights)
+                for genre_id in rng.sample(genre_ids, count):
+                    yield {"genre_id": genre_id, "book_id": book_id}
+
+        self._write("book genres", Genre.books.through, rows())
+
+    def _members(self, count: int) -> List[uuid.UUID]:
+        ids = [self._new_id() for _ in range(count)]
+        rows = (
+            {
+                "id": member_id,
+                "first_name": self.fake.first_name(),
+                "last_name": self.fake.last_name(),
+                "birth_date": self.fake.date_of_birth(minimum_age=8, maximum_age=90),
+                **self._timestamps(),
+            }
+            for member_id in ids
+        )
+        self._write("members", Member, rows)
+        return ids
+
+    def _copies(self, book_ids: List[uuid.UUID]) -> List[int]:
+        return [
+            self.rng.randint(1, 3) + (3 if self.rng.random() < BESTSELLER_SHARE else 0)
+            for _ in book_ids
+        ]
+
+    def _borrowings(
+        self,
+        count: int,
+        book_ids: List[uuid.UUID],
+        member_ids: List[uuid.UUID],
+        copies: List[int],
+        options: Dict[str, Any],
+    ) -> List[int]:
+        """
+        Write `count` borrowings and return the active borrowings per book.
+
+        Books and members are drawn from Zipf distributions, so a few books
+        are borrowed constantly and a few members have very long histories.
+        Recent borrowings stay active when the member's limit, the book's
+        copies and one-copy-per-member allow it; the rest are returned.
+        """
+        rng = self.rng
+        book_weights = _zipf_cum_weights(len(book_ids), options["book_skew"], rng)
+        member_weights = _zipf_cum_weights(len(member_ids), options["member_skew"], rng)
+        book_indexes = range(len(book_ids))
+        member_indexes = range(len(member_ids))
+        history_days = max(options["history_days"], 1)
+        today = self.now.date()
+        max_active = BorrowBookUseCase.max_active_borrowings
+        loan_period = timedelta(days=BorrowingEntity.loan_days)
+
+        active_per_book = [0] * len(book_ids)
+        active_per_member: Dict[int, int] = {}
+        active_pairs = set()
+
+        def rows():
+            remaining = count
+            while remaining:
+                size = min(remaining, 10_000)
+                remaining -= size
+                books = rng.choices(book_indexes, cum_weights=book_weights, k=size)
+                members = rng.choices(
+                    member_indexes, cum_weights=member_weights, k=size
+                )
+                for book, member in zip(books, members):
+                    age = rng.randrange(history_days)
+                    borrowing_date = today - timedelta(days=age)
+                    returning_date = min(
+                        borrowing_date + timedelta(days=rng.randint(1, 30)), today
+                    )
+                    if (
+                        age <= LOAN_DAYS
+                        and rng.random() < 0.5
+                        and active_per_member.get(member, 0) < max_active
+                        and active_per_book[book] < copies[book]
+                        and (member, book) not in active_pairs
+                    ):
+                        returning_date = None
+                        active_per_member[member] = active_per_member.get(member, 0) + 1
+                        active_per_book[book] += 1
+                        active_pairs.add((member, book))
+                    yield {
+                        "id": self._new_id(),
+                        "book_id": book_ids[book],
+                        "member_id": member_ids[member],
+                        "borrowing_date": borrowing_date,
+                        "returning_date": returning_date,
+                        "due_date": borrowing_date + loan_period,
+                        **self._timestamps(),
+                    }
+
+        self._write("borrowings", BorrowingHistory, rows())
+        return active_per_book
+
+    def _inventory(
+        self, book_ids: List[uuid.UUID], copies: List[int], active_per_book: List[int]
+    ):
+        rows = (
+            {
+                "book_id": book_id,
+                "total_copies": total,
+                "available_copies": total - active,
+                "updated_at": self.now,
+            }
+            for book_id, total, active in zip(book_ids, copies, active_per_book)
+        )
+        self._write("inventory", BookInventory, rows)
+
+    def _timestamps(self) -> Row:
+        return {"created_at": self.now, "updated_at": self.now}
+
+
+def _zipf_cum_weights(count: int, exponent: float, rng: random.Random) -> List[float]:
+    """
+    Cumulative Zipf weights (1 / rank ** exponent) over `count` items.
+
+    Ranks are shuffled so that the popular items are spread over the ids
+    rather than being the first ones created.
+    """
+    ranks = list(range(1, count + 1))
+    rng.shuffle(ranks)
+    return list(accumulate(rank**-exponent for rank in ranks))
+
+
+def _next_isbn_number() -> int:
+    """
+    The first ISBN number above every existing 978 ISBN.
+
+    Starting there keeps generated ISBNs unique whatever books were added or
+    deleted before; ISBNs of equal length and prefix sort like their numbers.
+    """
+    highest = Book.objects.filter(isbn__regex=r"^978[0-9]{10}$").aggregate(
+        highest=Max("isbn")
+    )["highest"]
+    return int(highest[3:12]) + 1 if highest else 0
+
+
+def _isbn13(number: int) -> str:
+    """A valid ISBN-13 in the 978 prefix, the n-th one in numeric order."""
+    digits = f"978{number:09d}"
+    total = sum(
+        int(digit) * (3 if index % 2 else 1) for index, digit in enumerate(digits)
+    )
+    return f"{digits}{(10 - total % 10) % 10}"
+
+
+def _copy_value(value: Any) -> str:
+    """Format a value for COPY's text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, str):
+        return (
+            value.replace("\\", "\\\\")
+            .replace("\t", "\\t")
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+        )
+    return str(value)
+
+
+def _batched(rows: Iterable[Row], size: int) -> Iterator[List[Row]]:
+    iterator = iter(rows)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
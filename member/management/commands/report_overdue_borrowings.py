@@ -0,0 +1,83 @@
+import csv
+from datetime import date
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.forms import ValidationError
+
+from librarymanagementsystem.container import container
+from member.services.member_service import MemberService
+
+REPORT_COLUMNS = [
+    "id",
+    "book_id",
+    "member_id",
+    "borrowing_date",
+    "due_date",
+    "days_overdue",
+    "fine_amount",
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Write every overdue borrowing as CSV with its days overdue and fine, "
+        "reading the rows in keyset chunks so memory use stays flat on large "
+        "histories. Totals are written to stderr."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--as-of",
+            type=date.fromisoformat,
+            default=None,
+            help="Compute overdue status for this date (YYYY-MM-DD, default today).",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=settings.BORROWING_OVERDUE_CHUNK_SIZE,
+            help="Rows read per query.",
+        )
+        parser.add_argument(
+            "--summary-only",
+            action="store_true",
+            help="Only print the totals, computed by a single aggregate query.",
+        )
+
+    def handle(self, *args, **options):
+        member_service: MemberService = container.member_container.member_service()
+        as_of = options["as_of"]
+
+        if options["summary_only"]:
+            summary = member_service.get_overdue_summary(as_of)
+            self._write_summary(summary, self.stdout)
+            return
+
+        try:
+            chunks = member_service.iter_overdue_borrowings(
+                options["chunk_size"], as_of
+            )
+        except ValidationError as e:
+            raise CommandError("; ".join(e.messages))
+
+        writer = csv.DictWriter(
+            self.stdout, fieldnames=REPORT_COLUMNS, lineterminator="\n"
+        )
+        writer.writeheader()
+        summary = {"overdue_count": 0, "total_days_overdue": 0, "total_fine": 0}
+        for chunk in chunks:
+            writer.writerows(
+                {**row, "fine_amount": f"{row['fine_amount']:.2f}"} for row in chunk
+            )
+            summary["overdue_count"] += len(chunk)
+            summary["total_days_overdue"] += sum(row["days_overdue"] for row in chunk)
+            summary["total_fine"] += sum(row["fine_amount"] for row in chunk)
+        self._write_summary(summary, self.stderr)
+
+    def _write_summary(self, summary, stream):
+        stream.write(
+            f"{summary['overdue_count']} overdue borrowings, "
+            f"{summary['total_days_overdue']} days overdue, "
+            f"{summary['total_fine']:.2f} in fines"
+        )
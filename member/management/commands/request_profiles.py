@@ -0,0 +1,83 @@
+import io
+import shutil
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand, CommandError
+
+from librarymanagementsystem.profiling import (
+    PROFILE_TOKEN_HEADER,
+    make_profile_token,
+    profile_store,
+)
+
+SORT_KEYS = ["cumulative", "tottime", "calls", "ncalls", "filename", "name"]
+
+
+class Command(BaseCommand):
+    help = (
+        "List and dump the request profiles captured by ProfilingMiddleware, "
+        "or mint a token that turns profiling on for requests sending it."
+    )
+
+    def add_arguments(self, parser):
+        subcommands = parser.add_subparsers(dest="subcommand", required=True)
+
+        subcommands.add_parser("list", help="List stored profiles, newest first.")
+
+        dump = subcommands.add_parser(
+            "dump", help="Print a profile as a pstats report, or copy its file."
+        )
+        dump.add_argument("profile_id", help="Id from the X-Profile-Id header.")
+        dump.add_argument(
+            "--sort",
+            choices=SORT_KEYS,
+            default="cumulative",
+            help="Column to sort the report by.",
+        )
+        dump.add_argument(
+            "--limit", type=int, default=30, help="Functions shown in the report."
+        )
+        dump.add_argument(
+            "--output",
+            default=None,
+            help="Copy the raw pstats file here (e.g. for snakeviz) instead.",
+        )
+
+        subcommands.add_parser(
+            "token", help=f"Print a value for the {PROFILE_TOKEN_HEADER} header."
+        )
+
+    def handle(self, *args, **options):
+        subcommand = options["subcommand"]
+        if subcommand == "token":
+            try:
+                self.stdout.write(make_profile_token())
+            except ImproperlyConfigured as e:
+                raise CommandError(str(e))
+        elif subcommand == "list":
+            self._list()
+        else:
+            self._dump(options)
+
+    def _list(self):
+        for profile in profile_store.list_profiles():
+            self.stdout.write(
+                f"{profile['id']}  {profile['method']} {profile['path']}  "
+                f"{profile['status']}  {profile['duration_ms']} ms  "
+                f"({profile['trigger']})"
+            )
+
+    def _dump(self, options):
+        try:
+            if options["output"]:
+                path = profile_store.get_path(options["profile_id"])
+                shutil.copyfile(path, options["output"])
+                return
+            stats = profile_store.get_stats(options["profile_id"])
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        report = io.StringIO()
+        stats.stream = report
+        stats.sort_stats(options["sort"]).print_stats(options["limit"])
+        self.stdout.write(report.getvalue())
@@ -0,0 +1,28 @@
+# Generated by Django 3.2.23 on 2026-10-17 00:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("member", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="borrowinghistory",
+            index=models.Index(
+                condition=models.Q(("returning_date__isnull", True)),
+                fields=["member"],
+                name="borrowing_active_member_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="borrowinghistory",
+            index=models.Index(
+                condition=models.Q(("returning_date__isnull", True)),
+                fields=["book"],
+                name="borrowing_active_book_idx",
+            ),
+        ),
+    ]
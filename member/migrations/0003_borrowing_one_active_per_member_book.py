@@ -0,0 +1,20 @@
+# Generated by Django 3.2.23 on 2026-10-17 00:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("member", "0002_borrowing_active_indexes"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="borrowinghistory",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("returning_date__isnull", True)),
+                fields=("member", "book"),
+                name="borrowing_one_active_per_member_book",
+            ),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 3.2.23 on 2026-10-17 01:10
+
+from datetime import timedelta
+
+from django.db import migrations, models
+
+# The loan length in force when this migration was written. Kept as a literal
+# so the backfill does not change, or stop importing, when the app code does.
+LOAN_DAYS = 14
+
+# Date arithmetic per backend; this migration must not import app helpers
+DUE_DATE_SQL = {
+    "postgresql": "{column} + %s",
+    "sqlite": "DATE({column}, '+' || %s || ' days')",
+    "mysql": "DATE_ADD({column}, INTERVAL %s DAY)",
+}
+
+
+def backfill_due_dates(apps, schema_editor):
+    """Existing borrowings are due a regular loan after they started."""
+    BorrowingHistory = apps.get_model("member", "BorrowingHistory")
+    vendor = schema_editor.connection.vendor
+    if vendor not in DUE_DATE_SQL:
+        # Row by row on other backends
+        for borrowing in BorrowingHistory.objects.filter(due_date__isnull=True):
+            borrowing.due_date = borrowing.borrowing_date + timedelta(days=LOAN_DAYS)
+            borrowing.save(update_fields=["due_date"])
+        return
+
+    quote_name = schema_editor.quote_name
+    due_date = DUE_DATE_SQL[vendor].format(column=quote_name("borrowing_date"))
+    schema_editor.execute(
+        f"UPDATE {quote_name(BorrowingHistory._meta.db_table)} "
+        f"SET {quote_name('due_date')} = {due_date} "
+        f"WHERE {quote_name('due_date')} IS NULL",
+        [LOAN_DAYS],
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("member", "0003_borrowing_one_active_per_member_book"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="borrowinghistory",
+            name="due_date",
+            field=models.DateField(null=True),
+        ),
+        migrations.RunPython(backfill_due_dates, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="borrowinghistory",
+            name="due_date",
+            field=models.DateField(),
+        ),
+    ]
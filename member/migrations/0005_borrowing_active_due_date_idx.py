@@ -0,0 +1,20 @@
+# Generated by Django 3.2.23 on 2026-10-17 00:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("member", "0004_borrowinghistory_due_date"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="borrowinghistory",
+            index=models.Index(
+                condition=models.Q(("returning_date__isnull", True)),
+                fields=["due_date", "id"],
+                name="borrowing_active_due_date_idx",
+            ),
+        ),
+    ]
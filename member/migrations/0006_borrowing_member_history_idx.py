@@ -0,0 +1,19 @@
+# Generated by Django 3.2.23 on 2026-10-17 01:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("member", "0005_borrowing_active_due_date_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="borrowinghistory",
+            index=models.Index(
+                fields=["member", "-borrowing_date", "-id"],
+                name="borrowing_member_history_idx",
+            ),
+        ),
+    ]
@@ -7,5 +7,41 @@ class BorrowingHistory(models.Model):
     member = models.ForeignKey("member.Member", on_delete=models.CASCADE)
     borrowing_date = models.DateField()
     returning_date = models.DateField(blank=True, null=True)
+    due_date = models.DateField()
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # Active borrowings are looked up per member and per book on every
+            # borrow; partial indexes keep them small as history grows.
+            models.Index(
+                fields=["member"],
+                condition=models.Q(returning_date__isnull=True),
+                name="borrowing_active_member_idx",
+            ),
+            models.Index(
+                fields=["book"],
+                condition=models.Q(returning_date__isnull=True),
+                name="borrowing_active_book_idx",
+            ),
+            # Member history pages walk (borrowing_date, id) newest first
+            models.Index(
+                fields=["member", "-borrowing_date", "-id"],
+                name="borrowing_member_history_idx",
+            ),
+            # Overdue scans walk active rows in (due_date, id) keyset order
+            models.Index(
+                fields=["due_date", "id"],
+                condition=models.Q(returning_date__isnull=True),
+                name="borrowing_active_due_date_idx",
+            ),
+        ]
+        constraints = [
+            # Backstop for the locked checks in BorrowBookUseCase
+            models.UniqueConstraint(
+                fields=["member", "book"],
+                condition=models.Q(returning_date__isnull=True),
+                name="borrowing_one_active_per_member_book",
+            ),
+        ]
@@ -1,11 +1,101 @@
 import uuid
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import date
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+from django.db.models import (
+    Count,
+    DateField,
+    DecimalField,
+    ExpressionWrapper,
+    F,
+    Q,
+    QuerySet,
+    Sum,
+    Value,
+)
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from book.entities.book_entity import BookEntity
+from book.repositories.book_repository import book_model_to_entity, hydrate_books
+from librarymanagementsystem.db import AddDays, DaysBetween, update_returning
+from librarymanagementsystem.pagination import Cursor, Page, decode_cursor, paginate
 from member.entities.borrowing_entity import BorrowingEntity
 from member.models.borrowing_history import BorrowingHistory
 
 
+def days_overdue_expression(as_of: date, prefix: str = "") -> DaysBetween:
+    """Days from a borrowing's due date to as_of, computed in SQL."""
+    return DaysBetween(Value(as_of, output_field=DateField()), F(f"{prefix}due_date"))
+
+
+def fine_expression(days_overdue, daily_fine: Decimal) -> ExpressionWrapper:
+    """Fine for a number of days overdue, computed in SQL."""
+    return ExpressionWrapper(
+        days_overdue * Value(daily_fine),
+        output_field=DecimalField(max_digits=14, decimal_places=2),
+    )
+
+
+def borrowing_stats_aggregates(
+    as_of: date, daily_fine: Decimal, prefix: str = ""
+) -> Dict[str, Any]:
+    """
+    Conditional aggregates counting borrowings by state and totalling fines.
+
+    Args:
+        as_of: The date to compute overdue status for
+        daily_fine: Fine per day overdue
+        prefix: Lookup path to BorrowingHistory from the aggregated model,
+            e.g. "borrowinghistory__" when aggregating over members
+
+    Returns:
+        Keyword arguments for aggregate() or annotate()
+    """
+    active = Q(**{f"{prefix}returning_date__isnull": True})
+    overdue = active & Q(**{f"{prefix}due_date__lt": as_of})
+    days_overdue = days_overdue_expression(as_of, prefix)
+    return {
+        "total_borrowings": Count(f"{prefix}id"),
+        "active_borrowings": Count(f"{prefix}id", filter=active),
+        "returned_borrowings": Count(f"{prefix}id", filter=~active),
+        "overdue_borrowings": Count(f"{prefix}id", filter=overdue),
+        "total_days_overdue": Sum(days_overdue, filter=overdue),
+        "total_fine": Sum(fine_expression(days_overdue, daily_fine), filter=overdue),
+    }
+
+
+def borrowing_status_q(status: str, as_of: date) -> Q:
+    """
+    Build the filter selecting borrowings in the given status as of a date.
+
+    "borrowed" and "overdue" match BorrowingEntity.get_status(); "active"
+    covers both.
+
+    Raises:
+        ValueError: If the status is unknown
+    """
+    active = Q(returning_date__isnull=True)
+    conditions = {
+        "active": active,
+        "borrowed": active & Q(due_date__gte=as_of),
+        "overdue": active & Q(due_date__lt=as_of),
+        "returned": ~active,
+    }
+    if status not in conditions:
+        raise ValueError(f"status must be one of: {', '.join(conditions)}")
+    return conditions[status]
+
+
+def clean_borrowing_stats(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """Replace the NULL sums of members without overdue borrowings with zero."""
+    stats["total_days_overdue"] = stats["total_days_overdue"] or 0
+    stats["total_fine"] = Decimal(stats["total_fine"] or 0).quantize(Decimal("0.01"))
+    return stats
+
+
 class BorrowingAbstractRepository(ABC):
     @abstractmethod
     def get_borrowings_by_member(self, member_id):
@@ -29,23 +119,103 @@ class BorrowingAbstractRepository(ABC):
 
     @abstractmethod
     def get_active_borrowings_by_member_entity(
-        self, member_id: uuid.UUID
+        self, member_id: uuid.UUID, with_book: bool = False
     ) -> List[BorrowingEntity]:
         """Get all active borrowings for a member entity."""
         raise NotImplementedError("This method should be overridden.")
 
+    @abstractmethod
+    def get_active_borrowings_with_books(
+        self, member_id: uuid.UUID
+    ) -> List[Tuple[BorrowingEntity, BookEntity]]:
+        """Get all active borrowings for a member together with their books."""
+        raise NotImplementedError("This method should be overridden.")
+
     @abstractmethod
     def get_active_borrowings_by_book_entity(
-        self, book_id: uuid.UUID
+        self, book_id: uuid.UUID, with_book: bool = False
     ) -> List[BorrowingEntity]:
         """Get all active borrowings for a book entity."""
         raise NotImplementedError("This method should be overridden.")
 
+    @abstractmethod
+    def get_active_borrowing_counts(
+        self, member_id: uuid.UUID, book_id: uuid.UUID
+    ) -> Dict[str, int]:
+        """Count the active borrowings relevant to a member borrowing a book."""
+        raise NotImplementedError("This method should be overridden.")
+
     @abstractmethod
     def get_borrowing_ids_by_member(self, member_id: uuid.UUID) -> List[uuid.UUID]:
         """Get all borrowing IDs for a member."""
         raise NotImplementedError("This method should be overridden.")
 
+    @abstractmethod
+    def get_borrowings_by_ids(
+        self, borrowing_ids: List[uuid.UUID]
+    ) -> Dict[uuid.UUID, BorrowingEntity]:
+        """Get borrowing entities by their IDs."""
+        raise NotImplementedError("This method should be overridden.")
+
+    @abstractmethod
+    def return_borrowings(
+        self, borrowing_ids: List[uuid.UUID], return_date: date
+    ) -> List[BorrowingEntity]:
+        """Mark the given active borrowings as returned."""
+        raise NotImplementedError("This method should be overridden.")
+
+    @abstractmethod
+    def renew_borrowing(
+        self, borrowing_id: uuid.UUID, renewal_days: int, borrowed_since: date
+    ) -> Optional[BorrowingEntity]:
+        """Extend the due date of an active, not yet renewed borrowing."""
+        raise NotImplementedError("This method should be overridden.")
+
+    @abstractmethod
+    def get_member_borrowing_stats(
+        self, member_id: uuid.UUID, as_of: date, daily_fine: Decimal
+    ) -> Dict[str, Any]:
+        """Count a member's borrowings by state and total their overdue fines."""
+        raise NotImplementedError("This method should be overridden.")
+
+    @abstractmethod
+    def get_member_history_page(
+        self,
+        member_id: uuid.UUID,
+        cursor: Optional[Cursor],
+        page_size: int,
+        borrowed_from: Optional[date] = None,
+        borrowed_to: Optional[date] = None,
+        status: Optional[str] = None,
+        as_of: Optional[date] = None,
+        with_book: bool = False,
+    ) -> Page:
+        """Get one keyset page of a member's borrowings, newest first."""
+        raise NotImplementedError("This method should be overridden.")
+
+    @abstractmethod
+    def get_overdue_page(
+        self,
+        as_of: date,
+        daily_fine: Decimal,
+        cursor: Optional[Cursor],
+        page_size: int,
+    ) -> Page:
+        """Get one keyset page of overdue borrowings ordered by (due_date, id)."""
+        raise NotImplementedError("This method should be overridden.")
+
+    @abstractmethod
+    def iter_overdue_chunks(
+        self, as_of: date, daily_fine: Decimal, chunk_size: int
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Stream all overdue borrowings in keyset chunks ordered by (due_date, id)."""
+        raise NotImplementedError("This method should be overridden.")
+
+    @abstractmethod
+    def get_overdue_summary(self, as_of: date, daily_fine: Decimal) -> Dict[str, Any]:
+        """Count overdue borrowings and total their days overdue and fines."""
+        raise NotImplementedError("This method should be overridden.")
+
 
 class BorrowingRepository(BorrowingAbstractRepository):
     def __init__(self):
@@ -74,6 +244,7 @@ class BorrowingRepository(BorrowingAbstractRepository):
             member_id=borrowing_entity.member_id,
             borrowing_date=borrowing_entity.borrowing_date,
             returning_date=borrowing_entity.returning_date,
+            due_date=borrowing_entity.due_date,
             created_at=borrowing_entity.created_at,
             updated_at=borrowing_entity.updated_at,
         )
@@ -83,28 +254,75 @@ class BorrowingRepository(BorrowingAbstractRepository):
         return self._model_to_entity(borrowing_model)
 
     def get_active_borrowings_by_member_entity(
-        self, member_id: uuid.UUID
+        self, member_id: uuid.UUID, with_book: bool = False
     ) -> List[BorrowingEntity]:
-        """Get all active borrowings for a member entity."""
-        borrowing_models = self.borrowing_model.objects.filter(
-            member_id=member_id, returning_date__isnull=True
+        """
+        Get all active borrowings for a member entity.
+
+        Pass with_book=True to also load each book's title in the same query.
+        """
+        return self._to_entities(
+            self.borrowing_model.objects.filter(
+                member_id=member_id, returning_date__isnull=True
+            ),
+            with_book,
+        )
+
+    def get_active_borrowings_with_books(
+        self, member_id: uuid.UUID
+    ) -> List[Tuple[BorrowingEntity, BookEntity]]:
+        """
+        Get all active borrowings for a member together with their books.
+
+        Books, authors, publishers and inventories are joined into the
+        borrowing query and genres come from one prefetch, so this costs two
+        statements however many books the member holds.
+        """
+        borrowing_models = hydrate_books(
+            self.borrowing_model.objects.filter(
+                member_id=member_id, returning_date__isnull=True
+            ),
+            prefix="book__",
         )
         return [
-            self._model_to_entity(borrowing_model)
+            (
+                self._model_to_entity(borrowing_model),
+                book_model_to_entity(borrowing_model.book),
+            )
             for borrowing_model in borrowing_models
         ]
 
     def get_active_borrowings_by_book_entity(
-        self, book_id: uuid.UUID
+        self, book_id: uuid.UUID, with_book: bool = False
     ) -> List[BorrowingEntity]:
-        """Get all active borrowings for a book entity."""
-        borrowing_models = self.borrowing_model.objects.filter(
-            book_id=book_id, returning_date__isnull=True
+        """
+        Get all active borrowings for a book entity.
+
+        Pass with_book=True to also load the book's title in the same query.
+        """
+        return self._to_entities(
+            self.borrowing_model.objects.filter(
+                book_id=book_id, returning_date__isnull=True
+            ),
+            with_book,
+        )
+
+    def get_active_borrowing_counts(
+        self, member_id: uuid.UUID, book_id: uuid.UUID
+    ) -> Dict[str, int]:
+        """
+        Count the active borrowings relevant to a member borrowing a book.
+
+        Returns the member's active borrowings and the member's active
+        borrowings of this book in one query over the partial member index.
+        Book availability comes from the book inventory instead.
+        """
+        return self.borrowing_model.objects.filter(
+            member_id=member_id, returning_date__isnull=True
+        ).aggregate(
+            member_active=Count("id"),
+            member_book_active=Count("id", filter=Q(book_id=book_id)),
         )
-        return [
-            self._model_to_entity(borrowing_model)
-            for borrowing_model in borrowing_models
-        ]
 
     def get_borrowing_ids_by_member(self, member_id: uuid.UUID) -> List[uuid.UUID]:
         """Get all borrowing IDs for a member."""
@@ -114,14 +332,270 @@ class BorrowingRepository(BorrowingAbstractRepository):
             )
         )
 
+    def get_borrowings_by_ids(
+        self, borrowing_ids: List[uuid.UUID]
+    ) -> Dict[uuid.UUID, BorrowingEntity]:
+        """Get borrowing entities by their IDs, in one query."""
+        rows = self.borrowing_model.objects.filter(id__in=borrowing_ids).values(
+            *self._entity_fields()
+        )
+        return {row["id"]: self._row_to_entity(row) for row in rows}
+
+    def return_borrowings(
+        self, borrowing_ids: List[uuid.UUID], return_date: date
+    ) -> List[BorrowingEntity]:
+        """
+        Mark the given active borrowings as returned.
+
+        One conditional UPDATE ... RETURNING sets the returning date of the
+        borrowings that are still active and did not start after return_date.
+        A borrowing returned concurrently is simply not matched, so a book can
+        never be returned twice. IDs that don't match are left out of the result.
+        """
+        rows = update_returning(
+            self.borrowing_model.objects.filter(
+                id__in=borrowing_ids,
+                returning_date__isnull=True,
+                borrowing_date__lte=return_date,
+            ),
+            returning_date=return_date,
+            updated_at=timezone.now(),
+        )
+        return [self._row_to_entity(row) for row in rows]
+
+    def renew_borrowing(
+        self, borrowing_id: uuid.UUID, renewal_days: int, borrowed_since: date
+    ) -> Optional[BorrowingEntity]:
+        """
+        Extend the due date of an active, not yet renewed borrowing.
+
+        One conditional UPDATE ... RETURNING moves the due date forward if the
+        borrowing is still active, started on or after borrowed_since and still
+        has its original due date. Returns None if nothing matched.
+        """
+        rows = update_returning(
+            self.borrowing_model.objects.filter(
+                id=borrowing_id,
+                returning_date__isnull=True,
+                borrowing_date__gte=borrowed_since,
+                due_date=AddDays(F("borrowing_date"), BorrowingEntity.loan_days),
+            ),
+            due_date=AddDays(F("due_date"), renewal_days),
+            updated_at=timezone.now(),
+        )
+        return self._row_to_entity(rows[0]) if rows else None
+
+    def get_member_borrowing_stats(
+        self, member_id: uuid.UUID, as_of: date, daily_fine: Decimal
+    ) -> Dict[str, Any]:
+        """
+        Count a member's borrowings by state and total their overdue fines.
+
+        One aggregate query with conditional counts and sums over the member's
+        history; no borrowing rows are loaded.
+
+        Returns:
+            Dictionary with total, active, returned and overdue borrowing
+            counts, total_days_overdue and total_fine as of the given date
+        """
+        stats = self.borrowing_model.objects.filter(member_id=member_id).aggregate(
+            **borrowing_stats_aggregates(as_of, daily_fine)
+        )
+        return clean_borrowing_stats(stats)
+
+    def _overdue_queryset(self, as_of: date, daily_fine: Decimal) -> QuerySet:
+        """
+        Active borrowings due before as_of, with days overdue and fine in SQL.
+
+        Matches the partial (due_date, id) index on active rows, so scans and
+        keyset pages never touch returned history.
+        """
+        days_overdue = days_overdue_expression(as_of)
+        return (
+            self.borrowing_model.objects.filter(
+                returning_date__isnull=True, due_date__lt=as_of
+            )
+            .annotate(
+                days_overdue=days_overdue,
+                fine_amount=fine_expression(days_overdue, daily_fine),
+            )
+            .values(
+                "id",
+                "book_id",
+                "member_id",
+                "borrowing_date",
+                "due_date",
+                "days_overdue",
+                "fine_amount",
+            )
+        )
+
+    def get_member_history_page(
+        self,
+        member_id: uuid.UUID,
+        cursor: Optional[Cursor],
+        page_size: int,
+        borrowed_from: Optional[date] = None,
+        borrowed_to: Optional[date] = None,
+        status: Optional[str] = None,
+        as_of: Optional[date] = None,
+        with_book: bool = False,
+    ) -> Page:
+        """
+        Get one keyset page of a member's borrowings, newest first.
+
+        Pages are ordered by (-borrowing_date, -id) and walk the
+        borrowing_member_history_idx index, so a page costs the same however
+        long the member's history is.
+
+        Args:
+            member_id: The member whose borrowings to list
+            cursor: Decoded cursor, or None for the first page
+            page_size: Maximum number of borrowings on the page
+            borrowed_from: Only borrowings made on or after this date
+            borrowed_to: Only borrowings made on or before this date
+            status: Only borrowings in this status (see borrowing_status_q)
+            as_of: The date the status filter is evaluated for (defaults to today)
+            with_book: Join the book table to fill in book titles
+
+        Returns:
+            Page of borrowing entities
+
+        Raises:
+            ValueError: If the status is unknown or the cursor is invalid
+        """
+        queryset = self.borrowing_model.objects.filter(member_id=member_id)
+        if borrowed_from is not None:
+            queryset = queryset.filter(borrowing_date__gte=borrowed_from)
+        if borrowed_to is not None:
+            queryset = queryset.filter(borrowing_date__lte=borrowed_to)
+        if status is not None:
+            queryset = queryset.filter(
+                borrowing_status_q(status, as_of or date.today())
+            )
+
+        fields = self._entity_fields()
+        if with_book:
+            queryset = queryset.annotate(book_title=F("book__title"))
+            fields.append("book_title")
+
+        page = paginate(
+            queryset.values(*fields), ("-borrowing_date", "-id"), cursor, page_size
+        )
+        page.items = [self._row_to_entity(row) for row in page.items]
+        return page
+
+    def get_overdue_page(
+        self,
+        as_of: date,
+        daily_fine: Decimal,
+        cursor: Optional[Cursor],
+        page_size: int,
+    ) -> Page:
+        """
+        Get one keyset page of overdue borrowings ordered by (due_date, id).
+
+        Items are rows with the borrowing's id, book_id, member_id,
+        borrowing_date and due_date, plus days_overdue and fine_amount as of
+        the given date.
+        """
+        return paginate(
+            self._overdue_queryset(as_of, daily_fine),
+            ("due_date", "id"),
+            cursor,
+            page_size,
+        )
+
+    def iter_overdue_chunks(
+        self, as_of: date, daily_fine: Decimal, chunk_size: int
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream all overdue borrowings in keyset chunks ordered by (due_date, id).
+
+        Each chunk is a separate indexed query starting after the last row of
+        the previous one, so memory stays flat and no long-running cursor or
+        transaction is held open, however many rows are overdue.
+        """
+        cursor = None
+        while True:
+            page = self.get_overdue_page(as_of, daily_fine, cursor, chunk_size)
+            if page.items:
+                yield page.items
+            if page.next_cursor is None:
+                return
+            cursor = decode_cursor(page.next_cursor)
+
+    def get_overdue_summary(self, as_of: date, daily_fine: Decimal) -> Dict[str, Any]:
+        """Count overdue borrowings and total their days overdue and fines."""
+        decimal_field = DecimalField(max_digits=14, decimal_places=2)
+        return self._overdue_queryset(as_of, daily_fine).aggregate(
+            overdue_count=Count("id"),
+            total_days_overdue=Coalesce(Sum("days_overdue"), 0),
+            total_fine=Coalesce(
+                Sum("fine_amount", output_field=decimal_field),
+                Value(Decimal("0.00")),
+                output_field=decimal_field,
+            ),
+        )
+
+    def _entity_fields(self) -> List[str]:
+        """Get the model attnames a borrowing entity is built from."""
+        return [
+            "id",
+            "book_id",
+            "member_id",
+            "borrowing_date",
+            "returning_date",
+            "due_date",
+            "created_at",
+            "updated_at",
+        ]
+
+    def _to_entities(
+        self, queryset: QuerySet, with_book: bool = False
+    ) -> List[BorrowingEntity]:
+        """
+        Hydrate borrowing entities from a queryset in a single query.
+
+        By default rows are read with values(), skipping model instantiation
+        entirely. With with_book=True the books are joined in through
+        select_related() so the entities carry their book titles.
+        """
+        if with_book:
+            return [
+                self._model_to_entity(borrowing_model)
+                for borrowing_model in queryset.select_related("book")
+            ]
+        return [
+            self._row_to_entity(row) for row in queryset.values(*self._entity_fields())
+        ]
+
+    def _row_to_entity(self, row: Dict[str, Any]) -> BorrowingEntity:
+        """Convert a row keyed by model attnames, plus an optional book_title, to entity."""
+        return BorrowingEntity(
+            **{name: row[name] for name in self._entity_fields()},
+            book_title=row.get("book_title"),
+        )
+
     def _model_to_entity(self, borrowing_model: BorrowingHistory) -> BorrowingEntity:
-        """Convert Django model to entity."""
+        """
+        Convert Django model to entity.
+
+        Reads the book_id and member_id columns rather than the related
+        objects, so no query is issued unless the book was loaded with
+        select_related(), in which case its title is copied too.
+        """
+        book_title = None
+        if BorrowingHistory.book.is_cached(borrowing_model):
+            book_title = borrowing_model.book.title
         return BorrowingEntity(
             id=borrowing_model.id,
-            book_id=borrowing_model.book.id,
-            member_id=borrowing_model.member.id,
+            book_id=borrowing_model.book_id,
+            member_id=borrowing_model.member_id,
             borrowing_date=borrowing_model.borrowing_date,
             returning_date=borrowing_model.returning_date,
+            due_date=borrowing_model.due_date,
             created_at=borrowing_model.created_at,
             updated_at=borrowing_model.updated_at,
+            book_title=book_title,
         )
@@ -0,0 +1,105 @@
+import uuid
+from abc import ABC, abstractmethod
+from datetime import date
+from decimal import Decimal
+from typing import Optional
+
+from member.entities.borrowing_entity import BorrowingEntity
+from member.entities.member_dashboard_entity import MemberDashboardEntity
+from member.entities.member_entity import MemberEntity
+from member.models.borrowing_history import BorrowingHistory
+from member.models.member import Member
+from member.repositories.borrowing_repository import (
+    borrowing_stats_aggregates,
+    clean_borrowing_stats,
+)
+
+
+class MemberDashboardAbstractRepository(ABC):
+    @abstractmethod
+    def get_member_dashboard(
+        self, member_id: uuid.UUID, as_of: date, daily_fine: Decimal
+    ) -> Optional[MemberDashboardEntity]:
+        """Get a member with borrowing statistics and active borrowings."""
+        raise NotImplementedError("This method should be overridden.")
+
+
+class MemberDashboardRepository(MemberDashboardAbstractRepository):
+    def __init__(self):
+        self.member_model = Member
+        self.borrowing_model = BorrowingHistory
+
+    def get_member_dashboard(
+        self, member_id: uuid.UUID, as_of: date, daily_fine: Decimal
+    ) -> Optional[MemberDashboardEntity]:
+        """
+        Get a member with borrowing statistics and active borrowings.
+
+        Two queries: the member row annotated with conditional aggregates over
+        its whole history, then its active borrowings joined with their books.
+        """
+        aggregates = borrowing_stats_aggregates(
+            as_of, daily_fine, prefix="borrowinghistory__"
+        )
+        member_row = (
+            self.member_model.objects.filter(id=member_id)
+            .annotate(**aggregates)
+            .first()
+        )
+        if member_row is None:
+            return None
+
+        borrowing_models = (
+            self.borrowing_model.objects.filter(
+                member_id=member_id, returning_date__isnull=True
+            )
+            .select_related("book")
+            .only(
+                "id",
+                "book_id",
+                "member_id",
+                "borrowing_date",
+                "returning_date",
+                "due_date",
+                "created_at",
+                "updated_at",
+                "book__title",
+            )
+            .order_by("due_date", "id")
+        )
+        active_borrowings = [
+            self._borrowing_to_entity(borrowing_model)
+            for borrowing_model in borrowing_models
+        ]
+
+        stats = clean_borrowing_stats(
+            {name: getattr(member_row, name) for name in aggregates}
+        )
+        member = MemberEntity(
+            id=member_row.id,
+            first_name=member_row.first_name,
+            last_name=member_row.last_name,
+            birth_date=member_row.birth_date,
+            created_at=member_row.created_at,
+            updated_at=member_row.updated_at,
+            active_borrowing_ids=[borrowing.id for borrowing in active_borrowings],
+        )
+        return MemberDashboardEntity(
+            member=member, stats=stats, active_borrowings=active_borrowings
+        )
+
+    def _borrowing_to_entity(
+        self, borrowing_model: BorrowingHistory
+    ) -> BorrowingEntity:
+        """Convert a borrowing loaded with select_related("book") to entity."""
+        return BorrowingEntity(
+            id=borrowing_model.id,
+            book_id=borrowing_model.book_id,
+            member_id=borrowing_model.member_id,
+            borrowing_date=borrowing_model.borrowing_date,
+            returning_date=borrowing_model.returning_date,
+            due_date=borrowing_model.due_date,
+            created_at=borrowing_model.created_at,
+            updated_at=borrowing_model.updated_at,
+            book_title=borrowing_model.book.title,
+        )
@@ -2,7 +2,7 @@ import uuid
 from abc import ABC, abstractmethod
 from typing import Optional
 
-from django.db.models import Count
+from django.db.models import Count, Prefetch
 
 from member.entities.member_entity import MemberEntity
 from member.models.borrowing_history import BorrowingHistory
@@ -15,6 +15,16 @@ class MemberAbstractRepository(ABC):
         """Get a member entity by ID."""
         raise NotImplementedError("This method should be overridden.")
 
+    @abstractmethod
+    def member_exists(self, member_id: uuid.UUID) -> bool:
+        """Check whether a member with the given ID exists."""
+        raise NotImplementedError("This method should be overridden.")
+
+    @abstractmethod
+    def lock_member(self, member_id: uuid.UUID) -> Optional[MemberEntity]:
+        """Get a member entity by ID, locking its row until the transaction ends."""
+        raise NotImplementedError("This method should be overridden.")
+
     @abstractmethod
     def save_member(self, member_entity: MemberEntity) -> MemberEntity:
         """Save a member entity to the repository."""
@@ -26,20 +36,31 @@ class MemberRepository(MemberAbstractRepository):
         self.member_model = Member
 
     def get_member_by_id(self, member_id: uuid.UUID) -> Optional[MemberEntity]:
-        """Get a member entity by ID with borrowing IDs in a single query."""
+        """
+        Get a member entity by ID with the IDs of its active borrowings.
+
+        Only active borrowings are loaded, over the partial member index, so
+        the cost is bounded by the borrowing limit rather than by how long the
+        member's history is. Use BorrowingRepository.get_member_borrowing_stats
+        for counts over the whole history.
+        """
         try:
-            # Use prefetch_related to get member and borrowing IDs in one query
             member_model = self.member_model.objects.prefetch_related(
-                "borrowinghistory_set"
+                Prefetch(
+                    "borrowinghistory_set",
+                    queryset=BorrowingHistory.objects.filter(
+                        returning_date__isnull=True
+                    ).only("id", "member_id"),
+                )
             ).get(id=member_id)
 
             # Extract borrowing IDs from the prefetched related objects
-            borrowing_ids = [
+            active_borrowing_ids = [
                 borrowing.id
                 for borrowing in member_model.borrowinghistory_set.all()  # type: ignore
             ]
 
-            return self._model_to_entity(member_model, borrowing_ids)
+            return self._model_to_entity(member_model, active_borrowing_ids)
         except self.member_model.DoesNotExist:
             return None
 
@@ -55,9 +76,29 @@ class MemberRepository(MemberAbstractRepository):
 
             # For this method, we'll use empty list since we only have count
             # You could modify this based on your needs
-            borrowing_ids = []
+            active_borrowing_ids = []
 
-            return self._model_to_entity(member_model, borrowing_ids)
+            return self._model_to_entity(member_model, active_borrowing_ids)
+        except self.member_model.DoesNotExist:
+            return None
+
+    def member_exists(self, member_id: uuid.UUID) -> bool:
+        """Check whether a member with the given ID exists."""
+        return self.member_model.objects.filter(id=member_id).exists()
+
+    def lock_member(self, member_id: uuid.UUID) -> Optional[MemberEntity]:
+        """
+        Get a member entity by ID, locking its row until the transaction ends.
+
+        Concurrent borrows for the same member queue up behind this lock, so
+        their rule checks run one after another. Borrowing IDs are not loaded.
+        Must be called inside transaction.atomic().
+        """
+        try:
+            member_model = self.member_model.objects.select_for_update().get(
+                id=member_id
+            )
+            return self._model_to_entity(member_model, [])
         except self.member_model.DoesNotExist:
             return None
 
@@ -74,11 +115,11 @@ class MemberRepository(MemberAbstractRepository):
         )
         member_model.save()
 
-        # Convert back to entity (with empty borrowing_ids for new members)
+        # Convert back to entity (with empty active_borrowing_ids for new members)
         return self._model_to_entity(member_model, [])
 
     def _model_to_entity(
-        self, member_model: Member, borrowing_ids: list[uuid.UUID]
+        self, member_model: Member, active_borrowing_ids: list[uuid.UUID]
     ) -> MemberEntity:
         """Convert Django model to entity."""
         return MemberEntity(
@@ -88,5 +129,5 @@ class MemberRepository(MemberAbstractRepository):
             birth_date=member_model.birth_date,
             created_at=member_model.created_at,
             updated_at=member_model.updated_at,
-            borrowing_ids=borrowing_ids,
+            active_borrowing_ids=active_borrowing_ids,
         )
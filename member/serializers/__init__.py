@@ -1,8 +1,23 @@
 from .active_book_serializer import ActiveBookSerializer
 from .borrowed_book_serializer import BorrowedBookSerializer
+from .borrowing_batch_return_error_serializer import (
+    BorrowingBatchReturnErrorSerializer,
+)
+from .borrowing_batch_return_response_serializer import (
+    BorrowingBatchReturnResponseSerializer,
+)
+from .borrowing_history_serializer import BorrowingHistorySerializer
+from .borrowing_response_serializer import BorrowingResponseSerializer
 from .borrowing_stats_serializer import BorrowingStatsSerializer
 from .member_active_books_response_serializer import MemberActiveBooksResponseSerializer
 from .member_borrowing_response_serializer import MemberBorrowingResponseSerializer
+from .member_history_page_response_serializer import (
+    MemberHistoryPageResponseSerializer,
+)
+from .overdue_borrowing_page_response_serializer import (
+    OverdueBorrowingPageResponseSerializer,
+)
+from .overdue_borrowing_serializer import OverdueBorrowingSerializer
 
 __all__ = [
     "BorrowingStatsSerializer",
@@ -10,4 +25,11 @@ __all__ = [
     "MemberBorrowingResponseSerializer",
     "ActiveBookSerializer",
     "MemberActiveBooksResponseSerializer",
+    "BorrowingResponseSerializer",
+    "BorrowingBatchReturnErrorSerializer",
+    "BorrowingBatchReturnResponseSerializer",
+    "OverdueBorrowingSerializer",
+    "OverdueBorrowingPageResponseSerializer",
+    "BorrowingHistorySerializer",
+    "MemberHistoryPageResponseSerializer",
 ]
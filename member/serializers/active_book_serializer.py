@@ -1,5 +1,7 @@
 from rest_framework import serializers
 
+from book.serializes import EnrichedBookResponseSerializer
+
 
 class ActiveBookSerializer(serializers.Serializer):
     """Serializer for active book borrowing information."""
@@ -12,3 +14,5 @@ class ActiveBookSerializer(serializers.Serializer):
     is_overdue = serializers.BooleanField()
     fine_amount = serializers.DecimalField(max_digits=10, decimal_places=2)
     can_be_renewed = serializers.BooleanField()
+    # Only present when the book was requested with expand=book
+    book = EnrichedBookResponseSerializer(required=False)
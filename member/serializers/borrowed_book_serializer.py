@@ -5,6 +5,7 @@ class BorrowedBookSerializer(serializers.Serializer):
     """Serializer for borrowed book information."""
 
     book_id = serializers.UUIDField()
+    book_title = serializers.CharField(allow_null=True)
     borrowing_id = serializers.UUIDField()
     borrowing_date = serializers.DateField()
     returning_date = serializers.DateField(allow_null=True)
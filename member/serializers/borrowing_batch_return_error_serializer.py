@@ -0,0 +1,8 @@
+from rest_framework import serializers
+
+
+class BorrowingBatchReturnErrorSerializer(serializers.Serializer):
+    """Serializer for a borrowing a batch return request couldn't close."""
+
+    borrowing_id = serializers.CharField()
+    error = serializers.CharField()
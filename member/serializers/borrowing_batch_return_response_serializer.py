@@ -0,0 +1,26 @@
+from rest_framework import serializers
+
+from .borrowing_batch_return_error_serializer import (
+    BorrowingBatchReturnErrorSerializer,
+)
+from .borrowing_response_serializer import BorrowingResponseSerializer
+
+
+class BorrowingBatchReturnResponseSerializer(serializers.Serializer):
+    """Serializer for the result of a batch return request."""
+
+    returned = BorrowingResponseSerializer(many=True)
+    errors = BorrowingBatchReturnErrorSerializer(many=True)
+    returned_count = serializers.IntegerField()
+    error_count = serializers.IntegerField()
+
+    @classmethod
+    def create_response(cls, returned_borrowings, errors):
+        """Create a response instance with the given data."""
+        data = {
+            "returned": returned_borrowings,
+            "errors": errors,
+            "returned_count": len(returned_borrowings),
+            "error_count": len(errors),
+        }
+        return cls(data)
@@ -0,0 +1,9 @@
+from rest_framework import serializers
+
+from .borrowing_response_serializer import BorrowingResponseSerializer
+
+
+class BorrowingHistorySerializer(BorrowingResponseSerializer):
+    """Serializer for a borrowing in a member's history."""
+
+    book_title = serializers.CharField(allow_null=True)
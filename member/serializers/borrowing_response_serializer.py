@@ -0,0 +1,21 @@
+from rest_framework import serializers
+
+
+class BorrowingResponseSerializer(serializers.Serializer):
+    """Serializer for a single borrowing response."""
+
+    id = serializers.UUIDField()
+    book_id = serializers.UUIDField()
+    member_id = serializers.UUIDField()
+    borrowing_date = serializers.DateField()
+    returning_date = serializers.DateField(allow_null=True)
+    due_date = serializers.DateField()
+    status = serializers.CharField()
+    is_returned = serializers.BooleanField()
+    is_overdue = serializers.BooleanField()
+    days_overdue = serializers.IntegerField()
+    remaining_days = serializers.IntegerField()
+    fine_amount = serializers.DecimalField(max_digits=10, decimal_places=2)
+    can_be_renewed = serializers.BooleanField()
+    created_at = serializers.DateTimeField()
+    updated_at = serializers.DateTimeField()
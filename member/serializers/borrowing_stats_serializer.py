@@ -7,6 +7,9 @@ class BorrowingStatsSerializer(serializers.Serializer):
     total_borrowings = serializers.IntegerField()
     active_borrowings = serializers.IntegerField()
     returned_borrowings = serializers.IntegerField()
+    overdue_borrowings = serializers.IntegerField()
+    total_days_overdue = serializers.IntegerField()
+    total_fine = serializers.DecimalField(max_digits=14, decimal_places=2)
     is_active_borrower = serializers.BooleanField()
     is_heavy_borrower = serializers.BooleanField()
     can_borrow_more = serializers.BooleanField()
@@ -0,0 +1,23 @@
+from rest_framework import serializers
+
+from .borrowing_history_serializer import BorrowingHistorySerializer
+
+
+class MemberHistoryPageResponseSerializer(serializers.Serializer):
+    """Serializer for a keyset-paginated page of a member's borrowing history."""
+
+    member_id = serializers.UUIDField()
+    results = BorrowingHistorySerializer(many=True)
+    next = serializers.URLField(allow_null=True)
+    previous = serializers.URLField(allow_null=True)
+
+    @classmethod
+    def create_response(cls, member_id, borrowings, next_url, previous_url):
+        """Create a response instance with the given data."""
+        data = {
+            "member_id": member_id,
+            "results": borrowings,
+            "next": next_url,
+            "previous": previous_url,
+        }
+        return cls(data)
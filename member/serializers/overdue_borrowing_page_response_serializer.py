@@ -0,0 +1,21 @@
+from rest_framework import serializers
+
+from .overdue_borrowing_serializer import OverdueBorrowingSerializer
+
+
+class OverdueBorrowingPageResponseSerializer(serializers.Serializer):
+    """Serializer for a keyset-paginated page of overdue borrowings."""
+
+    results = OverdueBorrowingSerializer(many=True)
+    next = serializers.URLField(allow_null=True)
+    previous = serializers.URLField(allow_null=True)
+
+    @classmethod
+    def create_response(cls, borrowings, next_url, previous_url):
+        """Create a response instance with the given data."""
+        data = {
+            "results": borrowings,
+            "next": next_url,
+            "previous": previous_url,
+        }
+        return cls(data)
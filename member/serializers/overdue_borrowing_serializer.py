@@ -0,0 +1,13 @@
+from rest_framework import serializers
+
+
+class OverdueBorrowingSerializer(serializers.Serializer):
+    """Serializer for an overdue borrowing with its fine."""
+
+    id = serializers.UUIDField()
+    book_id = serializers.UUIDField()
+    member_id = serializers.UUIDField()
+    borrowing_date = serializers.DateField()
+    due_date = serializers.DateField()
+    days_overdue = serializers.IntegerField()
+    fine_amount = serializers.DecimalField(max_digits=10, decimal_places=2)
@@ -1,9 +1,16 @@
 import uuid
-from typing import Any, Dict, List, Optional
+from datetime import date
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+from django.conf import settings
 from django.forms import ValidationError
 
+from librarymanagementsystem.pagination import Page
+from member.entities.member_entity import MemberEntity
 from member.repositories.borrowing_repository import BorrowingAbstractRepository
+from member.repositories.member_dashboard_repository import (
+    MemberDashboardAbstractRepository,
+)
 from member.repositories.member_repository import MemberAbstractRepository
 from member.use_cases.borrow_book_use_case import BorrowBookUseCase
 
@@ -14,10 +21,12 @@ class MemberService:
         borrowing_repository: BorrowingAbstractRepository,
         member_repository: MemberAbstractRepository,
         borrow_book_use_case: BorrowBookUseCase,
+        member_dashboard_repository: MemberDashboardAbstractRepository,
     ):
         self.borrowing_repository = borrowing_repository
         self.member_repository = member_repository
         self.borrow_book_use_case = borrow_book_use_case
+        self.member_dashboard_repository = member_dashboard_repository
 
     def borrow_book(self, borrowing_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -56,7 +65,12 @@ class MemberService:
             raise ValidationError(str(e))
 
     def get_member_borrowing_stats(self, member_id: uuid.UUID) -> Dict[str, Any]:
-        """Get comprehensive borrowing statistics for a member"""
+        """
+        Get comprehensive borrowing statistics for a member.
+
+        Counts and fines come from one aggregate query over the member's
+        history; the member itself is loaded with its active borrowings only.
+        """
         try:
             member_uuid = member_id
             member = self.member_repository.get_member_by_id(member_uuid)
@@ -64,58 +78,92 @@ class MemberService:
             if not member:
                 raise ValidationError(f"Member with ID {member_id} not found")
 
-            # Use entity business logic
-            borrowing_count = member.get_borrowing_count()
-            is_active_borrower = member.is_active_borrower()
-            is_heavy_borrower = member.is_heavy_borrower()
-            can_borrow_more = member.can_borrow_more_books()
-
-            return {
-                "total_borrowings": borrowing_count,
-                "active_borrowings": borrowing_count,  # All borrowings are active in entity
-                "returned_borrowings": 0,  # Would need to be calculated from actual borrowings
-                "is_active_borrower": is_active_borrower,
-                "is_heavy_borrower": is_heavy_borrower,
-                "can_borrow_more": can_borrow_more,
-                "member_age": member.get_age(),
-                "is_minor": member.is_minor(),
-                "is_senior": member.is_senior(),
-                "membership_duration_days": member.get_membership_duration_days(),
-                "is_long_term_member": member.is_long_term_member(),
-            }
+            stats = self.borrowing_repository.get_member_borrowing_stats(
+                member_uuid, date.today(), settings.BORROWING_DAILY_FINE
+            )
+            return self._borrowing_stats(member, stats)
         except Exception as e:
             raise ValidationError(str(e))
 
-    def get_member_borrowed_books(self, member_id: uuid.UUID) -> List[Dict[str, Any]]:
-        """Get all books borrowed by a member with book details"""
-        try:
-            borrowings = self.borrow_book_use_case.get_member_borrowings(member_id)
+    def _borrowing_stats(
+        self, member: MemberEntity, stats: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Combine aggregated borrowing counts with the member's business rules."""
+        return {
+            **stats,
+            # Use entity business logic
+            "is_active_borrower": member.is_active_borrower(),
+            "is_heavy_borrower": member.is_heavy_borrower(stats["total_borrowings"]),
+            "can_borrow_more": member.can_borrow_more_books(
+                self.borrow_book_use_case.max_active_borrowings
+            ),
+            "member_age": member.get_age(),
+            "is_minor": member.is_minor(),
+            "is_senior": member.is_senior(),
+            "membership_duration_days": member.get_membership_duration_days(),
+            "is_long_term_member": member.is_long_term_member(),
+        }
+
+    def get_member_dashboard(self, member_id: uuid.UUID) -> Optional[Dict[str, Any]]:
+        """
+        Get a member's borrowing statistics and borrowed books in one pass.
 
-            borrowed_books = []
-            for borrowing in borrowings:
-                book_data = {
-                    "book_id": borrowing["book_id"],
-                    "borrowing_id": borrowing["id"],
-                    "borrowing_date": borrowing["borrowing_date"],
-                    "returning_date": borrowing["returning_date"],
-                    "is_active": borrowing["is_returned"] is False,
-                    "is_overdue": borrowing["is_overdue"],
-                    "status": borrowing["status"],
-                    "due_date": borrowing["due_date"],
-                    "days_overdue": borrowing["days_overdue"],
-                    "fine_amount": borrowing["fine_amount"],
-                    "can_be_renewed": borrowing["can_be_renewed"],
-                }
-                borrowed_books.append(book_data)
+        Loads everything through the dashboard read model in two queries,
+        instead of fetching the member and its borrowings once for the stats
+        and again for the book list.
 
-            return borrowed_books
-        except Exception as e:
-            raise ValidationError(str(e))
+        Args:
+            member_id: The member ID
 
-    def get_member_active_books(self, member_id: uuid.UUID) -> List[Dict[str, Any]]:
-        """Get currently active book borrowings for a member"""
+        Returns:
+            Dictionary with member_id, borrowing_stats and borrowed_books, or
+            None if the member doesn't exist
+        """
+        dashboard = self.member_dashboard_repository.get_member_dashboard(
+            member_id, date.today(), settings.BORROWING_DAILY_FINE
+        )
+        if dashboard is None:
+            return None
+
+        return {
+            "member_id": dashboard.member.id,
+            "borrowing_stats": self._borrowing_stats(dashboard.member, dashboard.stats),
+            "borrowed_books": [
+                self._borrowed_book(borrowing.to_dict())
+                for borrowing in dashboard.active_borrowings
+            ],
+        }
+
+    def _borrowed_book(self, borrowing: Dict[str, Any]) -> Dict[str, Any]:
+        """Shape a borrowing dictionary as a borrowed book entry."""
+        return {
+            "book_id": borrowing["book_id"],
+            "book_title": borrowing["book_title"],
+            "borrowing_id": borrowing["id"],
+            "borrowing_date": borrowing["borrowing_date"],
+            "returning_date": borrowing["returning_date"],
+            "is_active": borrowing["is_returned"] is False,
+            "is_overdue": borrowing["is_overdue"],
+            "status": borrowing["status"],
+            "due_date": borrowing["due_date"],
+            "days_overdue": borrowing["days_overdue"],
+            "fine_amount": borrowing["fine_amount"],
+            "can_be_renewed": borrowing["can_be_renewed"],
+        }
+
+    def get_member_active_books(
+        self, member_id: uuid.UUID, expand_book: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Get currently active book borrowings for a member.
+
+        With expand_book the book entities are loaded in the same queries as
+        the borrowings and returned under "book".
+        """
         try:
-            borrowings = self.borrow_book_use_case.get_member_borrowings(member_id)
+            borrowings = self.borrow_book_use_case.get_member_borrowings(
+                member_id, with_book=expand_book
+            )
 
             # Filter for active borrowings (not returned)
             active_borrowings = [b for b in borrowings if not b["is_returned"]]
@@ -132,24 +180,110 @@ class MemberService:
                     "fine_amount": borrowing["fine_amount"],
                     "can_be_renewed": borrowing["can_be_renewed"],
                 }
+                if expand_book:
+                    book_data["book"] = borrowing["book"]
                 active_books.append(book_data)
 
             return active_books
         except Exception as e:
             raise ValidationError(str(e))
 
-    def get_overdue_borrowings(self) -> List[Dict[str, Any]]:
+    def get_member_history(
+        self,
+        member_id: uuid.UUID,
+        cursor: Optional[str] = None,
+        page_size: Optional[int] = None,
+        borrowed_from: Optional[str] = None,
+        borrowed_to: Optional[str] = None,
+        status: Optional[str] = None,
+        with_book: bool = False,
+    ) -> Optional[Page]:
         """
-        Get all overdue borrowings using the BorrowBookUseCase.
+        Get one keyset-paginated page of a member's borrowing history using the BorrowBookUseCase.
+
+        Args:
+            member_id: The member ID
+            cursor: Opaque cursor token from a previous page
+            page_size: Requested number of borrowings per page
+            borrowed_from: Only borrowings made on or after this ISO date
+            borrowed_to: Only borrowings made on or before this ISO date
+            status: One of active, borrowed, overdue or returned
+            with_book: Include each borrowing's book title
 
         Returns:
-            List of overdue borrowing dictionaries
+            Page of borrowing dictionaries with next and previous cursor tokens,
+            or None if the member doesn't exist
+
+        Raises:
+            ValidationError: If a filter, the cursor or the page size is invalid
         """
         try:
-            return self.borrow_book_use_case.get_overdue_borrowings()
-        except Exception as e:
+            return self.borrow_book_use_case.get_member_history(
+                member_id,
+                cursor,
+                page_size,
+                borrowed_from=borrowed_from,
+                borrowed_to=borrowed_to,
+                status=status,
+                with_book=with_book,
+            )
+        except ValueError as e:
             raise ValidationError(str(e))
 
+    def get_overdue_borrowings(
+        self, cursor: Optional[str] = None, page_size: Optional[int] = None
+    ) -> Page:
+        """
+        Get one keyset-paginated page of overdue borrowings using the BorrowBookUseCase.
+
+        Args:
+            cursor: Opaque cursor token from a previous page
+            page_size: Requested number of borrowings per page
+
+        Returns:
+            Page of overdue borrowing dictionaries with next and previous cursor tokens
+
+        Raises:
+            ValidationError: If the cursor or page size is invalid
+        """
+        try:
+            return self.borrow_book_use_case.get_overdue_borrowings(cursor, page_size)
+        except ValueError as e:
+            raise ValidationError(str(e))
+
+    def iter_overdue_borrowings(
+        self, chunk_size: int, as_of: Optional[date] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream every overdue borrowing in chunks using the BorrowBookUseCase.
+
+        Args:
+            chunk_size: Number of borrowings fetched per keyset query
+            as_of: The date to compute overdue status for (optional, defaults to today)
+
+        Returns:
+            Iterator over lists of overdue borrowing dictionaries
+
+        Raises:
+            ValidationError: If the chunk size is invalid
+        """
+        try:
+            return self.borrow_book_use_case.iter_overdue_borrowings(chunk_size, as_of)
+        except ValueError as e:
+            raise ValidationError(str(e))
+
+    def get_overdue_summary(self, as_of: Optional[date] = None) -> Dict[str, Any]:
+        """
+        Count overdue borrowings and total their fines using the BorrowBookUseCase.
+
+        Args:
+            as_of: The date to compute overdue status for (optional, defaults to today)
+
+        Returns:
+            Dictionary with overdue_count, total_days_overdue and total_fine
+        """
+        return self.borrow_book_use_case.get_overdue_summary(as_of)
+
     def renew_borrowing(self, borrowing_id: str) -> Dict[str, Any]:
         """
         Renew a borrowing using the BorrowBookUseCase.
@@ -180,8 +314,6 @@ class MemberService:
         """
         try:
             # Convert string date to date object if provided
-            from datetime import date
-
             parsed_return_date = None
             if return_date:
                 parsed_return_date = date.fromisoformat(return_date)
@@ -191,3 +323,30 @@ class MemberService:
             )
         except (ValueError, RuntimeError) as e:
             raise ValidationError(str(e))
+
+    def return_books(
+        self, borrowing_ids: List[str], return_date: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Return many borrowed books at once using the BorrowBookUseCase.
+
+        Args:
+            borrowing_ids: The borrowing IDs as strings
+            return_date: The return date as string (optional, defaults to today)
+
+        Returns:
+            Tuple of (returned borrowing dictionaries, per-ID errors)
+
+        Raises:
+            ValidationError: If the batch or the return date is invalid
+        """
+        try:
+            parsed_return_date = None
+            if return_date:
+                parsed_return_date = date.fromisoformat(return_date)
+
+            return self.borrow_book_use_case.return_books(
+                borrowing_ids, parsed_return_date
+            )
+        except (ValueError, RuntimeError) as e:
+            raise ValidationError(str(e))
@@ -1,6 +1,14 @@
 from django.urls import path
 
-from member.views.member_view import MemberActiveBooksView, MemberBorrowingView
+from member.views.member_view import (
+    BorrowingBatchReturnView,
+    BorrowingOverdueView,
+    BorrowingRenewView,
+    BorrowingReturnView,
+    MemberActiveBooksView,
+    MemberBorrowingView,
+    MemberHistoryView,
+)
 
 urlpatterns = [
     path(
@@ -13,4 +21,29 @@ urlpatterns = [
         MemberActiveBooksView.as_view(),
         name="member_active_books",
     ),
+    path(
+        "<uuid:member_id>/history/",
+        MemberHistoryView.as_view(),
+        name="member_history",
+    ),
+    path(
+        "borrowings/return/",
+        BorrowingBatchReturnView.as_view(),
+        name="borrowing_batch_return",
+    ),
+    path(
+        "borrowings/overdue/",
+        BorrowingOverdueView.as_view(),
+        name="borrowing_overdue",
+    ),
+    path(
+        "borrowings/<uuid:borrowing_id>/return/",
+        BorrowingReturnView.as_view(),
+        name="borrowing_return",
+    ),
+    path(
+        "borrowings/<uuid:borrowing_id>/renew/",
+        BorrowingRenewView.as_view(),
+        name="borrowing_renew",
+    ),
 ]
@@ -1,11 +1,19 @@
 import uuid
 from abc import ABC, abstractmethod
-from datetime import date
-from typing import Any, Dict, Optional
+from collections import Counter
+from datetime import date, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
 
 from book.entities.book_entity import BookEntity
+from book.repositories.book_inventory_repository import (
+    BookInventoryAbstractRepository,
+)
 from book.repositories.book_repository import BookAbstractRepository
 from book.services.book_crud_service import BookCrudService
+from librarymanagementsystem.pagination import Page, decode_cursor, resolve_page_size
 from member.entities.borrowing_entity import BorrowingEntity
 from member.entities.member_entity import MemberEntity
 from member.repositories.borrowing_repository import BorrowingAbstractRepository
@@ -61,20 +69,32 @@ class BookRepositoryInterface(ABC):
 class BorrowBookUseCase:
     """Use case for borrowing a book."""
 
+    # Maximum number of books a member may have borrowed at the same time
+    max_active_borrowings = 5
+
     def __init__(
         self,
         member_repository: MemberAbstractRepository,
         borrowing_repository: BorrowingAbstractRepository,
         book_crud_service: BookCrudService,
+        book_inventory_repository: BookInventoryAbstractRepository,
     ):
         self.member_repository = member_repository
         self.borrowing_repository = borrowing_repository
         self.book_crud_service = book_crud_service
+        self.book_inventory_repository = book_inventory_repository
 
     def execute(self, borrowing_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute the borrow book use case.
 
+        Runs in one transaction that locks the member row and then the book
+        row, always in that order to avoid deadlocks, so concurrent borrows of
+        the same member are checked one at a time and the book cannot be
+        deleted meanwhile. A copy is then taken from the book inventory with a
+        conditional counter update, which fails instead of overbooking when no
+        copy is left.
+
         Args:
             borrowing_data: Dictionary containing borrowing information
                 - member_id: str
@@ -95,35 +115,40 @@ class BorrowBookUseCase:
         member_id = uuid.UUID(borrowing_data["member_id"])
         book_id = borrowing_data["book_id"]
 
-        # Get member entity
-        member = self.member_repository.get_member_by_id(member_id)
-        if not member:
-            raise RuntimeError(f"Member with ID {member_id} not found")
+        # Get borrowing date
+        borrowing_date = borrowing_data.get("borrowing_date", date.today())
 
-        # Get book entity
-        book = self.book_crud_service.get_book_by_id(book_id)
-        if not book:
-            raise RuntimeError(f"Book with ID {book_id} not found")
+        with transaction.atomic():
+            # Lock member, then book
+            member = self.member_repository.lock_member(member_id)
+            if not member:
+                raise RuntimeError(f"Member with ID {member_id} not found")
 
-        # Check business rules
-        self._check_borrowing_rules(member, book)
+            book = self.book_crud_service.get_book_for_update(book_id)
+            if not book:
+                raise RuntimeError(f"Book with ID {book_id} not found")
 
-        # Get borrowing date
-        borrowing_date = borrowing_data.get("borrowing_date", date.today())
+            # Check business rules against the locked rows
+            active_counts = self.borrowing_repository.get_active_borrowing_counts(
+                member.id, book.id
+            )
+            self._check_borrowing_rules(member, book, active_counts)
 
-        # Create borrowing entity
-        borrowing_entity = BorrowingEntity.create(
-            book_id=book_id,
-            member_id=member_id,
-            borrowing_date=borrowing_date,
-        )
+            # Check if book is available for borrowing and take the copy
+            if not self.book_inventory_repository.reserve_copy(book.id):
+                raise RuntimeError(
+                    f"Book '{book.title}' is not available for borrowing"
+                )
 
-        # Save borrowing to repository
-        saved_borrowing = self.borrowing_repository.save_borrowing(borrowing_entity)
+            # Create borrowing entity
+            borrowing_entity = BorrowingEntity.create(
+                book_id=book.id,
+                member_id=member.id,
+                borrowing_date=borrowing_date,
+            )
 
-        # Update member's borrowing list
-        member.add_borrowing(saved_borrowing.id)
-        self.member_repository.save_member(member)
+            # Save borrowing to repository
+            saved_borrowing = self.borrowing_repository.save_borrowing(borrowing_entity)
 
         return saved_borrowing.to_dict()
 
@@ -150,80 +175,160 @@ class BorrowBookUseCase:
             if not isinstance(borrowing_data["borrowing_date"], date):
                 raise ValueError("borrowing_date must be a date object")
 
-    def _check_borrowing_rules(self, member: MemberEntity, book: BookEntity):
+    def _check_borrowing_rules(
+        self, member: MemberEntity, book: BookEntity, active_counts: Dict[str, int]
+    ):
         """Check business rules for borrowing."""
+        # Check if book is already borrowed by this member
+        if active_counts["member_book_active"]:
+            raise RuntimeError(
+                f"Member {member.get_full_name()} has already borrowed '{book.title}'"
+            )
+
         # Check if member can borrow more books
-        if not member.can_borrow_more_books():
+        if active_counts["member_active"] >= self.max_active_borrowings:
             raise RuntimeError(
                 f"Member {member.get_full_name()} has reached the maximum number of borrowings"
             )
 
-        # Check if book is available for borrowing
-        if not book.is_available_for_borrowing():
-            raise RuntimeError(f"Book '{book.title}' is not available for borrowing")
-
         # Check if member is a minor (additional restrictions could apply)
         if member.is_minor():
             # Could add special rules for minors here
             pass
 
-        # Check if book is already borrowed by this member
-        active_borrowings = (
-            self.borrowing_repository.get_active_borrowings_by_member_entity(member.id)
-        )
-        for borrowing in active_borrowings:
-            if borrowing.book_id == book.id:
-                raise RuntimeError(
-                    f"Member {member.get_full_name()} has already borrowed '{book.title}'"
-                )
-
     def return_book(
         self, borrowing_id: str, return_date: Optional[date] = None
     ) -> Dict[str, Any]:
         """
         Return a borrowed book.
 
+        The borrowing is closed with one conditional update, so two desks
+        scanning the same book cannot both return it, and its copy goes back
+        to the book inventory in the same transaction.
+
         Args:
             borrowing_id: The borrowing ID as string
             return_date: The return date (optional, defaults to today)
 
         Returns:
             Dictionary with updated borrowing details
+
+        Raises:
+            ValueError: If the ID or return date is invalid
+            RuntimeError: If the borrowing doesn't exist or can't be returned
         """
         try:
             borrowing_uuid = uuid.UUID(borrowing_id)
         except ValueError:
             raise ValueError(f"Invalid borrowing ID format: {borrowing_id}")
 
-        # Get borrowing entity (this would need to be implemented in the repository)
-        # For now, we'll assume we can get it somehow
-        # borrowing = self.borrowing_repository.get_borrowing_by_id(borrowing_uuid)
-        # if not borrowing:
-        #     raise RuntimeError(f"Borrowing with ID {borrowing_id} not found")
+        returned, errors = self._return_borrowings([borrowing_uuid], return_date)
+        if errors:
+            raise RuntimeError(errors[0]["error"])
+        return returned[0].to_dict()
 
-        # borrowing.return_book(return_date)
-        # saved_borrowing = self.borrowing_repository.save_borrowing(borrowing)
+    def return_books(
+        self, borrowing_ids: List[str], return_date: Optional[date] = None
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Return many borrowed books at once, e.g. from a book-drop scanner.
 
-        # Update member's borrowing list
-        # member = self.member_repository.get_member_by_id(borrowing.member_id)
-        # if member:
-        #     member.remove_borrowing(borrowing.id)
-        #     self.member_repository.save_member(member)
+        All borrowings are closed with one conditional update and their copies
+        released with one inventory update, whatever the batch size. IDs that
+        are invalid, unknown or already returned don't stop the others.
+
+        Args:
+            borrowing_ids: The borrowing IDs as strings
+            return_date: The return date (optional, defaults to today)
+
+        Returns:
+            Tuple of (returned borrowing dictionaries, errors), where each error
+            is a dict with the "borrowing_id" and the "error" message
 
-        # return saved_borrowing.to_dict()
+        Raises:
+            ValueError: If the batch or the return date is invalid
+        """
+        if not borrowing_ids:
+            raise ValueError("At least one borrowing ID is required")
+
+        max_items = settings.BORROWING_BATCH_RETURN_MAX_ITEMS
+        if len(borrowing_ids) > max_items:
+            raise ValueError(f"Cannot return more than {max_items} books at once")
+
+        borrowing_uuids = []
+        errors = []
+        for borrowing_id in dict.fromkeys(borrowing_ids):
+            try:
+                borrowing_uuids.append(uuid.UUID(str(borrowing_id)))
+            except ValueError:
+                errors.append(
+                    {
+                        "borrowing_id": str(borrowing_id),
+                        "error": f"Invalid borrowing ID format: {borrowing_id}",
+                    }
+                )
 
-        # Placeholder implementation
-        raise NotImplementedError("Return book functionality needs to be implemented")
+        returned, return_errors = self._return_borrowings(borrowing_uuids, return_date)
+        return [borrowing.to_dict() for borrowing in returned], errors + return_errors
+
+    def _return_borrowings(
+        self, borrowing_ids: List[uuid.UUID], return_date: Optional[date]
+    ) -> Tuple[List[BorrowingEntity], List[Dict[str, Any]]]:
+        """Return borrowings and explain the ones that couldn't be returned."""
+        if return_date is None:
+            return_date = date.today()
+        if return_date > date.today():
+            raise ValueError("Returning date cannot be in the future")
+
+        with transaction.atomic():
+            returned = self.borrowing_repository.return_borrowings(
+                borrowing_ids, return_date
+            )
+            self.book_inventory_repository.release_copies(
+                Counter(borrowing.book_id for borrowing in returned)
+            )
 
-    def get_member_borrowings(self, member_id: uuid.UUID) -> list[Dict[str, Any]]:
+        # Only unmatched IDs need a second look, to tell the caller why
+        returned_ids = {borrowing.id for borrowing in returned}
+        unmatched_ids = [
+            borrowing_id
+            for borrowing_id in borrowing_ids
+            if borrowing_id not in returned_ids
+        ]
+        errors = []
+        if unmatched_ids:
+            existing = self.borrowing_repository.get_borrowings_by_ids(unmatched_ids)
+            for borrowing_id in unmatched_ids:
+                borrowing = existing.get(borrowing_id)
+                if borrowing is None:
+                    error = f"Borrowing with ID {borrowing_id} not found"
+                elif borrowing.is_returned():
+                    error = "Book is already returned"
+                else:
+                    error = "Returning date cannot be before borrowing date"
+                errors.append({"borrowing_id": str(borrowing_id), "error": error})
+
+        # Keep the order the IDs were given in
+        position = {
+            borrowing_id: index for index, borrowing_id in enumerate(borrowing_ids)
+        }
+        returned.sort(key=lambda borrowing: position[borrowing.id])
+        return returned, errors
+
+    def get_member_borrowings(
+        self, member_id: uuid.UUID, with_book: bool = False
+    ) -> list[Dict[str, Any]]:
         """
         Get all borrowings for a member.
 
         Args:
             member_id: The member ID as string
+            with_book: Whether to load each borrowed book with its author,
+                publisher and genres in the same round of queries
 
         Returns:
-            List of borrowing dictionaries
+            List of borrowing dictionaries, each with the book entity under
+            "book" when with_book is set
         """
         try:
             member_uuid = member_id
@@ -231,54 +336,199 @@ class BorrowBookUseCase:
             raise ValueError(f"Invalid member ID format: {member_id}")
 
         # Verify member exists
-        member = self.member_repository.get_member_by_id(member_uuid)
-        if not member:
+        if not self.member_repository.member_exists(member_uuid):
             raise RuntimeError(f"Member with ID {member_id} not found")
 
+        if with_book:
+            return [
+                {**borrowing.to_dict(), "book": book}
+                for borrowing, book in (
+                    self.borrowing_repository.get_active_borrowings_with_books(
+                        member_uuid
+                    )
+                )
+            ]
+
         borrowings = self.borrowing_repository.get_active_borrowings_by_member_entity(
             member_uuid
         )
         return [borrowing.to_dict() for borrowing in borrowings]
 
-    def get_overdue_borrowings(self) -> list[Dict[str, Any]]:
+    def get_member_history(
+        self,
+        member_id: uuid.UUID,
+        cursor: Optional[str] = None,
+        page_size: Optional[int] = None,
+        borrowed_from: Optional[str] = None,
+        borrowed_to: Optional[str] = None,
+        status: Optional[str] = None,
+        with_book: bool = False,
+    ) -> Optional[Page]:
         """
-        Get all overdue borrowings.
+        Get one page of a member's borrowing history using keyset pagination.
+
+        The member is only looked up when the first page comes back empty, to
+        tell an unknown member apart from one with no matching borrowings.
+
+        Args:
+            member_id: The member ID
+            cursor: Opaque cursor token from a previous page, or None for the first page
+            page_size: Requested number of borrowings, capped at settings.MAX_PAGE_SIZE
+            borrowed_from: Only borrowings made on or after this ISO date (optional)
+            borrowed_to: Only borrowings made on or before this ISO date (optional)
+            status: One of active, borrowed, overdue or returned (optional)
+            with_book: Include each borrowing's book title
 
         Returns:
-            List of overdue borrowing dictionaries
+            Page of borrowing dictionaries ordered by borrowing date, newest
+            first, or None if the member doesn't exist
+
+        Raises:
+            ValueError: If a filter, the cursor or the page size is invalid
+        """
+        borrowed_from_date = self._parse_date_filter("borrowed_from", borrowed_from)
+        borrowed_to_date = self._parse_date_filter("borrowed_to", borrowed_to)
+        if (
+            borrowed_from_date is not None
+            and borrowed_to_date is not None
+            and borrowed_from_date > borrowed_to_date
+        ):
+            raise ValueError("borrowed_from cannot be after borrowed_to")
+
+        decoded_cursor = decode_cursor(cursor)
+        page = self.borrowing_repository.get_member_history_page(
+            member_id,
+            decoded_cursor,
+            resolve_page_size(page_size),
+            borrowed_from=borrowed_from_date,
+            borrowed_to=borrowed_to_date,
+            status=status or None,
+            with_book=with_book,
+        )
+        if (
+            not page.items
+            and decoded_cursor is None
+            and not self.member_repository.member_exists(member_id)
+        ):
+            return None
+
+        page.items = [borrowing.to_dict() for borrowing in page.items]
+        return page
+
+    def _parse_date_filter(self, name: str, value: Optional[str]) -> Optional[date]:
+        """Parse an optional ISO date query filter."""
+        if not value:
+            return None
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            raise ValueError(f"{name} must be a date in YYYY-MM-DD format")
+
+    def get_overdue_borrowings(
+        self,
+        cursor: Optional[str] = None,
+        page_size: Optional[int] = None,
+        as_of: Optional[date] = None,
+    ) -> Page:
+        """
+        Get one page of overdue borrowings using keyset pagination.
+
+        Days overdue and fines are computed by the database as of the given
+        date, at settings.BORROWING_DAILY_FINE per day.
+
+        Args:
+            cursor: Opaque cursor token from a previous page, or None for the first page
+            page_size: Requested number of borrowings, capped at settings.MAX_PAGE_SIZE
+            as_of: The date to compute overdue status for (optional, defaults to today)
+
+        Returns:
+            Page of overdue borrowing dictionaries ordered by (due_date, id)
+
+        Raises:
+            ValueError: If the cursor or page size is invalid
         """
-        # This would need to be implemented in the repository
-        # For now, we'll return an empty list
-        return []
+        return self.borrowing_repository.get_overdue_page(
+            as_of or date.today(),
+            settings.BORROWING_DAILY_FINE,
+            decode_cursor(cursor),
+            resolve_page_size(page_size),
+        )
+
+    def iter_overdue_borrowings(
+        self, chunk_size: int, as_of: Optional[date] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream every overdue borrowing in chunks.
+
+        Args:
+            chunk_size: Number of borrowings fetched per keyset query
+            as_of: The date to compute overdue status for (optional, defaults to today)
+
+        Returns:
+            Iterator over lists of overdue borrowing dictionaries ordered by
+            (due_date, id)
+
+        Raises:
+            ValueError: If the chunk size is not a positive integer
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+
+        return self.borrowing_repository.iter_overdue_chunks(
+            as_of or date.today(), settings.BORROWING_DAILY_FINE, chunk_size
+        )
+
+    def get_overdue_summary(self, as_of: Optional[date] = None) -> Dict[str, Any]:
+        """
+        Count overdue borrowings and total their days overdue and fines.
+
+        Args:
+            as_of: The date to compute overdue status for (optional, defaults to today)
+
+        Returns:
+            Dictionary with overdue_count, total_days_overdue and total_fine
+        """
+        return self.borrowing_repository.get_overdue_summary(
+            as_of or date.today(), settings.BORROWING_DAILY_FINE
+        )
 
     def renew_borrowing(self, borrowing_id: str) -> Dict[str, Any]:
         """
         Renew a borrowing.
 
+        The due date is extended with one conditional update that re-checks
+        the renewal rules of BorrowingEntity.can_be_renewed, so concurrent
+        renewals of the same borrowing extend it only once.
+
         Args:
             borrowing_id: The borrowing ID as string
 
         Returns:
             Dictionary with updated borrowing details
+
+        Raises:
+            ValueError: If the ID is invalid
+            RuntimeError: If the borrowing doesn't exist or can't be renewed
         """
         try:
             borrowing_uuid = uuid.UUID(borrowing_id)
         except ValueError:
             raise ValueError(f"Invalid borrowing ID format: {borrowing_id}")
 
-        # This would need to be implemented
-        # borrowing = self.borrowing_repository.get_borrowing_by_id(borrowing_uuid)
-        # if not borrowing:
-        #     raise RuntimeError(f"Borrowing with ID {borrowing_id} not found")
-
-        # if not borrowing.can_be_renewed():
-        #     raise RuntimeError("Borrowing cannot be renewed")
-
-        # borrowing.renew_borrowing()
-        # saved_borrowing = self.borrowing_repository.save_borrowing(borrowing)
-        # return saved_borrowing.to_dict()
-
-        # Placeholder implementation
-        raise NotImplementedError(
-            "Renew borrowing functionality needs to be implemented"
+        borrowed_since = date.today() - timedelta(
+            days=BorrowingEntity.renewal_window_days
+        )
+        renewed = self.borrowing_repository.renew_borrowing(
+            borrowing_uuid, BorrowingEntity.renewal_days, borrowed_since
         )
+        if renewed:
+            return renewed.to_dict()
+
+        borrowing = self.borrowing_repository.get_borrowings_by_ids(
+            [borrowing_uuid]
+        ).get(borrowing_uuid)
+        if not borrowing:
+            raise RuntimeError(f"Borrowing with ID {borrowing_id} not found")
+        if borrowing.is_returned():
+            raise RuntimeError("Book is already returned")
+        raise RuntimeError("Borrowing cannot be renewed")
@@ -1,12 +1,18 @@
+from django.forms import ValidationError as DjangoValidationError
 from rest_framework import status
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from librarymanagementsystem.container import container
+from librarymanagementsystem.pagination import page_url
 from member.serializers import (
+    BorrowingBatchReturnResponseSerializer,
+    BorrowingResponseSerializer,
     MemberActiveBooksResponseSerializer,
     MemberBorrowingResponseSerializer,
+    MemberHistoryPageResponseSerializer,
+    OverdueBorrowingPageResponseSerializer,
 )
 from member.services.member_service import MemberService
 
@@ -20,15 +26,19 @@ class MemberBorrowingView(APIView):
             # Use the container to get member service
             member_service: MemberService = container.member_container.member_service()
 
-            # Get borrowing statistics
-            stats = member_service.get_member_borrowing_stats(member_id)
-
-            # Get borrowed books list
-            borrowed_books = member_service.get_member_borrowed_books(member_id)
+            # Get borrowing statistics and borrowed books in one pass
+            dashboard = member_service.get_member_dashboard(member_id)
+            if dashboard is None:
+                return Response(
+                    {"error": f"Member with ID {member_id} not found"},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
 
             # Create and validate the response using serializer
             serializer = MemberBorrowingResponseSerializer.create_response(
-                member_id, stats, borrowed_books
+                dashboard["member_id"],
+                dashboard["borrowing_stats"],
+                dashboard["borrowed_books"],
             )
 
             return Response(serializer.data, status=status.HTTP_200_OK)
@@ -44,12 +54,19 @@ class MemberActiveBooksView(APIView):
     permission_classes = [AllowAny]
 
     def get(self, request, member_id):
-        """Get member's currently active book borrowings"""
+        """
+        Get member's currently active book borrowings.
+
+        Pass `expand=book` to embed each book with its author, publisher and
+        genres instead of only its ID.
+        """
         try:
             # Use the container to get member service
             member_service: MemberService = container.member_container.member_service()
 
-            active_books = member_service.get_member_active_books(member_id)
+            active_books = member_service.get_member_active_books(
+                member_id, expand_book=request.query_params.get("expand") == "book"
+            )
 
             # Create and validate the response using serializer
             serializer = MemberActiveBooksResponseSerializer.create_response(
@@ -63,3 +80,182 @@ class MemberActiveBooksView(APIView):
                 {"error": f"Failed to get member active books: {e!s}"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
+
+
+class MemberHistoryView(APIView):
+    permission_classes = [AllowAny]
+
+    def get(self, request, member_id):
+        """
+        Get one keyset-paginated page of a member's borrowing history.
+
+        Accepts the `cursor` and `page_size` query parameters, the
+        `borrowed_from` and `borrowed_to` date filters (YYYY-MM-DD, inclusive),
+        a `status` filter (active, borrowed, overdue or returned) and
+        `expand=book` to include book titles. Borrowings are returned newest
+        first, with `next` and `previous` links.
+        """
+        try:
+            member_service: MemberService = container.member_container.member_service()
+            params = request.query_params
+            page = member_service.get_member_history(
+                member_id,
+                cursor=params.get("cursor"),
+                page_size=params.get("page_size"),
+                borrowed_from=params.get("borrowed_from"),
+                borrowed_to=params.get("borrowed_to"),
+                status=params.get("status"),
+                with_book=params.get("expand") == "book",
+            )
+        except DjangoValidationError as ve:
+            return Response({"error": str(ve)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response(
+                {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+        if page is None:
+            return Response(
+                {"error": f"Member with ID {member_id} not found"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        serializer = MemberHistoryPageResponseSerializer.create_response(
+            member_id,
+            page.items,
+            page_url(request, page.next_cursor),
+            page_url(request, page.previous_cursor),
+        )
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class BorrowingReturnView(APIView):
+    permission_classes = [AllowAny]
+
+    def post(self, request, borrowing_id):
+        """
+        Return a borrowed book.
+
+        Args:
+            request: The HTTP request with an optional "return_date"
+                (YYYY-MM-DD, defaults to today)
+            borrowing_id: The borrowing to close
+
+        Returns:
+            200 with the updated borrowing, 400 if it can't be returned
+        """
+        try:
+            member_service: MemberService = container.member_container.member_service()
+            borrowing = member_service.return_book(
+                str(borrowing_id), request.data.get("return_date")
+            )
+        except DjangoValidationError as ve:
+            return Response({"error": str(ve)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response(
+                {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+        serializer = BorrowingResponseSerializer(borrowing)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class BorrowingRenewView(APIView):
+    permission_classes = [AllowAny]
+
+    def post(self, request, borrowing_id):
+        """
+        Renew a borrowing, extending its due date.
+
+        Returns:
+            200 with the updated borrowing, 400 if it can't be renewed
+        """
+        try:
+            member_service: MemberService = container.member_container.member_service()
+            borrowing = member_service.renew_borrowing(str(borrowing_id))
+        except DjangoValidationError as ve:
+            return Response({"error": str(ve)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response(
+                {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+        serializer = BorrowingResponseSerializer(borrowing)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class BorrowingBatchReturnView(APIView):
+    permission_classes = [AllowAny]
+
+    def post(self, request):
+        """
+        Return many borrowed books in one request, e.g. from a book-drop scanner.
+
+        Args:
+            request: The HTTP request with a body of the form
+                {"borrowing_ids": [...], "return_date": "YYYY-MM-DD"}, where
+                return_date is optional and defaults to today.
+
+        Returns:
+            200 with the returned borrowings and the rejected IDs if at least
+            one book was returned, otherwise 400 with the rejected IDs.
+        """
+        data = request.data if isinstance(request.data, dict) else {}
+        borrowing_ids = data.get("borrowing_ids")
+        if not isinstance(borrowing_ids, list) or not borrowing_ids:
+            return Response(
+                {"error": "Request body must contain a non-empty 'borrowing_ids' list"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            member_service: MemberService = container.member_container.member_service()
+            returned, errors = member_service.return_books(
+                borrowing_ids, data.get("return_date")
+            )
+        except DjangoValidationError as ve:
+            return Response({"error": str(ve)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response(
+                {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+        serializer = BorrowingBatchReturnResponseSerializer.create_response(
+            returned, errors
+        )
+        return Response(
+            serializer.data,
+            status=status.HTTP_200_OK if returned else status.HTTP_400_BAD_REQUEST,
+        )
+
+
+class BorrowingOverdueView(APIView):
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        """
+        Get one keyset-paginated page of overdue borrowings.
+
+        Accepts the `cursor` and `page_size` query parameters and returns the
+        borrowings most overdue first, with days overdue and fines as of today,
+        plus `next` and `previous` links.
+        """
+        try:
+            member_service: MemberService = container.member_container.member_service()
+            page = member_service.get_overdue_borrowings(
+                cursor=request.query_params.get("cursor"),
+                page_size=request.query_params.get("page_size"),
+            )
+        except DjangoValidationError as ve:
+            return Response({"error": str(ve)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response(
+                {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+        serializer = OverdueBorrowingPageResponseSerializer.create_response(
+            page.items,
+            page_url(request, page.next_cursor),
+            page_url(request, page.previous_cursor),
+        )
+        return Response(serializer.data, status=status.HTTP_200_OK)
@@ -0,0 +1,84 @@
+import uuid
+from datetime import date
+
+import pytest
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from book.models.author import Author
+from book.models.book import Book
+from book.models.genre import Genre
+from book.models.publisher import Publisher
+
+
+@pytest.mark.django_db
+class TestBookBatchViewIntegration(TestCase):
+    """Integration tests for looking up many books in one request."""
+
+    def setUp(self):
+        """Set up test data for each test."""
+        self.client = APIClient()
+        self.url = reverse("book_batch")
+
+        author = Author.objects.create(name="Test Author", birth_date=date(1980, 1, 1))
+        publisher = Publisher.objects.create(
+            name="Test Publisher", website="https://testpublisher.com"
+        )
+        genre = Genre.objects.create(name="Fiction")
+        self.books = []
+        for index in range(5):
+            book = Book.objects.create(
+                title=f"Test Book {index}",
+                description="A test book description for batch testing",
+                published_date=date(2020, 1, 1),
+                isbn=f"{9780000000000 + index}",
+                author=author,
+                publisher=publisher,
+            )
+            book.genres.add(genre)
+            self.books.append(book)
+
+    def test_results_follow_request_order(self):
+        """Test that books come back in request order with missing IDs reported."""
+        unknown_id = str(uuid.uuid4())
+        ids = [
+            str(self.books[3].id),
+            unknown_id,
+            str(self.books[0].id),
+            str(self.books[4].id),
+        ]
+
+        # One joined book query plus one genre prefetch, however many IDs
+        with self.assertNumQueries(2):
+            response = self.client.post(self.url, {"ids": ids}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.json()["results"]
+        self.assertEqual([book["id"] for book in results], [ids[0], ids[2], ids[3]])
+        self.assertEqual(results[0]["author"]["name"], "Test Author")
+        self.assertEqual(results[0]["genres"][0]["name"], "Fiction")
+        self.assertEqual(response.json()["missing"], [unknown_id])
+
+    def test_get_with_ids_query_parameter(self):
+        """Test the GET form with comma-separated IDs, repeated IDs once."""
+        ids = [str(self.books[1].id), str(self.books[2].id), str(self.books[1].id)]
+
+        response = self.client.get(self.url, {"ids": ",".join(ids)})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([book["id"] for book in response.json()["results"]], ids[:2])
+        self.assertEqual(response.json()["missing"], [])
+
+    @override_settings(BOOK_BATCH_LOOKUP_MAX_ITEMS=3)
+    def test_invalid_requests_are_rejected(self):
+        """Test that empty, malformed and oversized batches are rejected."""
+        ids = [str(book.id) for book in self.books]
+        for body in [{}, {"ids": []}, {"ids": "abc"}, {"ids": ["abc"]}, {"ids": ids}]:
+            response = self.client.post(self.url, body, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn("error", response.json())
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,164 @@
+import uuid
+from datetime import date
+from unittest import mock
+
+import pytest
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from book.models.author import Author
+from book.models.book import Book
+from book.models.genre import Genre
+from book.models.publisher import Publisher
+from librarymanagementsystem.container import container
+
+
+@pytest.mark.django_db
+class TestBookBulkCreateViewIntegration(TestCase):
+    """Integration tests for the bulk book create view."""
+
+    def setUp(self):
+        """Set up test data for each test."""
+        self.client = APIClient()
+        self.url = reverse("book_bulk_create")
+
+        self.author = Author.objects.create(
+            name="Test Author", birth_date=date(1980, 1, 1)
+        )
+        self.publisher = Publisher.objects.create(
+            name="Test Publisher", website="https://testpublisher.com"
+        )
+        self.genre = Genre.objects.create(name="Fiction")
+
+    def _book(self, index, **overrides):
+        book = {
+            "title": f"Bulk Book {index}",
+            "description": "A test book description for bulk testing",
+            "published_date": "2023-01-15",
+            "isbn": f"{9780000000000 + index}",
+            "author_id": str(self.author.id),
+            "publisher_id": str(self.publisher.id),
+            "genre_id": str(self.genre.id),
+        }
+        book.update(overrides)
+        return book
+
+    def test_bulk_create_success(self):
+        """Test that every valid book and its genre link is created."""
+        books = [self._book(index) for index in range(3)]
+
+        response = self.client.post(self.url, {"books": books}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        response_data = response.json()
+        self.assertEqual(response_data["created_count"], 3)
+        self.assertEqual(response_data["errors"], [])
+        self.assertEqual(
+            [book["isbn"] for book in response_data["created"]],
+            [book["isbn"] for book in books],
+        )
+        self.assertEqual(Book.objects.count(), 3)
+        self.assertEqual(self.genre.books.count(), 3)
+
+    def test_bulk_create_query_count_is_constant(self):
+        """Test that the number of queries does not grow with the batch."""
+        with CaptureQueriesContext(connection) as small_batch:
+            self.client.post(
+                self.url,
+                {"books": [self._book(index) for index in range(3)]},
+                format="json",
+            )
+        with CaptureQueriesContext(connection) as large_batch:
+            self.client.post(
+                self.url,
+                {"books": [self._book(index) for index in range(100, 130)]},
+                format="json",
+            )
+
+        self.assertEqual(Book.objects.count(), 33)
+        self.assertEqual(len(small_batch), len(large_batch))
+
+    def test_bulk_create_reports_per_item_errors(self):
+        """Test that invalid items are reported by index and the rest created."""
+        Book.objects.create(
+            title="Existing Book",
+            description="An existing book description",
+            published_date=date(2020, 1, 1),
+            isbn="9780000000001",
+            author=self.author,
+            publisher=self.publisher,
+        )
+        books = [
+            self._book(0),
+            self._book(1),
+            self._book(2, author_id=str(uuid.uuid4())),
+            self._book(0, title="Same ISBN Again"),
+            self._book(4, published_date="not-a-date"),
+        ]
+
+        response = self.client.post(self.url, {"books": books}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        response_data = response.json()
+        self.assertEqual(response_data["created_count"], 1)
+        self.assertEqual(response_data["error_count"], 4)
+        errors = {error["index"]: error["error"] for error in response_data["errors"]}
+        self.assertEqual(sorted(errors), [1, 2, 3, 4])
+        self.assertIn("already exists", errors[1])
+        self.assertEqual(errors[2], "Author not found")
+        self.assertIn("Duplicate ISBN", errors[3])
+        self.assertIn("published_date", errors[4])
+
+    def test_bulk_create_duplicate_isbn_race(self):
+        """Test that ISBNs taken after the check are reported, the rest created."""
+        Book.objects.create(
+            title="Concurrent Book",
+            description="Created by another request after the ISBN check",
+            published_date=date(2020, 1, 1),
+            isbn="9780000000001",
+            author=self.author,
+            publisher=self.publisher,
+        )
+        book_repository = container.book_container.book_repository()
+        real_get_existing_isbns = book_repository.get_existing_isbns
+        books = [self._book(index) for index in range(3)]
+
+        # The pre-insert check misses the book, as if it was not committed yet
+        with mock.patch.object(
+            book_repository,
+            "get_existing_isbns",
+            side_effect=[set(), real_get_existing_isbns(["9780000000001"])],
+        ):
+            response = self.client.post(self.url, {"books": books}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        response_data = response.json()
+        self.assertEqual(
+            [book["isbn"] for book in response_data["created"]],
+            ["9780000000000", "9780000000002"],
+        )
+        self.assertEqual(len(response_data["errors"]), 1)
+        self.assertEqual(response_data["errors"][0]["index"], 1)
+        self.assertIn("already exists", response_data["errors"][0]["error"])
+        self.assertEqual(Book.objects.count(), 3)
+
+    def test_bulk_create_all_invalid(self):
+        """Test that a batch with no valid books is rejected."""
+        books = [self._book(0, genre_id=str(uuid.uuid4()))]
+
+        response = self.client.post(self.url, {"books": books}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()["errors"][0]["error"], "Genre not found")
+        self.assertEqual(Book.objects.count(), 0)
+
+    def test_bulk_create_requires_books_list(self):
+        """Test that a missing or empty books list is rejected."""
+        response = self.client.post(self.url, {"books": []}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("error", response.json())
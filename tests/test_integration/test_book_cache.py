@@ -0,0 +1,120 @@
+from datetime import date
+
+import pytest
+from django.core.cache import caches
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from book.models.author import Author
+from book.models.book import Book
+from book.models.genre import Genre
+from book.models.publisher import Publisher
+from librarymanagementsystem.cache import CountingLocMemCache
+from librarymanagementsystem.container import container
+
+
+@pytest.mark.django_db
+class TestBookCacheIntegration(TestCase):
+    """Integration tests for the read-through book detail cache."""
+
+    def setUp(self):
+        """Set up test data for each test."""
+        caches["books"].clear()
+        self.client = APIClient()
+
+        self.author = Author.objects.create(
+            name="Test Author", birth_date=date(1980, 1, 1)
+        )
+        self.publisher = Publisher.objects.create(
+            name="Test Publisher", website="https://testpublisher.com"
+        )
+        self.genre = Genre.objects.create(name="Fiction")
+        self.book = Book.objects.create(
+            title="Cached Book",
+            description="A test book description for cache testing",
+            published_date=date(2020, 1, 1),
+            isbn="1234567890123",
+            author=self.author,
+            publisher=self.publisher,
+        )
+        self.book.genres.add(self.genre)
+        self.url = reverse("book_get_by_id", kwargs={"book_id": self.book.id})
+
+    def _stats(self):
+        return self.client.get(reverse("book_cache_stats")).json()
+
+    def test_second_read_is_served_from_cache(self):
+        """Test that a repeated detail read does not hit the database."""
+        before = self._stats()
+
+        first = self.client.get(self.url)
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url)
+
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(first.json(), second.json())
+        after = self._stats()
+        self.assertEqual(after["misses"] - before["misses"], 1)
+        self.assertEqual(after["hits"] - before["hits"], 1)
+        # The entry and its version key
+        self.assertEqual(after["size"], 2)
+
+    def test_add_book_to_genre_invalidates_cached_book(self):
+        """Test that adding a genre drops the cached book."""
+        self.client.get(self.url)
+        invalidations = self._stats()["invalidations"]
+
+        mystery = Genre.objects.create(name="Mystery")
+        # Invalidation runs on commit; TestCase never commits, so run it here
+        with self.captureOnCommitCallbacks(execute=True):
+            container.book_container.book_repository().add_book_to_genre(
+                self.book.id, mystery
+            )
+
+        response = self.client.get(self.url)
+        self.assertEqual(
+            {genre["name"] for genre in response.json()["genres"]},
+            {"Fiction", "Mystery"},
+        )
+        self.assertEqual(self._stats()["invalidations"] - invalidations, 1)
+
+    def test_reader_cannot_cache_a_row_older_than_the_last_write(self):
+        """Test that a row loaded before a write committed is never served."""
+        book_cache = container.book_container.book_cache_repository()
+        book_repository = container.book_container.book_repository()
+
+        # A reader misses and loads the row...
+        cached, version = book_cache.get_book(self.book.id)
+        self.assertIsNone(cached)
+        stale = book_repository.get_book_by_id(self.book.id)
+
+        # ...a write commits and invalidates it...
+        mystery = Genre.objects.create(name="Mystery")
+        with self.captureOnCommitCallbacks(execute=True):
+            book_repository.add_book_to_genre(self.book.id, mystery)
+
+        # ...and only then does the reader store what it loaded
+        book_cache.set_book(stale, version)
+
+        cached, _ = book_cache.get_book(self.book.id)
+        self.assertIsNone(cached)
+        response = self.client.get(self.url)
+        self.assertEqual(
+            {genre["name"] for genre in response.json()["genres"]},
+            {"Fiction", "Mystery"},
+        )
+
+    def test_evictions_are_counted(self):
+        """Test that culling least recently used entries is counted."""
+        cache = CountingLocMemCache(
+            "test-evictions", {"OPTIONS": {"MAX_ENTRIES": 2, "CULL_FREQUENCY": 2}}
+        )
+        for index in range(3):
+            cache.set(f"key-{index}", index)
+
+        stats = cache.stats()
+        self.assertEqual(stats["evictions"], 1)
+        self.assertEqual(stats["size"], 2)
+        self.assertIsNone(cache.get("key-0"))
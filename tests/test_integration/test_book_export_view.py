@@ -0,0 +1,95 @@
+import csv
+import io
+import json
+from datetime import date
+
+import pytest
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from book.models.author import Author
+from book.models.book import Book
+from book.models.genre import Genre
+from book.models.publisher import Publisher
+
+
+@pytest.mark.django_db
+class TestBookExportViewIntegration(TestCase):
+    """Integration tests for the streaming book export endpoint."""
+
+    def setUp(self):
+        """Set up test data for each test."""
+        self.client = APIClient()
+        self.url = reverse("book_export")
+
+        self.author = Author.objects.create(
+            name="Test Author", birth_date=date(1980, 1, 1)
+        )
+        self.publisher = Publisher.objects.create(
+            name="Test Publisher", website="https://testpublisher.com"
+        )
+        self.fiction = Genre.objects.create(name="Fiction")
+        self.mystery = Genre.objects.create(name="Mystery")
+
+        for index in range(5):
+            book = Book.objects.create(
+                title=f"Test Book {index}",
+                description="A test book description for export testing",
+                published_date=date(2020, 1, 1),
+                isbn=f"123456789012{index}",
+                author=self.author,
+                publisher=self.publisher,
+            )
+            book.genres.add(self.fiction, self.mystery)
+
+        self.expected_ids = [
+            str(book_id)
+            for book_id in Book.objects.order_by("created_at", "id").values_list(
+                "id", flat=True
+            )
+        ]
+
+    def _content(self, response) -> str:
+        return b"".join(response.streaming_content).decode()
+
+    def test_export_ndjson_matches_list_shape(self):
+        """Test that NDJSON export yields one enriched record per book."""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        records = [json.loads(line) for line in self._content(response).splitlines()]
+        self.assertEqual([record["id"] for record in records], self.expected_ids)
+
+        listed = self.client.get(reverse("book_create_and_get")).json()["results"]
+        self.assertEqual(records, listed)
+
+    def test_export_csv(self):
+        """Test that CSV export writes a header and one row per book."""
+        response = self.client.get(f"{self.url}?output=csv")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        rows = list(csv.DictReader(io.StringIO(self._content(response))))
+        self.assertEqual([row["id"] for row in rows], self.expected_ids)
+        self.assertEqual(rows[0]["author_name"], "Test Author")
+        self.assertEqual(set(rows[0]["genre_names"].split(";")), {"Fiction", "Mystery"})
+
+    @override_settings(BOOK_EXPORT_CHUNK_SIZE=2)
+    def test_export_batches_genres_per_chunk(self):
+        """Test that genres are loaded with one query per chunk, not per book."""
+        response = self.client.get(self.url)
+
+        # One book query plus one genre query for each of the 3 chunks
+        with self.assertNumQueries(4):
+            lines = self._content(response).splitlines()
+        self.assertEqual(len(lines), 5)
+
+    def test_export_invalid_output(self):
+        """Test that an unknown output format is rejected."""
+        response = self.client.get(f"{self.url}?output=xml")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("error", response.json())
@@ -0,0 +1,128 @@
+import uuid
+from datetime import date
+
+import pytest
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from book.models.author import Author
+from book.models.book import Book
+from book.models.genre import Genre
+from book.models.publisher import Publisher
+
+
+@pytest.mark.django_db
+class TestBookFilterViewsIntegration(TestCase):
+    """Integration tests for the books by author, publisher, genre and classics."""
+
+    def setUp(self):
+        """Set up test data for each test."""
+        self.client = APIClient()
+
+        self.author = Author.objects.create(
+            name="Test Author", birth_date=date(1920, 1, 1)
+        )
+        self.other_author = Author.objects.create(
+            name="Other Author", birth_date=date(1980, 1, 1)
+        )
+        self.publisher = Publisher.objects.create(
+            name="Test Publisher", website="https://testpublisher.com"
+        )
+        self.genre = Genre.objects.create(name="Fiction")
+        self.empty_genre = Genre.objects.create(name="Poetry")
+
+        # Books 0-3 by the test author (0 and 1 classics), 4 by the other author
+        self.books = []
+        for index in range(5):
+            book = Book.objects.create(
+                title=f"Test Book {index}",
+                description="A test book description for filter testing",
+                published_date=date(1950 + 30 * (index // 2), 1, 1),
+                isbn=f"{9780000000000 + index}",
+                author=self.author if index < 4 else self.other_author,
+                publisher=self.publisher,
+            )
+            if index % 2 == 0:
+                book.genres.add(self.genre)
+            self.books.append(book)
+
+    def _ids(self, response):
+        return [book["id"] for book in response.json()["results"]]
+
+    def test_books_by_author_pages_in_creation_order(self):
+        """Test walking an author's books with cursors."""
+        url = reverse("books_by_author", kwargs={"author_id": self.author.id})
+
+        seen = []
+        next_url = f"{url}?page_size=3"
+        while next_url:
+            # Joined book query plus genre prefetch; no author lookup
+            with self.assertNumQueries(2):
+                response = self.client.get(next_url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            seen.extend(self._ids(response))
+            next_url = response.json()["next"]
+
+        self.assertEqual(seen, [str(book.id) for book in self.books[:4]])
+        self.assertEqual(response.json()["results"][0]["author"]["name"], "Test Author")
+
+    def test_projections(self):
+        """Test the id-only and count-only projections."""
+        url = reverse("books_by_publisher", kwargs={"publisher_id": self.publisher.id})
+
+        with self.assertNumQueries(1):
+            response = self.client.get(url, {"projection": "ids", "page_size": 2})
+        self.assertEqual(
+            response.json()["results"], [str(book.id) for book in self.books[:2]]
+        )
+        self.assertIsNotNone(response.json()["next"])
+
+        with self.assertNumQueries(1):
+            response = self.client.get(url, {"projection": "count"})
+        self.assertEqual(response.json(), {"count": 5})
+
+    def test_books_by_genre(self):
+        """Test that genre filtering goes through the genre-book links."""
+        url = reverse("books_by_genre", kwargs={"genre_id": self.genre.id})
+
+        response = self.client.get(url)
+        self.assertEqual(
+            self._ids(response), [str(self.books[index].id) for index in (0, 2, 4)]
+        )
+        self.assertEqual(
+            self.client.get(url, {"projection": "count"}).json(), {"count": 3}
+        )
+
+    def test_classic_books(self):
+        """Test that classics are the books at least 50 years old."""
+        response = self.client.get(reverse("book_classics"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self._ids(response), [str(book.id) for book in self.books[:2]])
+
+    def test_empty_and_unknown_filters(self):
+        """Test that an existing entity without books differs from an unknown one."""
+        url = reverse("books_by_genre", kwargs={"genre_id": self.empty_genre.id})
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["results"], [])
+
+        for name, kwarg in [
+            ("books_by_author", "author_id"),
+            ("books_by_publisher", "publisher_id"),
+            ("books_by_genre", "genre_id"),
+        ]:
+            url = reverse(name, kwargs={kwarg: uuid.uuid4()})
+            self.assertEqual(
+                self.client.get(url).status_code, status.HTTP_404_NOT_FOUND
+            )
+
+    def test_invalid_parameters(self):
+        """Test that bad projections, cursors and page sizes are rejected."""
+        url = reverse("books_by_author", kwargs={"author_id": self.author.id})
+        for params in [{"projection": "titles"}, {"cursor": "x"}, {"page_size": 0}]:
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn("error", response.json())
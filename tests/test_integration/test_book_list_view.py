@@ -0,0 +1,158 @@
+from datetime import date
+
+import pytest
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from book.models.author import Author
+from book.models.book import Book
+from book.models.book_inventory import BookInventory
+from book.models.genre import Genre
+from book.models.publisher import Publisher
+from librarymanagementsystem.pagination import encode_cursor
+
+
+@pytest.mark.django_db
+class TestBookListViewIntegration(TestCase):
+    """Integration tests for the keyset-paginated book list endpoint."""
+
+    def setUp(self):
+        """Set up test data for each test."""
+        self.client = APIClient()
+        self.url = reverse("book_create_and_get")
+
+        self.author = Author.objects.create(
+            name="Test Author", birth_date=date(1980, 1, 1)
+        )
+        self.publisher = Publisher.objects.create(
+            name="Test Publisher", website="https://testpublisher.com"
+        )
+        self.genre = Genre.objects.create(name="Fiction")
+
+        for index in range(5):
+            book = Book.objects.create(
+                title=f"Test Book {index}",
+                description="A test book description for list testing",
+                published_date=date(2020, 1, 1),
+                isbn=f"123456789012{index}",
+                author=self.author,
+                publisher=self.publisher,
+            )
+            book.genres.add(self.genre)
+            BookInventory.objects.create(
+                book=book, total_copies=2, available_copies=index % 3
+            )
+
+        self.expected_ids = [
+            str(book_id)
+            for book_id in Book.objects.order_by("created_at", "id").values_list(
+                "id", flat=True
+            )
+        ]
+
+    def test_list_books_walks_all_pages(self):
+        """Test that following next links visits every book exactly once."""
+        seen_ids = []
+        url = f"{self.url}?page_size=2"
+        pages = 0
+
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            response_data = response.json()
+            seen_ids.extend(book["id"] for book in response_data["results"])
+            url = response_data["next"]
+            pages += 1
+
+        self.assertEqual(pages, 3)
+        self.assertEqual(seen_ids, self.expected_ids)
+
+    def test_list_books_previous_link_returns_prior_page(self):
+        """Test that the previous link of the second page returns the first page."""
+        first_page = self.client.get(f"{self.url}?page_size=2").json()
+        self.assertIsNone(first_page["previous"])
+
+        second_page = self.client.get(first_page["next"]).json()
+        previous_page = self.client.get(second_page["previous"]).json()
+
+        self.assertEqual(
+            [book["id"] for book in previous_page["results"]],
+            [book["id"] for book in first_page["results"]],
+        )
+
+    @override_settings(MAX_PAGE_SIZE=3)
+    def test_list_books_page_size_is_capped(self):
+        """Test that page_size cannot exceed the configured maximum."""
+        response = self.client.get(f"{self.url}?page_size=100")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()["results"]), 3)
+
+    def test_list_books_invalid_cursor(self):
+        """Test that a malformed cursor is rejected."""
+        response = self.client.get(f"{self.url}?cursor=not-a-cursor")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("error", response.json())
+
+    def test_list_books_cursor_with_non_string_position(self):
+        """Test that a well-formed cursor holding non-string values is rejected."""
+        for position in ([{"a": 1}, 5], [1.5, 2]):
+            cursor = encode_cursor(position)
+            response = self.client.get(f"{self.url}?cursor={cursor}")
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn("error", response.json())
+
+    def test_list_books_invalid_page_size(self):
+        """Test that a non-positive page_size is rejected."""
+        response = self.client.get(f"{self.url}?page_size=0")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("error", response.json())
+
+    def test_list_books_returns_every_genre(self):
+        """Test that each listed book exposes all of its genres."""
+        second_genre = Genre.objects.create(name="Mystery")
+        Book.objects.get(id=self.expected_ids[0]).genres.add(second_genre)
+
+        response = self.client.get(self.url)
+
+        first_book = response.json()["results"][0]
+        self.assertEqual(
+            {genre["name"] for genre in first_book["genres"]}, {"Fiction", "Mystery"}
+        )
+
+    def test_list_books_exposes_availability(self):
+        """Test that each listed book reports its copy counters."""
+        results = self.client.get(self.url).json()["results"]
+
+        by_id = {book["id"]: book for book in results}
+        for inventory in BookInventory.objects.all():
+            book = by_id[str(inventory.book_id)]
+            self.assertEqual(book["total_copies"], 2)
+            self.assertEqual(book["available_copies"], inventory.available_copies)
+            self.assertEqual(book["is_available"], inventory.available_copies > 0)
+
+    def test_list_books_query_count_is_constant(self):
+        """Test that listing books does not issue per-row queries."""
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.json()["results"]), 5)
+
+        for index in range(5, 20):
+            book = Book.objects.create(
+                title=f"Test Book {index}",
+                description="A test book description for list testing",
+                published_date=date(2020, 1, 1),
+                isbn=f"12345678901{index}",
+                author=self.author,
+                publisher=self.publisher,
+            )
+            book.genres.add(self.genre, Genre.objects.create(name=f"Genre {index}"))
+
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.json()["results"]), 20)
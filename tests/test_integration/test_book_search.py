@@ -0,0 +1,212 @@
+from datetime import date
+
+import pytest
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from book.models.author import Author
+from book.models.book import Book
+from book.models.publisher import Publisher
+from book.repositories.book_search_repository import PostgresBookSearchRepository
+from librarymanagementsystem import container
+
+
+@pytest.mark.django_db
+class TestBookSearchIntegration(TestCase):
+    """Integration tests for the ranked book search endpoint."""
+
+    def setUp(self):
+        """Set up test data for each test."""
+        self.client = APIClient()
+        self.url = reverse("book_search")
+
+        self.tolkien = Author.objects.create(
+            name="J. R. R. Tolkien", birth_date=date(1892, 1, 3)
+        )
+        self.herbert = Author.objects.create(
+            name="Frank Herbert", birth_date=date(1920, 10, 8)
+        )
+        self.publisher = Publisher.objects.create(
+            name="Test Publisher", website="https://testpublisher.com"
+        )
+        self.hobbit = self._create_book(
+            "The Hobbit", "A hobbit is swept into a quest for dragon gold.", 1
+        )
+        self.rings = self._create_book(
+            "The Lord of the Rings", "The quest to destroy the One Ring.", 2
+        )
+        self.dune = self._create_book(
+            "Dune",
+            "A desert planet, its spice and the dragons of sand.",
+            3,
+            author=self.herbert,
+        )
+
+    def _create_book(self, title, description, index, author=None):
+        return Book.objects.create(
+            title=title,
+            description=description,
+            published_date=date(1960, 1, 1),
+            isbn=f"{9780000000000 + index}",
+            author=author or self.tolkien,
+            publisher=self.publisher,
+        )
+
+    def _titles(self, response):
+        return [book["title"] for book in response.json()["results"]]
+
+    def test_search_ranks_title_matches_first(self):
+        """Test that a title match outranks a description match."""
+        response = self.client.get(self.url, {"q": "hobbit"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self._titles(response), ["The Hobbit"])
+
+        response = self.client.get(self.url, {"q": "dragons"})
+        self.assertEqual(self._titles(response), ["Dune", "The Hobbit"])
+
+    def test_search_matches_author_name(self):
+        """Test that books are found by their author's name."""
+        response = self.client.get(self.url, {"q": "tolkien"})
+
+        self.assertEqual(
+            sorted(self._titles(response)), ["The Hobbit", "The Lord of the Rings"]
+        )
+        self.assertEqual(
+            response.json()["results"][0]["author"]["name"], "J. R. R. Tolkien"
+        )
+
+    def test_search_index_follows_writes(self):
+        """Test that renamed books and authors are searchable right away."""
+        self.dune.title = "Children of Dune"
+        self.dune.save()
+        self.herbert.name = "Francis Herbert"
+        self.herbert.save()
+
+        self.assertEqual(
+            self._titles(self.client.get(self.url, {"q": "children"})),
+            ["Children of Dune"],
+        )
+        self.assertEqual(
+            self._titles(self.client.get(self.url, {"q": "francis"})),
+            ["Children of Dune"],
+        )
+
+        self.hobbit.delete()
+        self.assertEqual(self._titles(self.client.get(self.url, {"q": "hobbit"})), [])
+
+    def test_search_pages_with_cursors(self):
+        """Test that following next links visits every match once, in rank order."""
+        expected = self._titles(self.client.get(self.url, {"q": "the"}))
+        self.assertEqual(len(expected), 3)
+
+        seen = []
+        url = f"{self.url}?q=the&page_size=2"
+        while url:
+            with self.assertNumQueries(3):
+                response = self.client.get(url)
+            seen.extend(self._titles(response))
+            last_page = response.json()
+            url = last_page["next"]
+        self.assertEqual(seen, expected)
+
+        previous_page = self.client.get(last_page["previous"])
+        self.assertEqual(self._titles(previous_page), expected[:2])
+
+    @override_settings(BOOK_SEARCH_MAX_CANDIDATES=2)
+    def test_search_ranks_capped_candidates(self):
+        """Test that only the first candidates in index order are ranked."""
+        response = self.client.get(self.url, {"q": "the"})
+
+        self.assertEqual(
+            sorted(self._titles(response)), ["The Hobbit", "The Lord of the Rings"]
+        )
+        self.assertIsNone(response.json()["next"])
+
+    def test_search_treats_query_syntax_literally(self):
+        """Test that search operators in user input cannot break the query."""
+        response = self.client.get(self.url, {"q": 'hobbit" OR (dune*'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self._titles(response), [])
+
+    def test_search_rejects_invalid_queries(self):
+        """Test that empty and malformed requests are rejected."""
+        for params in [{}, {"q": "   "}, {"q": "x" * 201}, {"q": "a", "cursor": "x"}]:
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn("error", response.json())
+
+
+@pytest.mark.postgresql
+@pytest.mark.django_db
+class TestPostgresBookSearchIntegration(TestCase):
+    """Integration tests for the PostgreSQL search SQL, run on PostgreSQL only."""
+
+    def setUp(self):
+        """Set up test data for each test."""
+        self.repository = PostgresBookSearchRepository(
+            book_repository=container.book_container.book_repository()
+        )
+        author = Author.objects.create(
+            name="J. R. R. Tolkien", birth_date=date(1892, 1, 3)
+        )
+        publisher = Publisher.objects.create(
+            name="Test Publisher", website="https://testpublisher.com"
+        )
+        self.books = [
+            Book.objects.create(
+                title=title,
+                description=description,
+                published_date=date(1960, 1, 1),
+                isbn=f"{9780000000000 + index}",
+                author=author,
+                publisher=publisher,
+            )
+            for index, (title, description) in enumerate(
+                [
+                    ("The Hobbit", "A hobbit is swept into a quest for dragon gold."),
+                    ("Bilbo's Journey", "The hobbit returns home."),
+                    ("The Silmarillion", "The elder days of Middle-earth."),
+                ]
+            )
+        ]
+
+    def _ranked(self, query, limit=10):
+        sql, params = self.repository._ranked_sql(query, limit)
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return sorted(cursor.fetchall(), key=lambda row: -row[1])
+
+    def test_ranked_sql_ranks_title_matches_first(self):
+        """Test that a title match outranks a description match."""
+        rows = self._ranked("hobbit")
+
+        self.assertEqual(
+            [book_id for book_id, _ in rows], [self.books[0].id, self.books[1].id]
+        )
+        self.assertGreater(rows[0][1], rows[1][1])
+
+    def test_ranked_sql_matches_misspelled_titles(self):
+        """Test that titles within trigram similarity match without the words."""
+        rows = self._ranked("Silmarilion")
+
+        self.assertEqual([book_id for book_id, _ in rows], [self.books[2].id])
+
+    def test_ranked_sql_caps_candidates(self):
+        """Test that only the lowest ids among the matches are ranked."""
+        rows = self._ranked("tolkien", limit=2)
+
+        self.assertEqual(
+            sorted(book_id for book_id, _ in rows),
+            sorted(book.id for book in self.books)[:2],
+        )
+
+    def test_search_books_pages_in_rank_order(self):
+        """Test that the first page over the ranked SQL holds the best match."""
+        first = self.repository.search_books("tolkien hobbit", None, 1)
+        self.assertEqual([book.id for book in first.items], [self.books[0].id])
+        self.assertIsNotNone(first.next_cursor)
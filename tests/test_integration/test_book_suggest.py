@@ -0,0 +1,203 @@
+import threading
+import time
+from dataclasses import replace
+from datetime import date
+from unittest import mock
+
+import pytest
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from book.entities.author_entity import AuthorEntity
+from book.entities.book_entity import BookEntity
+from book.models.author import Author
+from book.models.book import Book
+from book.models.genre import Genre
+from book.models.publisher import Publisher
+from librarymanagementsystem.container import container
+
+
+@pytest.mark.django_db
+class TestBookSuggestIntegration(TestCase):
+    """Integration tests for the in-process title and author autocomplete."""
+
+    def setUp(self):
+        """Set up test data for each test."""
+        self.client = APIClient()
+        self.url = reverse("book_suggest")
+
+        self.author = Author.objects.create(
+            name="Émile Zola", birth_date=date(1840, 4, 2)
+        )
+        self.publisher = Publisher.objects.create(
+            name="Test Publisher", website="https://testpublisher.com"
+        )
+        self.genre = Genre.objects.create(name="Fiction")
+        for index, title in enumerate(["Germinal", "Nana", "Thérèse Raquin"]):
+            Book.objects.create(
+                title=title,
+                description="A test book description for suggest testing",
+                published_date=date(1880, 1, 1),
+                isbn=f"{9780000000000 + index}",
+                author=self.author,
+                publisher=self.publisher,
+            )
+        # The index is a process-wide singleton; rebuild it from this test's data
+        self.index = container.book_container.book_autocomplete_repository()
+        self.index.rebuild()
+
+    def _texts(self, response):
+        return [suggestion["text"] for suggestion in response.json()["results"]]
+
+    def test_prefix_ignores_case_and_accents(self):
+        """Test that suggestions match typed prefixes without a database query."""
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, {"prefix": "THE"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["prefix"], "THE")
+        self.assertEqual(self._texts(response), ["Thérèse Raquin"])
+        self.assertEqual(response.json()["results"][0]["kind"], "title")
+
+        response = self.client.get(self.url, {"prefix": "emile"})
+        self.assertEqual(
+            response.json()["results"],
+            [{"kind": "author", "id": str(self.author.id), "text": "Émile Zola"}],
+        )
+
+    def test_limit_caps_results(self):
+        """Test that results come back in alphabetical order up to the limit."""
+        Book.objects.create(
+            title="Nana II",
+            description="A test book description for suggest testing",
+            published_date=date(1880, 1, 1),
+            isbn="9780000000009",
+            author=self.author,
+            publisher=self.publisher,
+        )
+        self.index.rebuild()
+
+        response = self.client.get(self.url, {"prefix": "na", "limit": 1})
+        self.assertEqual(self._texts(response), ["Nana"])
+        response = self.client.get(self.url, {"prefix": "na"})
+        self.assertEqual(self._texts(response), ["Nana", "Nana II"])
+
+    def test_created_books_are_suggested(self):
+        """Test that a book created through the API is indexed on commit."""
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse("book_create_and_get"),
+                {
+                    "title": "L'Assommoir",
+                    "description": "A test book description for suggest testing",
+                    "published_date": "1877-01-01",
+                    "isbn": "9780000000010",
+                    "author_id": str(self.author.id),
+                    "publisher_id": str(self.publisher.id),
+                    "genre_id": str(self.genre.id),
+                },
+                format="json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, {"prefix": "l'ass"})
+        self.assertEqual(self._texts(response), ["L'Assommoir"])
+
+    def test_added_titles_are_merged_in_one_pass(self):
+        """Test that a batch of titles is merged in order, skipping duplicates."""
+        nana = Book.objects.get(title="Nana")
+        books = [
+            BookEntity(
+                title=title,
+                description="A test book description for suggest testing",
+                published_date=date(1880, 1, 1),
+                isbn=f"{9780000000020 + index}",
+            )
+            for index, title in enumerate(["La Bête humaine", "Au Bonheur des Dames"])
+        ]
+        books.append(replace(books[0], id=nana.id, title="Nana"))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.index.add_books(books)
+
+        self.assertEqual(self.index._keys, sorted(self.index._keys))
+        self.assertEqual(self.index.get_stats()["titles"], 5)
+        self.assertEqual(
+            self._texts(self.client.get(self.url, {"prefix": "a"})),
+            ["Au Bonheur des Dames"],
+        )
+        # Lookups never wait for a write being merged
+        with self.index._write_lock:
+            self.assertEqual(
+                self._texts(self.client.get(self.url, {"prefix": "la b"})),
+                ["La Bête humaine"],
+            )
+
+    def test_saved_authors_are_suggested(self):
+        """Test that saved authors are indexed on commit, replacing old names."""
+        author_repository = container.book_container.author_repository()
+        with self.captureOnCommitCallbacks(execute=True):
+            author_entity = author_repository.save_author(
+                AuthorEntity(name="Emile Gaboriau", birth_date=date(1832, 11, 9))
+            )
+        self.assertEqual(
+            self._texts(self.client.get(self.url, {"prefix": "emile"})),
+            ["Emile Gaboriau", "Émile Zola"],
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.index.save_author(replace(author_entity, name="Gaboriau"))
+        self.assertEqual(
+            self._texts(self.client.get(self.url, {"prefix": "emile"})),
+            ["Émile Zola"],
+        )
+        self.assertEqual(
+            self.client.get(reverse("book_suggest_stats")).json()["authors"], 2
+        )
+
+    @override_settings(BOOK_SUGGEST_MAX_AGE=60)
+    def test_stale_index_is_rebuilt_in_the_background(self):
+        """Test that a stale index is still served while a thread rebuilds it."""
+        rebuilt = threading.Event()
+        rebuild_threads = []
+
+        def rebuild():
+            rebuild_threads.append(threading.current_thread())
+            rebuilt.set()
+
+        self.index._built_at = time.monotonic() - 120
+        with mock.patch.object(self.index, "rebuild", side_effect=rebuild):
+            response = self.client.get(self.url, {"prefix": "nana"})
+            self.assertTrue(rebuilt.wait(5))
+
+        self.assertEqual(self._texts(response), ["Nana"])
+        self.assertEqual(len(rebuild_threads), 1)
+        self.assertIsNot(rebuild_threads[0], threading.current_thread())
+
+    def test_stats_report_memory(self):
+        """Test that the stats endpoint reports entry counts and memory use."""
+        response = self.client.get(reverse("book_suggest_stats"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        stats = response.json()
+        self.assertEqual(stats["titles"], 3)
+        self.assertEqual(stats["authors"], 1)
+        self.assertEqual(stats["entries"], 4)
+        self.assertGreater(stats["memory_bytes"], 0)
+
+    def test_invalid_requests_are_rejected(self):
+        """Test that empty prefixes and bad limits are rejected."""
+        for params in [
+            {},
+            {"prefix": "  "},
+            {"prefix": "a", "limit": "x"},
+            {
+                "prefix": "a",
+                "limit": 0,
+            },
+        ]:
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn("error", response.json())
@@ -0,0 +1,410 @@
+import random
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+import pytest
+from django.db import connection
+from django.db.models import Count
+from django.forms import ValidationError
+from django.test import TestCase, TransactionTestCase, skipUnlessDBFeature
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from book.models.author import Author
+from book.models.book import Book
+from book.models.book_inventory import BookInventory
+from book.models.publisher import Publisher
+from librarymanagementsystem.container import container
+from member.models.borrowing_history import BorrowingHistory
+from member.models.member import Member
+
+
+def create_books(count, copies=1):
+    author = Author.objects.create(name="Test Author", birth_date=date(1980, 1, 1))
+    publisher = Publisher.objects.create(
+        name="Test Publisher", website="https://testpublisher.com"
+    )
+    books = [
+        Book.objects.create(
+            title=f"Test Book {index}",
+            description="A test book description for borrowing",
+            published_date=date(2020, 1, 1),
+            isbn=f"{9780000000000 + index}",
+            author=author,
+            publisher=publisher,
+        )
+        for index in range(count)
+    ]
+    BookInventory.objects.bulk_create(
+        [
+            BookInventory(book=book, total_copies=copies, available_copies=copies)
+            for book in books
+        ]
+    )
+    return books
+
+
+def create_members(count):
+    return [
+        Member.objects.create(
+            id=uuid.uuid4(),
+            first_name=f"Member{index}",
+            last_name="Tester",
+            birth_date=date(1990, 1, 1),
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.mark.django_db
+class TestBorrowBookIntegration(TestCase):
+    """Integration tests for the borrowing rules."""
+
+    def setUp(self):
+        """Set up test data for each test."""
+        self.member_service = container.member_container.member_service()
+        self.books = create_books(7)
+        self.member, self.other_member = create_members(2)
+
+    def _borrow(self, member, book):
+        return self.member_service.borrow_book(
+            {"member_id": str(member.id), "book_id": str(book.id)}
+        )
+
+    def test_borrow_book_success(self):
+        """Test that an available book can be borrowed."""
+        borrowing = self._borrow(self.member, self.books[0])
+
+        self.assertEqual(borrowing["book_id"], str(self.books[0].id))
+        self.assertTrue(
+            BorrowingHistory.objects.filter(
+                member=self.member, book=self.books[0], returning_date__isnull=True
+            ).exists()
+        )
+
+    def test_borrow_same_book_twice(self):
+        """Test that a member cannot borrow the same book twice."""
+        self._borrow(self.member, self.books[0])
+
+        with pytest.raises(ValidationError, match="has already borrowed"):
+            self._borrow(self.member, self.books[0])
+
+    def test_borrow_book_borrowed_by_another_member(self):
+        """Test that a book on loan is not available to other members."""
+        self._borrow(self.member, self.books[0])
+
+        with pytest.raises(ValidationError, match="is not available"):
+            self._borrow(self.other_member, self.books[0])
+
+    def test_borrow_takes_a_copy_from_inventory(self):
+        """Test that each borrow takes one copy until none are left."""
+        BookInventory.objects.filter(book=self.books[0]).update(
+            total_copies=2, available_copies=2
+        )
+        third_member = create_members(1)[0]
+
+        self._borrow(self.member, self.books[0])
+        self._borrow(self.other_member, self.books[0])
+
+        inventory = BookInventory.objects.get(book=self.books[0])
+        self.assertEqual(inventory.available_copies, 0)
+        with pytest.raises(ValidationError, match="is not available"):
+            self._borrow(third_member, self.books[0])
+
+    def test_borrow_limit_counts_only_active_borrowings(self):
+        """Test the active borrowing limit, ignoring returned books."""
+        BorrowingHistory.objects.create(
+            id=uuid.uuid4(),
+            member=self.member,
+            book=self.books[6],
+            borrowing_date=date(2024, 1, 1),
+            returning_date=date(2024, 1, 5),
+            due_date=date(2024, 1, 15),
+        )
+        for book in self.books[:5]:
+            self._borrow(self.member, book)
+
+        with pytest.raises(ValidationError, match="maximum number of borrowings"):
+            self._borrow(self.member, self.books[5])
+
+    def test_active_borrowings_hydrate_in_one_query(self):
+        """Test that reading active borrowings never follows the foreign keys."""
+        for book in self.books[:4]:
+            self._borrow(self.member, book)
+        repository = container.member_container.borrowing_repository()
+
+        with self.assertNumQueries(1):
+            borrowings = repository.get_active_borrowings_by_member_entity(
+                self.member.id
+            )
+        self.assertEqual(
+            {borrowing.book_id for borrowing in borrowings},
+            {book.id for book in self.books[:4]},
+        )
+        self.assertTrue(all(b.member_id == self.member.id for b in borrowings))
+        self.assertTrue(all(b.book_title is None for b in borrowings))
+
+        with self.assertNumQueries(1):
+            borrowings = repository.get_active_borrowings_by_member_entity(
+                self.member.id, with_book=True
+            )
+        self.assertEqual(
+            {borrowing.book_title for borrowing in borrowings},
+            {book.title for book in self.books[:4]},
+        )
+
+        with self.assertNumQueries(1):
+            borrowings = repository.get_active_borrowings_by_book_entity(
+                self.books[0].id
+            )
+        self.assertEqual([b.member_id for b in borrowings], [self.member.id])
+
+    def test_borrow_unknown_member(self):
+        """Test that borrowing for a missing member fails."""
+        with pytest.raises(ValidationError, match="not found"):
+            self.member_service.borrow_book(
+                {"member_id": str(uuid.uuid4()), "book_id": str(self.books[0].id)}
+            )
+
+
+@pytest.mark.django_db
+class TestReturnRenewBorrowingIntegration(TestCase):
+    """Integration tests for the return, batch return and renew endpoints."""
+
+    def setUp(self):
+        """Set up test data for each test."""
+        self.client = APIClient()
+        self.member_service = container.member_container.member_service()
+        self.books = create_books(6)
+        self.members = create_members(2)
+
+    def _borrow(self, member, book, borrowing_date=None):
+        borrowing_data = {"member_id": str(member.id), "book_id": str(book.id)}
+        if borrowing_date:
+            borrowing_data["borrowing_date"] = borrowing_date
+        return self.member_service.borrow_book(borrowing_data)
+
+    def _return(self, borrowing_id, **data):
+        url = reverse("borrowing_return", kwargs={"borrowing_id": borrowing_id})
+        return self.client.post(url, data, format="json")
+
+    def _renew(self, borrowing_id):
+        url = reverse("borrowing_renew", kwargs={"borrowing_id": borrowing_id})
+        return self.client.post(url, {}, format="json")
+
+    def _batch_return(self, borrowing_ids):
+        return self.client.post(
+            reverse("borrowing_batch_return"),
+            {"borrowing_ids": borrowing_ids},
+            format="json",
+        )
+
+    def test_return_book_releases_copy(self):
+        """Test that returning a book closes the borrowing and frees the copy."""
+        borrowing = self._borrow(self.members[0], self.books[0])
+
+        response = self._return(borrowing["id"])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["returning_date"], date.today().isoformat())
+        self.assertEqual(response.data["status"], "returned")
+        inventory = BookInventory.objects.get(book=self.books[0])
+        self.assertEqual(inventory.available_copies, 1)
+        # The copy can be borrowed again
+        self._borrow(self.members[1], self.books[0])
+
+    def test_return_book_twice(self):
+        """Test that a borrowing can only be returned once."""
+        borrowing = self._borrow(self.members[0], self.books[0])
+        self._return(borrowing["id"])
+
+        response = self._return(borrowing["id"])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("already returned", response.data["error"])
+        inventory = BookInventory.objects.get(book=self.books[0])
+        self.assertEqual(inventory.available_copies, 1)
+
+    def test_return_book_invalid_dates(self):
+        """Test that return dates in the future or before borrowing are rejected."""
+        borrowing = self._borrow(
+            self.members[0], self.books[0], date.today() - timedelta(days=3)
+        )
+
+        future = self._return(
+            borrowing["id"], return_date=(date.today() + timedelta(days=1)).isoformat()
+        )
+        before = self._return(
+            borrowing["id"], return_date=(date.today() - timedelta(days=4)).isoformat()
+        )
+
+        self.assertEqual(future.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("future", future.data["error"])
+        self.assertEqual(before.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("before borrowing date", before.data["error"])
+
+    def test_return_unknown_borrowing(self):
+        """Test that returning a missing borrowing fails."""
+        response = self._return(str(uuid.uuid4()))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("not found", response.data["error"])
+
+    def test_batch_return(self):
+        """Test that a batch returns valid borrowings and reports the rest."""
+        borrowings = [
+            self._borrow(self.members[index % 2], book)
+            for index, book in enumerate(self.books[:4])
+        ]
+        self._return(borrowings[0]["id"])
+        unknown_id = str(uuid.uuid4())
+
+        response = self._batch_return(
+            [borrowing["id"] for borrowing in borrowings] + [unknown_id, "not-a-uuid"]
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["returned_count"], 3)
+        self.assertEqual(
+            [borrowing["id"] for borrowing in response.data["returned"]],
+            [borrowing["id"] for borrowing in borrowings[1:]],
+        )
+        self.assertEqual(
+            {error["borrowing_id"] for error in response.data["errors"]},
+            {borrowings[0]["id"], unknown_id, "not-a-uuid"},
+        )
+        self.assertFalse(
+            BorrowingHistory.objects.filter(returning_date__isnull=True).exists()
+        )
+        self.assertEqual(
+            sum(BookInventory.objects.values_list("available_copies", flat=True)),
+            len(self.books),
+        )
+
+    def test_batch_return_query_count_is_constant(self):
+        """Test that the number of queries doesn't grow with the batch size."""
+        members = create_members(3)
+        borrowings = [
+            self._borrow(members[index % 3], book)
+            for index, book in enumerate(self.books)
+        ]
+
+        with CaptureQueriesContext(connection) as small_batch:
+            self._batch_return([borrowing["id"] for borrowing in borrowings[:2]])
+        with CaptureQueriesContext(connection) as large_batch:
+            self._batch_return([borrowing["id"] for borrowing in borrowings[2:]])
+
+        self.assertEqual(len(small_batch), len(large_batch))
+
+    def test_batch_return_requires_ids(self):
+        """Test that an empty batch is rejected."""
+        response = self._batch_return([])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_renew_extends_due_date_once(self):
+        """Test that a borrowing can be renewed once, extending its due date."""
+        borrowing = self._borrow(self.members[0], self.books[0])
+
+        response = self._renew(borrowing["id"])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["due_date"],
+            (date.today() + timedelta(days=21)).isoformat(),
+        )
+        self.assertEqual(response.data["borrowing_date"], date.today().isoformat())
+        self.assertFalse(response.data["can_be_renewed"])
+
+        response = self._renew(borrowing["id"])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("cannot be renewed", response.data["error"])
+
+    def test_renew_after_first_week(self):
+        """Test that a borrowing can't be renewed after its first week."""
+        borrowing = self._borrow(
+            self.members[0], self.books[0], date.today() - timedelta(days=8)
+        )
+
+        response = self._renew(borrowing["id"])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("cannot be renewed", response.data["error"])
+
+    def test_renewed_book_can_be_returned(self):
+        """Test that a renewed borrowing is returned like any other."""
+        borrowing = self._borrow(self.members[0], self.books[0])
+        self._renew(borrowing["id"])
+
+        response = self._return(borrowing["id"])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["status"], "returned")
+
+        response = self._renew(borrowing["id"])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("already returned", response.data["error"])
+
+
+@skipUnlessDBFeature("has_select_for_update")
+class TestBorrowBookConcurrency(TransactionTestCase):
+    """Stress test: parallel borrows must never break the borrowing invariants."""
+
+    attempts = 300
+    workers = 16
+
+    def setUp(self):
+        """Set up test data for each test."""
+        self.books = create_books(10)
+        self.members = create_members(20)
+
+    def _borrow(self, member_id, book_id):
+        member_service = container.member_container.member_service()
+        try:
+            member_service.borrow_book(
+                {"member_id": str(member_id), "book_id": str(book_id)}
+            )
+            return True
+        except ValidationError:
+            return False
+        finally:
+            connection.close()
+
+    def test_parallel_borrows_keep_invariants(self):
+        """Test that limits hold when hundreds of borrows race each other."""
+        rng = random.Random(7)
+        requests = [
+            (rng.choice(self.members).id, rng.choice(self.books).id)
+            for _ in range(self.attempts)
+        ]
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            results = list(executor.map(lambda args: self._borrow(*args), requests))
+
+        active = BorrowingHistory.objects.filter(returning_date__isnull=True)
+        self.assertEqual(active.count(), sum(results))
+        # The inventory counters agree with the borrowings
+        for inventory in BookInventory.objects.all():
+            self.assertEqual(
+                inventory.available_copies,
+                inventory.total_copies - active.filter(book=inventory.book).count(),
+            )
+        # Every book has a single copy
+        self.assertLessEqual(
+            max(
+                row["total"]
+                for row in active.values("book_id").annotate(total=Count("id"))
+            ),
+            1,
+        )
+        # No member is over the limit
+        self.assertLessEqual(
+            max(
+                row["total"]
+                for row in active.values("member_id").annotate(total=Count("id"))
+            ),
+            5,
+        )
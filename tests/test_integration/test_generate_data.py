@@ -0,0 +1,120 @@
+from collections import Counter
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db.models import Count, F, Q
+from django.test import TestCase
+
+from book.models.book import Book
+from book.models.book_inventory import BookInventory
+from book.models.genre import Genre
+from member.models.borrowing_history import BorrowingHistory
+from member.models.member import Member
+from member.use_cases.borrow_book_use_case import BorrowBookUseCase
+
+
+@pytest.mark.django_db
+class TestGenerateDataIntegration(TestCase):
+    """Integration tests for the synthetic data generator command."""
+
+    options = ["--books", "200", "--members", "50", "--borrowings", "3000"]
+
+    def _generate(self, *extra):
+        stdout = StringIO()
+        call_command("generate_data", *self.options, *extra, stdout=stdout)
+        return stdout.getvalue()
+
+    def test_generates_consistent_library(self):
+        """Test that the generated rows keep the library's invariants."""
+        output = self._generate()
+
+        self.assertIn("using bulk", output)
+        self.assertEqual(Book.objects.count(), 200)
+        self.assertEqual(Member.objects.count(), 50)
+        self.assertEqual(BorrowingHistory.objects.count(), 3000)
+        self.assertEqual(BookInventory.objects.count(), 200)
+
+        genre_counts = Counter(
+            Genre.books.through.objects.values_list("book_id", flat=True)
+        )
+        self.assertEqual(len(genre_counts), 200)
+        self.assertTrue(set(genre_counts.values()) <= {1, 2, 3})
+        self.assertGreater(max(genre_counts.values()), 1)
+
+        # Active borrowings respect the member limit and the copies of each book
+        active = BorrowingHistory.objects.filter(returning_date__isnull=True)
+        self.assertTrue(active.exists())
+        per_member = active.values("member_id").annotate(total=Count("id"))
+        self.assertLessEqual(
+            max(row["total"] for row in per_member),
+            BorrowBookUseCase.max_active_borrowings,
+        )
+        for inventory in BookInventory.objects.annotate(
+            active=Count(
+                "book__borrowinghistory",
+                filter=Q(book__borrowinghistory__returning_date__isnull=True),
+            )
+        ):
+            self.assertEqual(
+                inventory.available_copies, inventory.total_copies - inventory.active
+            )
+        self.assertFalse(
+            BorrowingHistory.objects.filter(
+                returning_date__lt=F("borrowing_date")
+            ).exists()
+        )
+
+    def test_book_popularity_is_skewed(self):
+        """Test that a few books get most of the borrowings."""
+        self._generate()
+
+        counts = sorted(
+            BorrowingHistory.objects.values("book_id")
+            .annotate(total=Count("id"))
+            .values_list("total", flat=True),
+            reverse=True,
+        )
+        self.assertGreater(sum(counts[:20]), sum(counts) / 2)
+
+    def test_same_seed_generates_same_rows(self):
+        """Test that a seeded run is reproducible."""
+        self._generate("--seed", "7")
+        first = list(
+            BorrowingHistory.objects.order_by("id").values_list(
+                "id", "book_id", "member_id", "borrowing_date", "returning_date"
+            )
+        )
+        titles = list(Book.objects.order_by("id").values_list("title", flat=True))
+
+        self._generate("--seed", "7", "--clear")
+
+        self.assertEqual(
+            list(
+                BorrowingHistory.objects.order_by("id").values_list(
+                    "id", "book_id", "member_id", "borrowing_date", "returning_date"
+                )
+            ),
+            first,
+        )
+        self.assertEqual(
+            list(Book.objects.order_by("id").values_list("title", flat=True)), titles
+        )
+
+    def test_isbns_continue_after_existing_books(self):
+        """Test that generated ISBNs skip past ISBNs already in the database."""
+        self._generate("--books", "3", "--borrowings", "0")
+        # Fewer books than the highest generated ISBN number
+        Book.objects.order_by("isbn").first().delete()
+
+        self._generate("--seed", "1", "--books", "3", "--borrowings", "0")
+
+        isbns = list(Book.objects.values_list("isbn", flat=True))
+        self.assertEqual(len(isbns), 5)
+        self.assertEqual(len(set(isbns)), 5)
+
+    def test_copy_requires_postgresql(self):
+        """Test that COPY is refused on other databases."""
+        with self.assertRaises(CommandError):
+            self._generate("--method", "copy")
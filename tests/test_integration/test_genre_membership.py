@@ -0,0 +1,99 @@
+from datetime import date
+
+import pytest
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from book.models.author import Author
+from book.models.book import Book
+from book.models.genre import Genre
+from book.models.publisher import Publisher
+from librarymanagementsystem.container import container
+
+
+@pytest.mark.django_db
+class TestGenreMembershipIntegration(TestCase):
+    """Integration tests for reading genres without their whole book list."""
+
+    def setUp(self):
+        """Set up test data for each test."""
+        self.client = APIClient()
+        self.genre_repository = container.book_container.genre_repository()
+
+        self.author = Author.objects.create(
+            name="Test Author", birth_date=date(1980, 1, 1)
+        )
+        self.publisher = Publisher.objects.create(
+            name="Test Publisher", website="https://testpublisher.com"
+        )
+        self.genre = Genre.objects.create(name="Fiction")
+        self.books = []
+        for index in range(3):
+            book = Book.objects.create(
+                title=f"Test Book {index}",
+                description="A test book description for genre testing",
+                published_date=date(2020, 1, 1),
+                isbn=f"{9780000000000 + index}",
+                author=self.author,
+                publisher=self.publisher,
+            )
+            book.genres.add(self.genre)
+            self.books.append(book)
+
+    def test_membership_is_loaded_on_demand(self):
+        """Test that book IDs and the count are only read when asked for."""
+        with self.assertNumQueries(1):
+            genre = self.genre_repository.get_genre_entity_by_id(self.genre.id)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(genre.get_book_count(), 3)
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                set(genre.get_book_ids()), {book.id for book in self.books}
+            )
+        with self.assertNumQueries(0):
+            self.assertEqual(genre.get_book_count(), 3)
+            self.assertFalse(genre.is_popular())
+            self.assertTrue(genre.is_niche())
+
+    def test_genre_stats_count_in_one_query(self):
+        """Test that genre stats count books in the genre query itself."""
+        genre_service = container.book_container.genre_service()
+
+        with self.assertNumQueries(1):
+            stats = genre_service.get_genre_stats(str(self.genre.id))
+
+        self.assertEqual(stats["book_count"], 3)
+        self.assertTrue(stats["is_niche"])
+        self.assertNotIn("book_ids", stats)
+
+    def test_create_book_does_not_read_genre_membership(self):
+        """Test that creating a book never lists the books of its genre."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                reverse("book_create_and_get"),
+                {
+                    "title": "Another Book",
+                    "description": "A test book description for genre testing",
+                    "published_date": "2023-01-15",
+                    "isbn": "9780000000099",
+                    "author_id": str(self.author.id),
+                    "publisher_id": str(self.publisher.id),
+                    "genre_id": str(self.genre.id),
+                },
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        membership_reads = [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith(
+                ('SELECT "book_book"."id" FROM', 'SELECT "book_genre_books"."book_id"')
+            )
+        ]
+        self.assertEqual(membership_reads, [])
@@ -0,0 +1,86 @@
+import uuid
+from datetime import date, timedelta
+
+import pytest
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from book.models.author import Author
+from book.models.book import Book
+from book.models.genre import Genre
+from book.models.publisher import Publisher
+from member.models.borrowing_history import BorrowingHistory
+from member.models.member import Member
+
+
+@pytest.mark.django_db
+class TestMemberActiveBooksViewIntegration(TestCase):
+    """Integration tests for the member active books view."""
+
+    def setUp(self):
+        """Set up test data for each test."""
+        self.client = APIClient()
+
+        author = Author.objects.create(name="Test Author", birth_date=date(1980, 1, 1))
+        publisher = Publisher.objects.create(
+            name="Test Publisher", website="https://testpublisher.com"
+        )
+        genre = Genre.objects.create(name="Fiction")
+        self.member = Member.objects.create(
+            id=uuid.uuid4(),
+            first_name="Active",
+            last_name="Tester",
+            birth_date=date(1990, 1, 1),
+        )
+        self.url = reverse("member_active_books", kwargs={"member_id": self.member.id})
+
+        today = date.today()
+        for index in range(4):
+            book = Book.objects.create(
+                title=f"Test Book {index}",
+                description="A test book description for active books testing",
+                published_date=date(2020, 1, 1),
+                isbn=f"{9780000000000 + index}",
+                author=author,
+                publisher=publisher,
+            )
+            book.genres.add(genre)
+            # The last book was returned and must not be listed
+            BorrowingHistory.objects.create(
+                id=uuid.uuid4(),
+                book=book,
+                member=self.member,
+                borrowing_date=today - timedelta(days=index),
+                due_date=today + timedelta(days=14 - index),
+                returning_date=today if index == 3 else None,
+            )
+
+    def test_active_books_without_expand(self):
+        """Test that only book IDs are returned by default."""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 3)
+        self.assertNotIn("book", response.data["active_books"][0])
+
+    def test_expand_book_embeds_enriched_books(self):
+        """Test that expand=book embeds each book without per-book queries."""
+        # Member check, borrowings joined with books, genre prefetch
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url, {"expand": "book"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        active_books = response.data["active_books"]
+        self.assertEqual(len(active_books), 3)
+        self.assertEqual(
+            sorted(active_book["book"]["title"] for active_book in active_books),
+            ["Test Book 0", "Test Book 1", "Test Book 2"],
+        )
+        for active_book in active_books:
+            book = active_book["book"]
+            self.assertEqual(book["id"], str(active_book["book_id"]))
+            self.assertEqual(book["author"]["name"], "Test Author")
+            self.assertEqual(book["publisher"]["name"], "Test Publisher")
+            self.assertEqual([genre["name"] for genre in book["genres"]], ["Fiction"])
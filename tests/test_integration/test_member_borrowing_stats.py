@@ -0,0 +1,106 @@
+import uuid
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from django.test import TestCase
+
+from book.models.author import Author
+from book.models.book import Book
+from book.models.publisher import Publisher
+from librarymanagementsystem.container import container
+from member.models.borrowing_history import BorrowingHistory
+from member.models.member import Member
+
+
+@pytest.mark.django_db
+class TestMemberBorrowingStatsIntegration(TestCase):
+    """Integration tests for the aggregate member borrowing statistics."""
+
+    def setUp(self):
+        """Set up test data for each test."""
+        self.member_service = container.member_container.member_service()
+
+        author = Author.objects.create(name="Test Author", birth_date=date(1980, 1, 1))
+        publisher = Publisher.objects.create(
+            name="Test Publisher", website="https://testpublisher.com"
+        )
+        self.books = [
+            Book.objects.create(
+                title=f"Test Book {index}",
+                description="A test book description for stats testing",
+                published_date=date(2020, 1, 1),
+                isbn=f"{9780000000000 + index}",
+                author=author,
+                publisher=publisher,
+            )
+            for index in range(3)
+        ]
+        self.member = Member.objects.create(
+            id=uuid.uuid4(),
+            first_name="Stats",
+            last_name="Tester",
+            birth_date=date(1990, 1, 1),
+        )
+
+        today = date.today()
+        # One active borrowing 4 days overdue, one active and not yet due
+        self._borrowing(self.books[0], today - timedelta(days=18))
+        self._borrowing(self.books[1], today - timedelta(days=2))
+        # Returned borrowings never count as overdue
+        self._returned(12, today - timedelta(days=60))
+
+    def _borrowing(self, book, borrowing_date, returning_date=None):
+        return BorrowingHistory.objects.create(
+            id=uuid.uuid4(),
+            book=book,
+            member=self.member,
+            borrowing_date=borrowing_date,
+            due_date=borrowing_date + timedelta(days=14),
+            returning_date=returning_date,
+        )
+
+    def _returned(self, count, borrowing_date):
+        for _ in range(count):
+            self._borrowing(self.books[2], borrowing_date, borrowing_date)
+
+    def test_member_borrowing_stats(self):
+        """Test that counts and fines cover the whole history."""
+        stats = self.member_service.get_member_borrowing_stats(self.member.id)
+
+        self.assertEqual(stats["total_borrowings"], 14)
+        self.assertEqual(stats["active_borrowings"], 2)
+        self.assertEqual(stats["returned_borrowings"], 12)
+        self.assertEqual(stats["overdue_borrowings"], 1)
+        self.assertEqual(stats["total_days_overdue"], 4)
+        self.assertEqual(stats["total_fine"], Decimal("4.00"))
+        self.assertTrue(stats["is_active_borrower"])
+        self.assertTrue(stats["is_heavy_borrower"])
+        self.assertTrue(stats["can_borrow_more"])
+
+    def test_member_borrowing_stats_query_count(self):
+        """Test that the stats cost the same queries however long the history is."""
+        with self.assertNumQueries(3):
+            self.member_service.get_member_borrowing_stats(self.member.id)
+
+        self._returned(50, date.today() - timedelta(days=200))
+
+        with self.assertNumQueries(3):
+            stats = self.member_service.get_member_borrowing_stats(self.member.id)
+        self.assertEqual(stats["total_borrowings"], 64)
+
+    def test_member_borrowing_stats_without_history(self):
+        """Test the stats of a member who never borrowed a book."""
+        member = Member.objects.create(
+            id=uuid.uuid4(),
+            first_name="New",
+            last_name="Member",
+            birth_date=date(1990, 1, 1),
+        )
+
+        stats = self.member_service.get_member_borrowing_stats(member.id)
+
+        self.assertEqual(stats["total_borrowings"], 0)
+        self.assertEqual(stats["overdue_borrowings"], 0)
+        self.assertEqual(stats["total_fine"], Decimal("0.00"))
+        self.assertFalse(stats["is_active_borrower"])
@@ -0,0 +1,104 @@
+import uuid
+from datetime import date, timedelta
+
+import pytest
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from book.models.author import Author
+from book.models.book import Book
+from book.models.publisher import Publisher
+from member.models.borrowing_history import BorrowingHistory
+from member.models.member import Member
+
+
+@pytest.mark.django_db
+class TestMemberBorrowingViewIntegration(TestCase):
+    """Integration tests for the member borrowing dashboard view."""
+
+    def setUp(self):
+        """Set up test data for each test."""
+        self.client = APIClient()
+
+        author = Author.objects.create(name="Test Author", birth_date=date(1980, 1, 1))
+        publisher = Publisher.objects.create(
+            name="Test Publisher", website="https://testpublisher.com"
+        )
+        self.books = [
+            Book.objects.create(
+                title=f"Test Book {index}",
+                description="A test book description for dashboard testing",
+                published_date=date(2020, 1, 1),
+                isbn=f"{9780000000000 + index}",
+                author=author,
+                publisher=publisher,
+            )
+            for index in range(5)
+        ]
+        self.member = Member.objects.create(
+            id=uuid.uuid4(),
+            first_name="Dashboard",
+            last_name="Tester",
+            birth_date=date(1990, 1, 1),
+        )
+        self.url = reverse("member_borrowing", kwargs={"member_id": self.member.id})
+
+        today = date.today()
+        # Book 0 is 2 days overdue, book 1 is due in 10 days
+        self._borrowing(self.books[0], today - timedelta(days=16))
+        self._borrowing(self.books[1], today - timedelta(days=4))
+        for _ in range(3):
+            self._borrowing(self.books[4], today - timedelta(days=40), returned=True)
+
+    def _borrowing(self, book, borrowing_date, returned=False):
+        return BorrowingHistory.objects.create(
+            id=uuid.uuid4(),
+            book=book,
+            member=self.member,
+            borrowing_date=borrowing_date,
+            due_date=borrowing_date + timedelta(days=14),
+            returning_date=borrowing_date + timedelta(days=7) if returned else None,
+        )
+
+    def test_member_dashboard(self):
+        """Test that stats and active borrowed books come back together."""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        stats = response.data["borrowing_stats"]
+        self.assertEqual(stats["total_borrowings"], 5)
+        self.assertEqual(stats["active_borrowings"], 2)
+        self.assertEqual(stats["returned_borrowings"], 3)
+        self.assertEqual(stats["overdue_borrowings"], 1)
+        self.assertEqual(stats["total_fine"], "2.00")
+        self.assertTrue(stats["can_borrow_more"])
+
+        borrowed_books = response.data["borrowed_books"]
+        self.assertEqual(
+            [book["book_title"] for book in borrowed_books],
+            ["Test Book 0", "Test Book 1"],
+        )
+        self.assertTrue(borrowed_books[0]["is_overdue"])
+        self.assertEqual(borrowed_books[0]["days_overdue"], 2)
+
+    def test_member_dashboard_query_count(self):
+        """Test that the dashboard costs two queries however many books are borrowed."""
+        with self.assertNumQueries(2):
+            self.client.get(self.url)
+
+        self._borrowing(self.books[2], date.today())
+        self._borrowing(self.books[3], date.today())
+
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.data["borrowed_books"]), 4)
+
+    def test_member_dashboard_unknown_member(self):
+        """Test that an unknown member is reported as not found."""
+        url = reverse("member_borrowing", kwargs={"member_id": uuid.uuid4()})
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,167 @@
+import uuid
+from datetime import date, timedelta
+
+import pytest
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from book.models.author import Author
+from book.models.book import Book
+from book.models.publisher import Publisher
+from member.models.borrowing_history import BorrowingHistory
+from member.models.member import Member
+
+
+@pytest.mark.django_db
+class TestMemberHistoryIntegration(TestCase):
+    """Integration tests for the paginated member borrowing history."""
+
+    def setUp(self):
+        """Set up test data for each test."""
+        self.client = APIClient()
+
+        author = Author.objects.create(name="Test Author", birth_date=date(1980, 1, 1))
+        publisher = Publisher.objects.create(
+            name="Test Publisher", website="https://testpublisher.com"
+        )
+        self.books = [
+            Book.objects.create(
+                title=f"Test Book {index}",
+                description="A test book description for history testing",
+                published_date=date(2020, 1, 1),
+                isbn=f"{9780000000000 + index}",
+                author=author,
+                publisher=publisher,
+            )
+            for index in range(7)
+        ]
+        self.member = Member.objects.create(
+            id=uuid.uuid4(),
+            first_name="History",
+            last_name="Tester",
+            birth_date=date(1990, 1, 1),
+        )
+        self.url = reverse("member_history", kwargs={"member_id": self.member.id})
+
+        # Five returned borrowings in 2024, one active on time, one overdue
+        self.borrowings = []
+        for index, book in enumerate(self.books[:5]):
+            borrowing_date = date(2024, 1, 1) + timedelta(days=30 * index)
+            self.borrowings.append(
+                self._create_borrowing(
+                    book, borrowing_date, returning_date=borrowing_date
+                )
+            )
+        today = date.today()
+        self.on_time = self._create_borrowing(self.books[5], today)
+        self.overdue = self._create_borrowing(self.books[6], today - timedelta(days=20))
+
+    def _create_borrowing(self, book, borrowing_date, returning_date=None):
+        return BorrowingHistory.objects.create(
+            id=uuid.uuid4(),
+            member=self.member,
+            book=book,
+            borrowing_date=borrowing_date,
+            returning_date=returning_date,
+            due_date=borrowing_date + timedelta(days=14),
+        )
+
+    def _ids(self, response):
+        return [borrowing["id"] for borrowing in response.data["results"]]
+
+    def test_pages_newest_first(self):
+        """Test walking the history forwards and back with cursors."""
+        expected = [
+            str(borrowing.id)
+            for borrowing in [self.on_time, self.overdue, *reversed(self.borrowings)]
+        ]
+
+        seen = []
+        url = f"{self.url}?page_size=3"
+        while url:
+            with self.assertNumQueries(1):
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            seen.extend(self._ids(response))
+            last_page = response
+            url = response.data["next"]
+        self.assertEqual(seen, expected)
+
+        response = self.client.get(last_page.data["previous"])
+        self.assertEqual(self._ids(response), expected[3:6])
+
+    def test_date_range_filter(self):
+        """Test that the borrowing date range is inclusive on both ends."""
+        response = self.client.get(
+            self.url, {"borrowed_from": "2024-01-31", "borrowed_to": "2024-03-01"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            self._ids(response),
+            [str(self.borrowings[2].id), str(self.borrowings[1].id)],
+        )
+
+    def test_status_filter(self):
+        """Test filtering by returned, overdue and active status."""
+        response = self.client.get(self.url, {"status": "returned"})
+        self.assertEqual(len(response.data["results"]), 5)
+        self.assertTrue(
+            all(b["status"] == "returned" for b in response.data["results"])
+        )
+
+        response = self.client.get(self.url, {"status": "overdue"})
+        self.assertEqual(self._ids(response), [str(self.overdue.id)])
+        self.assertEqual(response.data["results"][0]["status"], "overdue")
+
+        response = self.client.get(self.url, {"status": "borrowed"})
+        self.assertEqual(self._ids(response), [str(self.on_time.id)])
+
+        response = self.client.get(self.url, {"status": "active"})
+        self.assertEqual(
+            self._ids(response), [str(self.on_time.id), str(self.overdue.id)]
+        )
+
+    def test_expand_book_includes_titles(self):
+        """Test that expand=book joins the book titles in the same query."""
+        response = self.client.get(self.url, {"page_size": 2})
+        self.assertEqual(
+            [b["book_title"] for b in response.data["results"]], [None, None]
+        )
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {"page_size": 2, "expand": "book"})
+        self.assertEqual(
+            [b["book_title"] for b in response.data["results"]],
+            ["Test Book 5", "Test Book 6"],
+        )
+
+    def test_member_without_matches(self):
+        """Test that a known member with no matching borrowings gets an empty page."""
+        response = self.client.get(self.url, {"borrowed_from": "2030-01-01"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"], [])
+        self.assertIsNone(response.data["next"])
+
+    def test_unknown_member(self):
+        """Test that an unknown member is reported as not found."""
+        url = reverse("member_history", kwargs={"member_id": uuid.uuid4()})
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_invalid_filters(self):
+        """Test that malformed filters are rejected."""
+        for params in [
+            {"status": "lost"},
+            {"borrowed_from": "yesterday"},
+            {"borrowed_from": "2024-05-01", "borrowed_to": "2024-04-01"},
+            {"cursor": "not-a-cursor"},
+        ]:
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn("error", response.data)
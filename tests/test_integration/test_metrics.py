@@ -0,0 +1,115 @@
+import tempfile
+from datetime import date
+from unittest import mock
+
+import pytest
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from book.models.author import Author
+from book.models.genre import Genre
+from book.models.publisher import Publisher
+from librarymanagementsystem.metrics import MetricsRegistry, registry
+
+CREATE_VIEW = ("view", "BookCreateAndGetView.post")
+CREATE_USE_CASE = ("use_case", "CreateBookUseCase.execute")
+SAVE_BOOK = ("repository", "BookRepository.save_book")
+
+
+def _counts(*keys):
+    """Get the (calls, errors) of each series, zero if it has not been seen."""
+    series = registry.collect()
+    return {
+        key: (series[key][2], series[key][3]) if key in series else (0, 0)
+        for key in keys
+    }
+
+
+@pytest.mark.django_db
+class TestMetricsIntegration(TestCase):
+    """Integration tests for the metrics registry and the /metrics endpoint."""
+
+    def setUp(self):
+        """Set up test data for each test."""
+        self.client = APIClient()
+        self.url = reverse("book_create_and_get")
+        self.author = Author.objects.create(
+            name="Test Author", birth_date=date(1980, 1, 1)
+        )
+        self.publisher = Publisher.objects.create(
+            name="Test Publisher", website="https://testpublisher.com"
+        )
+        self.genre = Genre.objects.create(name="Fiction")
+        self.book_data = {
+            "title": "Test Book Title",
+            "description": "A test book description for metrics testing",
+            "published_date": "2023-01-15",
+            "isbn": "1234567890123",
+            "author_id": str(self.author.id),
+            "publisher_id": str(self.publisher.id),
+            "genre_id": str(self.genre.id),
+        }
+
+    def test_calls_are_counted_per_layer(self):
+        """Test that one request is counted by its view, use case and repository."""
+        before = _counts(CREATE_VIEW, CREATE_USE_CASE, SAVE_BOOK)
+
+        response = self.client.post(self.url, self.book_data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        after = _counts(CREATE_VIEW, CREATE_USE_CASE, SAVE_BOOK)
+        for key in (CREATE_VIEW, CREATE_USE_CASE, SAVE_BOOK):
+            self.assertEqual(after[key], (before[key][0] + 1, before[key][1]))
+
+    def test_failed_calls_are_counted_as_errors(self):
+        """Test that a use case raising an exception counts as an error."""
+        before = _counts(CREATE_VIEW, CREATE_USE_CASE)
+
+        self.book_data["author_id"] = "00000000-0000-0000-0000-000000000000"
+        response = self.client.post(self.url, self.book_data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        after = _counts(CREATE_VIEW, CREATE_USE_CASE)
+        self.assertEqual(
+            after[CREATE_USE_CASE],
+            (before[CREATE_USE_CASE][0] + 1, before[CREATE_USE_CASE][1] + 1),
+        )
+        # A 4xx answer is the view working as intended, not an error
+        self.assertEqual(after[CREATE_VIEW][1], before[CREATE_VIEW][1])
+
+    def test_metrics_endpoint_renders_text_format(self):
+        """Test that /metrics serves histograms and error counters as text."""
+        self.client.post(self.url, self.book_data, format="json")
+
+        response = self.client.get(reverse("metrics"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+        body = response.content.decode()
+        labels = 'layer="use_case",operation="CreateBookUseCase.execute"'
+        self.assertIn("# TYPE lms_call_duration_seconds histogram", body)
+        self.assertIn(f'lms_call_duration_seconds_bucket{{{labels},le="+Inf"}}', body)
+        self.assertIn(f"lms_call_duration_seconds_count{{{labels}}}", body)
+        self.assertIn(f"lms_call_errors_total{{{labels}}}", body)
+
+    def test_workers_are_summed_in_multiprocess_mode(self):
+        """Test that a scrape adds up the counts written by every worker."""
+        with tempfile.TemporaryDirectory() as directory, override_settings(
+            METRICS_MULTIPROC_DIR=directory, METRICS_FLUSH_INTERVAL=0
+        ):
+            workers = [MetricsRegistry(), MetricsRegistry()]
+            for pid, worker in enumerate(workers, start=1):
+                with mock.patch("os.getpid", return_value=pid):
+                    for _ in range(pid):
+                        worker.observe("view", "ExampleView.get", 0.002)
+                    worker.observe("view", "ExampleView.get", 2.0, error=True)
+
+            with mock.patch("os.getpid", return_value=1):
+                series = workers[0].collect()
+
+        buckets, total, count, errors = series[("view", "ExampleView.get")]
+        self.assertEqual((count, errors), (5, 2))
+        self.assertAlmostEqual(total, 4.006)
+        self.assertEqual(sum(buckets), 5)
@@ -0,0 +1,123 @@
+import uuid
+from datetime import date, timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from book.models.author import Author
+from book.models.book import Book
+from book.models.publisher import Publisher
+from member.models.borrowing_history import BorrowingHistory
+from member.models.member import Member
+
+
+@pytest.mark.django_db
+class TestOverdueBorrowingsIntegration(TestCase):
+    """Integration tests for the overdue borrowings API and report command."""
+
+    def setUp(self):
+        """Set up test data for each test."""
+        self.client = APIClient()
+        self.url = reverse("borrowing_overdue")
+
+        author = Author.objects.create(name="Test Author", birth_date=date(1980, 1, 1))
+        publisher = Publisher.objects.create(
+            name="Test Publisher", website="https://testpublisher.com"
+        )
+        self.books = [
+            Book.objects.create(
+                title=f"Test Book {index}",
+                description="A test book description for overdue testing",
+                published_date=date(2020, 1, 1),
+                isbn=f"{9780000000000 + index}",
+                author=author,
+                publisher=publisher,
+            )
+            for index in range(4)
+        ]
+        self.member = Member.objects.create(
+            id=uuid.uuid4(),
+            first_name="Overdue",
+            last_name="Tester",
+            birth_date=date(1990, 1, 1),
+        )
+
+        today = date.today()
+        self.ten_days = self._borrowing(self.books[0], today - timedelta(days=10))
+        self.three_days = self._borrowing(self.books[1], today - timedelta(days=3))
+        # Not due yet, and overdue but already returned
+        self._borrowing(self.books[2], today + timedelta(days=2))
+        self._borrowing(self.books[3], today - timedelta(days=30), returning_date=today)
+
+    def _borrowing(self, book, due_date, returning_date=None):
+        return BorrowingHistory.objects.create(
+            id=uuid.uuid4(),
+            book=book,
+            member=self.member,
+            borrowing_date=due_date - timedelta(days=14),
+            due_date=due_date,
+            returning_date=returning_date,
+        )
+
+    def test_overdue_borrowings_with_fines(self):
+        """Test that only active overdue borrowings are listed, most overdue first."""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data["results"]
+        self.assertEqual(
+            [result["id"] for result in results],
+            [str(self.ten_days.id), str(self.three_days.id)],
+        )
+        self.assertEqual(results[0]["days_overdue"], 10)
+        self.assertEqual(results[0]["fine_amount"], "10.00")
+        self.assertEqual(results[1]["days_overdue"], 3)
+        self.assertIsNone(response.data["next"])
+
+    def test_overdue_borrowings_pagination(self):
+        """Test that the next link walks through all overdue borrowings."""
+        first_page = self.client.get(self.url, {"page_size": 1})
+        second_page = self.client.get(first_page.data["next"])
+
+        self.assertEqual(first_page.data["results"][0]["id"], str(self.ten_days.id))
+        self.assertEqual(second_page.data["results"][0]["id"], str(self.three_days.id))
+        self.assertIsNone(second_page.data["next"])
+
+    def test_overdue_borrowings_invalid_cursor(self):
+        """Test that a malformed cursor is rejected."""
+        response = self.client.get(self.url, {"cursor": "not-a-cursor"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_report_command_writes_every_chunk(self):
+        """Test that the report command pages through all overdue rows."""
+        stdout, stderr = StringIO(), StringIO()
+
+        call_command(
+            "report_overdue_borrowings", chunk_size=1, stdout=stdout, stderr=stderr
+        )
+
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[1].startswith(str(self.ten_days.id)))
+        self.assertIn("2 overdue borrowings, 13 days overdue", stderr.getvalue())
+
+    def test_report_command_summary_as_of(self):
+        """Test the single-query summary for another date."""
+        stdout = StringIO()
+
+        call_command(
+            "report_overdue_borrowings",
+            "--summary-only",
+            as_of=date.today() + timedelta(days=5),
+            stdout=stdout,
+        )
+
+        self.assertIn(
+            "3 overdue borrowings, 26 days overdue, 26.00 in fines", stdout.getvalue()
+        )
@@ -0,0 +1,87 @@
+import re
+from datetime import date
+
+import pytest
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from book.models.author import Author
+from book.models.book import Book
+from book.models.publisher import Publisher
+from librarymanagementsystem.middleware import QueryInstrumentationMiddleware
+
+SERVER_TIMING = re.compile(r'^db;dur=[\d.]+;desc="(\d+) queries", total;dur=[\d.]+$')
+
+
+@pytest.mark.django_db
+class TestRequestMetricsIntegration(TestCase):
+    """Integration tests for the per-request query instrumentation middleware."""
+
+    def setUp(self):
+        """Set up test data for each test."""
+        self.client = APIClient()
+        author = Author.objects.create(name="Test Author", birth_date=date(1980, 1, 1))
+        publisher = Publisher.objects.create(
+            name="Test Publisher", website="https://testpublisher.com"
+        )
+        self.book = Book.objects.create(
+            title="Test Book",
+            description="A test book description for metrics testing",
+            published_date=date(2020, 1, 1),
+            isbn="9780000000001",
+            author=author,
+            publisher=publisher,
+        )
+
+    def test_response_reports_query_count_and_timing(self):
+        """Test that the Server-Timing header and log line count the queries."""
+        url = reverse("book_get_by_id", kwargs={"book_id": self.book.id})
+        with self.assertLogs(
+            "librarymanagementsystem.requests", "INFO"
+        ) as logs, CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        match = SERVER_TIMING.match(response["Server-Timing"])
+        self.assertIsNotNone(match)
+        self.assertEqual(int(match.group(1)), len(queries))
+
+        [record] = logs.records
+        self.assertEqual(record.levelname, "INFO")
+        self.assertEqual(record.request_metrics["queries"], len(queries))
+        self.assertEqual(record.request_metrics["status"], 200)
+        self.assertFalse(record.request_metrics["over_budget"])
+        self.assertIn(f"path={url} status=200", record.getMessage())
+
+    @override_settings(REQUEST_QUERY_BUDGET=1)
+    def test_request_over_query_budget_is_flagged(self):
+        """Test that a request over the query budget is logged as a warning."""
+        url = reverse("book_get_by_id", kwargs={"book_id": self.book.id})
+        with self.assertLogs("librarymanagementsystem.requests", "INFO") as logs:
+            self.client.get(url)
+
+        [record] = logs.records
+        self.assertEqual(record.levelname, "WARNING")
+        self.assertTrue(record.request_metrics["over_budget"])
+        self.assertIn("over_budget=true", record.getMessage())
+
+    def test_repeated_queries_are_counted_as_duplicates(self):
+        """Test that the same SQL run in a loop shows up as duplicate queries."""
+
+        def view(_request):
+            for _ in range(3):
+                list(Book.objects.filter(pk=self.book.pk))
+            return HttpResponse()
+
+        middleware = QueryInstrumentationMiddleware(view)
+        with self.assertLogs("librarymanagementsystem.requests", "INFO") as logs:
+            middleware(RequestFactory().get("/"))
+
+        [record] = logs.records
+        self.assertEqual(record.request_metrics["queries"], 3)
+        self.assertEqual(record.request_metrics["duplicate_queries"], 2)
@@ -0,0 +1,133 @@
+import tempfile
+from io import StringIO
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.core.signing import TimestampSigner
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from librarymanagementsystem.profiling import make_profile_token, profile_store
+
+
+@pytest.mark.django_db
+class TestRequestProfilingIntegration(TestCase):
+    """Integration tests for on-demand request profiling."""
+
+    def setUp(self):
+        """Set up test data for each test."""
+        self.client = APIClient()
+        self.url = reverse("book_create_and_get")
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings_override = override_settings(
+            PROFILING_ENABLED=True,
+            PROFILING_SECRET="test-profiling-secret",
+            PROFILING_DIR=directory.name,
+            PROFILING_MAX_PROFILES=2,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def _call(self, *args):
+        stdout = StringIO()
+        call_command("request_profiles", *args, stdout=stdout)
+        return stdout.getvalue()
+
+    def test_requests_are_not_profiled_by_default(self):
+        """Test that plain, badly signed and non-staff requests are not profiled."""
+        user = User.objects.create_user("reader", password="secret")
+        forged = TimestampSigner(salt="another-salt").sign("profile")
+        # SECRET_KEY is public in settings.py, so it must not sign valid tokens
+        signed_with_secret_key = TimestampSigner(
+            salt="librarymanagementsystem.profiling"
+        ).sign("profile")
+
+        responses = [
+            self.client.get(self.url),
+            self.client.get(self.url, HTTP_X_PROFILE_TOKEN=forged),
+            self.client.get(self.url, HTTP_X_PROFILE_TOKEN=signed_with_secret_key),
+        ]
+        self.client.force_login(user)
+        responses.append(self.client.get(self.url, {"profile": "1"}))
+
+        for response in responses:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn("X-Profile-Id", response)
+        self.assertEqual(profile_store.list_profiles(), [])
+
+    def test_signed_header_profiles_request(self):
+        """Test that a valid token header stores a profile that can be dumped."""
+        token = self._call("token").strip()
+
+        response = self.client.get(self.url, HTTP_X_PROFILE_TOKEN=token)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        profile_id = response["X-Profile-Id"]
+        [profile] = profile_store.list_profiles()
+        self.assertEqual(profile["id"], profile_id)
+        self.assertEqual(profile["path"], self.url)
+        self.assertEqual(profile["trigger"], "token")
+        self.assertIn(profile_id, self._call("list"))
+
+        report = self._call("dump", profile_id, "--limit", "10")
+        self.assertIn("function calls", report)
+        self.assertIn("book_view.py", report)
+
+    @override_settings(PROFILING_ENABLED=False)
+    def test_disabled_profiling_ignores_triggers(self):
+        """Test that neither trigger profiles while profiling is turned off."""
+        staff = User.objects.create_user("admin", password="secret", is_staff=True)
+        self.client.force_login(staff)
+
+        response = self.client.get(
+            self.url, {"profile": "1"}, HTTP_X_PROFILE_TOKEN=make_profile_token()
+        )
+
+        self.assertNotIn("X-Profile-Id", response)
+        self.assertEqual(profile_store.list_profiles(), [])
+
+    @override_settings(PROFILING_SECRET="")
+    def test_profiling_without_secret_is_refused(self):
+        """Test that profiling cannot be turned on or tokens minted without a secret."""
+        with self.assertRaises(ImproperlyConfigured):
+            self.client.get(self.url)
+        with self.assertRaises(CommandError):
+            self._call("token")
+
+    @override_settings(PROFILING_TOKEN_MAX_AGE=-1)
+    def test_expired_token_is_ignored(self):
+        """Test that a token older than the allowed age does not profile."""
+        response = self.client.get(self.url, HTTP_X_PROFILE_TOKEN=make_profile_token())
+
+        self.assertNotIn("X-Profile-Id", response)
+
+    def test_staff_query_parameter_profiles_request(self):
+        """Test that staff users can profile a request with ?profile."""
+        staff = User.objects.create_user("admin", password="secret", is_staff=True)
+        self.client.force_login(staff)
+
+        response = self.client.get(self.url, {"profile": "1"})
+
+        self.assertIn("X-Profile-Id", response)
+        self.assertEqual(profile_store.list_profiles()[0]["trigger"], "staff")
+
+    def test_ring_buffer_keeps_newest_profiles(self):
+        """Test that only the newest PROFILING_MAX_PROFILES profiles are kept."""
+        token = make_profile_token()
+        profile_ids = [
+            self.client.get(self.url, HTTP_X_PROFILE_TOKEN=token)["X-Profile-Id"]
+            for _ in range(3)
+        ]
+
+        stored = [profile["id"] for profile in profile_store.list_profiles()]
+        self.assertEqual(stored, profile_ids[:0:-1])
+        with self.assertRaises(CommandError):
+            self._call("dump", profile_ids[0])
+        with self.assertRaises(CommandError):
+            self._call("dump", "../../etc/passwd")
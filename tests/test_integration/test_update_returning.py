@@ -0,0 +1,142 @@
+import uuid
+from datetime import date, datetime
+
+import django
+import pytest
+from django.db import connection, connections
+from django.db.models import F
+from django.db.models.sql import UpdateQuery
+from django.test import TestCase
+from django.utils import timezone
+
+from book.models.author import Author
+from book.models.book import Book
+from book.models.publisher import Publisher
+from librarymanagementsystem.db import (
+    AddDays,
+    _compile_update,
+    _select_converters,
+    _write_connection,
+    update_returning,
+)
+from member.models.borrowing_history import BorrowingHistory
+from member.models.member import Member
+
+
+@pytest.mark.django_db
+class TestUpdateReturningIntegration(TestCase):
+    """Integration tests for UPDATE ... RETURNING and the ORM internals it uses."""
+
+    def setUp(self):
+        """Set up test data for each test."""
+        author = Author.objects.create(name="Test Author", birth_date=date(1980, 1, 1))
+        publisher = Publisher.objects.create(
+            name="Test Publisher", website="https://testpublisher.com"
+        )
+        book = Book.objects.create(
+            title="Test Book",
+            description="A test book description for update testing",
+            published_date=date(2020, 1, 1),
+            isbn="9780000000000",
+            author=author,
+            publisher=publisher,
+        )
+        member = Member.objects.create(
+            id=uuid.uuid4(),
+            first_name="Update",
+            last_name="Tester",
+            birth_date=date(1990, 1, 1),
+        )
+        self.borrowings = [
+            BorrowingHistory.objects.create(
+                id=uuid.uuid4(),
+                book=book,
+                member=member,
+                borrowing_date=date(2024, 1, day),
+                due_date=date(2024, 1, day + 14),
+                returning_date=returning_date,
+            )
+            # At most one active borrowing per member and book
+            for day, returning_date in ((1, None), (2, date(2024, 1, 5)))
+        ]
+
+    def test_returns_updated_rows_with_python_types(self):
+        """Test that only matched rows come back, converted like a SELECT."""
+        target = self.borrowings[0]
+
+        rows = update_returning(
+            BorrowingHistory.objects.filter(id=target.id),
+            returning_date=date(2024, 1, 10),
+            due_date=AddDays(F("due_date"), 7),
+            updated_at=timezone.now(),
+        )
+
+        self.assertEqual(len(rows), 1)
+        [row] = rows
+        self.assertEqual(row["id"], target.id)
+        self.assertIsInstance(row["id"], uuid.UUID)
+        self.assertEqual(row["book_id"], target.book_id)
+        self.assertEqual(row["returning_date"], date(2024, 1, 10))
+        self.assertEqual(row["due_date"], date(2024, 1, 22))
+        self.assertIsInstance(row["updated_at"], datetime)
+        target.refresh_from_db()
+        self.assertEqual(target.due_date, date(2024, 1, 22))
+        self.borrowings[1].refresh_from_db()
+        self.assertEqual(self.borrowings[1].returning_date, date(2024, 1, 5))
+
+    def test_unmatched_update_returns_nothing(self):
+        """Test that an update matching no rows returns an empty list."""
+        rows = update_returning(
+            BorrowingHistory.objects.filter(id=uuid.uuid4()),
+            returning_date=date(2024, 1, 10),
+        )
+
+        self.assertEqual(rows, [])
+
+    def test_django_internals_are_unchanged(self):
+        """
+        Test the private Django APIs update_returning is built on.
+
+        Fails on a Django upgrade until these helpers are checked again,
+        instead of breaking returns and renewals at runtime.
+        """
+        self.assertEqual(
+            django.VERSION[:2],
+            (3, 2),
+            "librarymanagementsystem.db.update_returning relies on Django 3.2 "
+            "internals; re-check its helpers and update this test",
+        )
+        queryset = BorrowingHistory.objects.filter(id=self.borrowings[0].id)
+
+        self.assertIsNone(queryset._db)
+        self.assertIs(_write_connection(queryset), connections["default"])
+        self.assertIs(
+            _write_connection(queryset.using("default")), connections["default"]
+        )
+
+        sql, params = _compile_update(
+            queryset, {"returning_date": date(2024, 1, 10)}, connection
+        )
+        self.assertTrue(sql.startswith("UPDATE "))
+        self.assertIn("WHERE", sql)
+        self.assertEqual(len(params), 2)
+        self.assertIsInstance(queryset.query.chain(UpdateQuery), UpdateQuery)
+        # Compiling does not run the update
+        self.borrowings[0].refresh_from_db()
+        self.assertIsNone(self.borrowings[0].returning_date)
+
+        # Values as the database returns them convert like a SELECT's
+        field = BorrowingHistory._meta.get_field("id")
+        col, converters = _select_converters(BorrowingHistory, field, connection)
+        self.assertEqual(col.target, field)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT {connection.ops.quote_name(field.column)} FROM "
+                f"{connection.ops.quote_name(BorrowingHistory._meta.db_table)}"
+            )
+            values = [value for (value,) in cursor.fetchall()]
+        for converter in converters:
+            values = [converter(value, col, connection) for value in values]
+        self.assertEqual(
+            sorted(values), sorted(borrowing.id for borrowing in self.borrowings)
+        )
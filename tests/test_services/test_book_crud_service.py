@@ -144,7 +144,7 @@ class TestBookCrudService:
         assert result == expected_books
         mock_dependencies[
             "get_book_use_case"
-        ].get_books_by_author.assert_called_once_with(author_id)
+        ].get_books_by_author.assert_called_once_with(author_id, None, None, None)
 
     def test_get_books_by_author_invalid_id(self, book_service, mock_dependencies):
         """Test getting books by author with invalid ID"""
@@ -181,7 +181,7 @@ class TestBookCrudService:
         assert result == expected_books
         mock_dependencies[
             "get_book_use_case"
-        ].get_books_by_publisher.assert_called_once_with(publisher_id)
+        ].get_books_by_publisher.assert_called_once_with(publisher_id, None, None, None)
 
     def test_get_books_by_publisher_invalid_id(self, book_service, mock_dependencies):
         """Test getting books by publisher with invalid ID"""
@@ -258,7 +258,7 @@ class TestBookCrudService:
         assert result == expected_books
         mock_dependencies[
             "get_book_use_case"
-        ].get_books_by_genre.assert_called_once_with(genre_id)
+        ].get_books_by_genre.assert_called_once_with(genre_id, None, None, None)
 
     def test_get_books_by_genre_invalid_id(self, book_service, mock_dependencies):
         """Test getting books by genre with invalid ID"""
@@ -279,3 +279,76 @@ class TestBookCrudService:
 
         with pytest.raises(ValidationError, match="Genre not found"):
             book_service.get_books_by_genre(genre_id)
+
+    def test_get_books_page_success(self, book_service, mock_dependencies):
+        """Test getting a page of books"""
+        expected_page = Mock()
+        mock_dependencies[
+            "get_book_use_case"
+        ].get_books_page.return_value = expected_page
+
+        result = book_service.get_books_page(cursor="abc", page_size=10)
+
+        assert result == expected_page
+        mock_dependencies["get_book_use_case"].get_books_page.assert_called_once_with(
+            "abc", 10
+        )
+
+    def test_get_books_page_invalid_cursor(self, book_service, mock_dependencies):
+        """Test getting a page of books with an invalid cursor"""
+        mock_dependencies["get_book_use_case"].get_books_page.side_effect = ValueError(
+            "Invalid cursor"
+        )
+
+        with pytest.raises(ValidationError, match="Invalid cursor"):
+            book_service.get_books_page(cursor="bad")
+
+    def test_export_books_success(self, book_service, mock_dependencies):
+        """Test streaming books in chunks for export"""
+        chunks = iter([[Mock()], [Mock()]])
+        mock_dependencies["get_book_use_case"].iter_book_chunks.return_value = chunks
+
+        result = book_service.export_books(chunk_size=500)
+
+        assert result is chunks
+        mock_dependencies["get_book_use_case"].iter_book_chunks.assert_called_once_with(
+            500
+        )
+
+    def test_export_books_invalid_chunk_size(self, book_service, mock_dependencies):
+        """Test streaming books with an invalid chunk size"""
+        mock_dependencies[
+            "get_book_use_case"
+        ].iter_book_chunks.side_effect = ValueError(
+            "chunk_size must be a positive integer"
+        )
+
+        with pytest.raises(ValidationError, match="chunk_size must be a positive"):
+            book_service.export_books(chunk_size=0)
+
+    def test_create_books_bulk_success(
+        self, book_service, mock_dependencies, valid_book_data
+    ):
+        """Test bulk book creation"""
+        created = [Mock(spec=BookEntity)]
+        errors = [{"index": 1, "error": "Author not found"}]
+        mock_dependencies["create_book_use_case"].execute_bulk.return_value = (
+            created,
+            errors,
+        )
+
+        result = book_service.create_books_bulk([valid_book_data, valid_book_data])
+
+        assert result == (created, errors)
+        mock_dependencies["create_book_use_case"].execute_bulk.assert_called_once_with(
+            [valid_book_data, valid_book_data]
+        )
+
+    def test_create_books_bulk_too_many(self, book_service, mock_dependencies):
+        """Test bulk book creation with an oversized batch"""
+        mock_dependencies["create_book_use_case"].execute_bulk.side_effect = ValueError(
+            "Cannot create more than 5000 books"
+        )
+
+        with pytest.raises(ValidationError, match="Cannot create more than"):
+            book_service.create_books_bulk([])